@@ -0,0 +1,116 @@
+"""Benchmark the power budget allocator's solve time against fleet size.
+
+The site controller re-solves the allocation every time the budget entity
+changes, with profiles built from the latest poll, so the miners'
+efficiencies have usually drifted a little while their limits stayed the
+same. Half of the simulated miners have a learned, concave efficiency curve
+and the others a flat efficiency. Reported per fleet size, for one solve:
+
+- fresh: a new allocator, as the set_fleet_power_target service uses, and as
+  the controller's allocator did whenever any profile changed
+- budget: the budget moved by 5%, the profiles are the same
+- drift: every efficiency moved by up to 2%, the budget is the same
+- drift hashrate: total hashrate of the drift solve relative to a fresh solve
+  of the same profiles, 1.0000 when re-solving loses nothing
+
+    python benchmarks/bench_allocator.py --miners 10 100 1000
+"""
+
+import argparse
+import random
+
+from bench_lookup import best_of
+
+from custom_components.braiins_os_plus.allocator import (
+    MinerPowerProfile,
+    PowerBudgetAllocator,
+)
+
+
+def _profiles(miners: int, drift: float, seed: int) -> list[MinerPowerProfile]:
+    """Return the fleet's profiles, each efficiency scaled by up to ``drift``."""
+    fleet, noise = random.Random(0), random.Random(seed)
+    profiles = []
+    for index in range(miners):
+        efficiency = fleet.uniform(15, 30)
+        scale = 1 + noise.uniform(-drift, drift)
+        curve = ()
+        if index % 2:
+            # Hashrate grows slower than power, and matches the efficiency at 3 kW
+            curve = tuple(
+                (watt, scale * 3000 / efficiency * (watt / 3000) ** 0.8)
+                for watt in range(1000, 4001, 500)
+            )
+        profiles.append(
+            MinerPowerProfile(
+                miner_id=f"miner{index:04d}",
+                min_w=1000,
+                max_w=4000,
+                efficiency_jth=round(efficiency / scale, 1),
+                curve=curve,
+            )
+        )
+    return profiles
+
+
+def _hashrate(targets: dict[str, int], profiles: list[MinerPowerProfile]) -> float:
+    return sum(profile.hashrate_at(targets[profile.miner_id]) for profile in profiles)
+
+
+def _bench(miners: int, args: argparse.Namespace) -> dict[str, float]:
+    budget = 2500 * miners
+    profiles = _profiles(miners, 0, 0)
+    drifted = [_profiles(miners, 0.02, seed) for seed in (1, 2)]
+
+    allocator = PowerBudgetAllocator()
+    allocator.solve(budget, profiles)
+    budgets = iter([budget * 1.05, budget] * args.rounds * args.repeat)
+    budget_us = best_of(
+        lambda: allocator.solve(next(budgets), profiles), args.rounds, args.repeat
+    )
+
+    rounds = iter(drifted * args.rounds * args.repeat)
+    drift_us = best_of(
+        lambda: allocator.solve(budget, next(rounds)), args.rounds, args.repeat
+    )
+    # Solve for the other drifted profiles, then compare with starting over
+    incremental = allocator.solve(budget, drifted[1])
+    fresh = PowerBudgetAllocator().solve(budget, drifted[1])
+
+    return {
+        "fresh": best_of(
+            lambda: PowerBudgetAllocator().solve(budget, profiles),
+            args.rounds,
+            args.repeat,
+        ),
+        "budget": budget_us,
+        "drift": drift_us,
+        "quality": _hashrate(incremental, drifted[1]) / _hashrate(fresh, drifted[1]),
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--miners", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> None:
+    print(
+        f"{'miners':>6} {'fresh ms':>8} {'budget ms':>9} {'drift ms':>8} "
+        f"{'drift hashrate':>14}"
+    )
+    for miners in args.miners:
+        result = _bench(miners, args)
+        print(
+            f"{miners:>6} {result['fresh'] / 1000:>8.2f} "
+            f"{result['budget'] / 1000:>9.2f} {result['drift'] / 1000:>8.2f} "
+            f"{result['quality']:>14.4f}",
+            flush=True,
+        )
+
+
+if __name__ == "__main__":
+    main(_parse_args())
@@ -0,0 +1,114 @@
+"""Benchmark TCP handshakes per poll with and without the per-miner session.
+
+Every miner is polled through BraiinsAPI for a few ticks at the given poll
+interval, once over a default aiohttp session, which keeps connections alive
+like the shared one Home Assistant hands out and the integration used to
+poll with, and once over the session from create_miner_session().
+The fake miners count the connections they accept, so the handshakes are
+measured on the server side. Reported per session and interval:
+
+- handshakes/poll: TCP connections accepted per coordinator refresh
+- requests/poll: HTTP requests per coordinator refresh
+
+    python benchmarks/bench_connections.py --miners 20 --intervals 5 30 --ticks 4
+"""
+
+import argparse
+import asyncio
+import logging
+
+import aiohttp
+from harness import add_miner_entries, async_bench_hass, async_fake_miners
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from custom_components.braiins_os_plus.api import BraiinsAPI
+from custom_components.braiins_os_plus.transport import (
+    RestTransport,
+    create_miner_session,
+)
+
+
+async def _async_stats(port: int) -> dict[str, int]:
+    """Read the fake miners' counters from their control port."""
+    async with (
+        aiohttp.ClientSession() as session,
+        session.get(f"http://127.0.0.1:{port - 1}/_fake/stats") as response,
+    ):
+        return await response.json()
+
+
+async def _async_bench(
+    hass: HomeAssistant,
+    entries: list[ConfigEntry],
+    default: bool,
+    args: argparse.Namespace,
+) -> dict[str, float]:
+    """Poll every miner ``args.ticks`` times, ``interval`` seconds apart."""
+    apis = [
+        BraiinsAPI(
+            hass,
+            entry,
+            RestTransport(
+                entry.data["miner_ip"],
+                aiohttp.ClientSession() if default else create_miner_session(),
+            ),
+        )
+        for entry in entries
+    ]
+    results = {}
+    try:
+        # Log in and open the connections before counting
+        await asyncio.gather(*(api.async_update_data() for api in apis))
+        for interval in args.intervals:
+            await asyncio.sleep(interval)
+            before = await _async_stats(args.port)
+            for _ in range(args.ticks):
+                await asyncio.gather(*(api.async_update_data() for api in apis))
+                await asyncio.sleep(interval)
+            after = await _async_stats(args.port)
+            polls = len(apis) * args.ticks
+            results[interval] = {
+                key: (after[key] - before[key]) / polls
+                for key in ("connections", "requests")
+            }
+    finally:
+        await asyncio.gather(*(api.async_close() for api in apis))
+    return results
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--miners", type=int, default=20)
+    parser.add_argument(
+        "--intervals", type=float, nargs="+", default=[5, 30], help="seconds"
+    )
+    parser.add_argument("--ticks", type=int, default=4)
+    parser.add_argument("--port", type=int, default=18000)
+    return parser.parse_args()
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    async with (
+        async_fake_miners(args.miners, args.port, "--static") as hosts,
+        async_bench_hass() as hass,
+    ):
+        entries = add_miner_entries(hass, hosts)
+        print(
+            f"{'session':>12} {'interval s':>10} {'handshakes/poll':>15} "
+            f"{'requests/poll':>13}"
+        )
+        for name, default in (("default", True), ("per-miner", False)):
+            results = await _async_bench(hass, entries, default, args)
+            for interval, result in results.items():
+                print(
+                    f"{name:>12} {interval:>10.0f} {result['connections']:>15.2f} "
+                    f"{result['requests']:>13.2f}",
+                    flush=True,
+                )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(_async_main(_parse_args()))
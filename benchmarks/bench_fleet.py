@@ -0,0 +1,97 @@
+"""Benchmark the fleet poller's scheduling against fake Braiins OS+ miners.
+
+For each fleet size the miners are set up as config entries, so their polls
+are started by BraiinsFleetPoller exactly as in production. Reported per fleet
+size, after a warm-up interval:
+
+- polls/s: coordinator refreshes started per second
+- jitter p50 / p99 / max: how late a poll started after it was due
+- lag p50 / p99 / max: how late a 100 ms timer ran on the event loop meanwhile
+- CPU %: process CPU time over wall time
+
+    python benchmarks/bench_fleet.py --miners 10 100 500 --duration 60
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from harness import (
+    LoopLagProbe,
+    async_bench_hass,
+    async_fake_miners,
+    async_setup_miners,
+    percentile,
+)
+
+from custom_components.braiins_os_plus.const import DATA_FLEET, POLL_INTERVAL
+
+
+async def _async_bench(miners: int, args: argparse.Namespace) -> dict[str, float]:
+    """Let the fleet poller run ``miners`` miners for ``args.duration`` seconds."""
+    options = [f"--latency={args.latency}", f"--jitter={args.jitter}"]
+    async with (
+        async_fake_miners(miners, args.port, *options) as hosts,
+        async_bench_hass() as hass,
+    ):
+        await async_setup_miners(hass, hosts)
+        # Let every miner get through its first staggered poll
+        await asyncio.sleep(POLL_INTERVAL)
+
+        fleet = hass.data[DATA_FLEET]
+        jitter: list[float] = []
+        dispatch = fleet._async_dispatch
+
+        def _timed_dispatch(entry_id: str) -> None:
+            if (member := fleet._members.get(entry_id)) is not None:
+                jitter.append(hass.loop.time() - member.next_due)
+            dispatch(entry_id)
+
+        # Timers armed from now on call the wrapper
+        fleet._async_dispatch = _timed_dispatch
+        probe = LoopLagProbe()
+        probe.start()
+        cpu_start = time.process_time()
+        await asyncio.sleep(args.duration)
+        cpu = time.process_time() - cpu_start
+        await probe.stop()
+
+    return {
+        "miners": miners,
+        "polls_per_s": len(jitter) / args.duration,
+        "jitter": [percentile(jitter, f) * 1000 for f in (0.5, 0.99, 1)],
+        "lag": [percentile(probe.lags, f) * 1000 for f in (0.5, 0.99, 1)],
+        "cpu_percent": cpu / args.duration * 100,
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--miners", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--duration", type=float, default=60, help="seconds")
+    parser.add_argument("--port", type=int, default=18000)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.02, help="seconds")
+    return parser.parse_args()
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    print(
+        f"{'miners':>6} {'polls/s':>8} {'jitter p50/p99/max ms':>22} "
+        f"{'lag p50/p99/max ms':>19} {'CPU %':>6}"
+    )
+    for miners in args.miners:
+        result = await _async_bench(miners, args)
+        jitter = "/".join(f"{value:.1f}" for value in result["jitter"])
+        lag = "/".join(f"{value:.1f}" for value in result["lag"])
+        print(
+            f"{result['miners']:>6} {result['polls_per_s']:>8.1f} {jitter:>22} "
+            f"{lag:>19} {result['cpu_percent']:>6.1f}",
+            flush=True,
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(_async_main(_parse_args()))
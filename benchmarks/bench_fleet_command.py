@@ -0,0 +1,105 @@
+"""Benchmark a fleet-wide curtailment through the set_fleet_power_target service.
+
+N fake miners are set up as config entries and the service is called as an
+automation would call it, with ``return_response``. Each round sets either the
+same power target on every miner, or a site power budget that the allocator
+splits between them, alternating between two values so that every call
+changes every miner. The commands go out with at most ``--concurrency`` in
+flight, as set by BULK_COMMAND_CONCURRENCY. Reported per mode:
+
+- call ms: the service call end to end, as the caller waits for it
+- p50 / max ms: the latency of one miner's command, from the response
+- failed: miners the response reports as failed, over every round
+
+    python benchmarks/bench_fleet_command.py --miners 100 --concurrency 1 16 64
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from typing import Any
+
+from harness import async_bench_hass, async_fake_miners, async_setup_miners, percentile
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.braiins_os_plus import services
+from custom_components.braiins_os_plus.const import DOMAIN
+
+
+async def _async_call(
+    hass: HomeAssistant, service_data: dict[str, Any]
+) -> tuple[float, dict[str, Any]]:
+    """Call the service and return how long it took and its response."""
+    start = time.perf_counter()
+    response = await hass.services.async_call(
+        DOMAIN,
+        services.SERVICE_SET_FLEET_POWER_TARGET,
+        service_data,
+        blocking=True,
+        return_response=True,
+    )
+    return time.perf_counter() - start, response
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--miners", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--rounds", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.05, help="seconds")
+    parser.add_argument("--port", type=int, default=18000)
+    return parser.parse_args()
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    async with (
+        async_fake_miners(
+            args.miners,
+            args.port,
+            f"--latency={args.latency}",
+            f"--jitter={args.jitter}",
+        ) as hosts,
+        async_bench_hass() as hass,
+    ):
+        await async_setup_miners(hass, hosts)
+        modes = {
+            "target": [{services.ATTR_POWER_TARGET: watt} for watt in (2500, 3000)],
+            "budget": [
+                {services.ATTR_POWER_BUDGET: watt * args.miners}
+                for watt in (2500, 3000)
+            ],
+        }
+
+        print(f"{args.miners} miners")
+        print(
+            f"{'mode':>6} {'concurrency':>11} {'call ms':>7} {'p50 ms':>6} "
+            f"{'max ms':>6} {'failed':>6}"
+        )
+        for concurrency in args.concurrency:
+            services.BULK_COMMAND_CONCURRENCY = concurrency
+            for mode, calls in modes.items():
+                durations, latencies, failed = [], [], 0
+                for index in range(args.rounds):
+                    elapsed, response = await _async_call(
+                        hass, calls[index % len(calls)]
+                    )
+                    durations.append(elapsed)
+                    latencies.extend(
+                        report["latency_ms"] for report in response["miners"].values()
+                    )
+                    failed += response["failed"]
+                print(
+                    f"{mode:>6} {concurrency:>11} "
+                    f"{percentile(durations, 0.5) * 1000:>7.0f} "
+                    f"{percentile(latencies, 0.5):>6.0f} {max(latencies):>6} "
+                    f"{failed:>6}",
+                    flush=True,
+                )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(_async_main(_parse_args()))
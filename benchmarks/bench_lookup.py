@@ -0,0 +1,201 @@
+"""Benchmark the hashboard and fan sensor lookups on an S21-class payload.
+
+Before the lookups were indexed, every hashboard sensor scanned the
+``hashboards`` list on each ``available`` and ``native_value`` read, and every
+fan sensor scanned ``cooling.fans``, so an update cost O(entities x boards).
+Those scans are reproduced here next to the current sensors, which read from
+the snapshot parsed once per update. Reported per board count, for one
+coordinator update that reads every hashboard and fan sensor:
+
+- scan: reads with the list scans
+- indexed: reads from the snapshot
+- indexed+parse: the same, plus parsing the snapshot for the update
+
+    python benchmarks/bench_lookup.py --boards 3 12 48 --fans 4
+"""
+
+import argparse
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from harness import fake_miner_data
+
+from custom_components.braiins_os_plus import sensor
+from custom_components.braiins_os_plus.const import HASHRATE_WINDOWS
+from custom_components.braiins_os_plus.models import MinerSnapshot
+
+
+def _scan_board(data: dict[str, Any], board_id: str) -> dict[str, Any] | None:
+    """Find a hashboard the way HashboardSensor.board_data used to."""
+    if data and (hashboards := data.get("hashboards")):
+        for board in hashboards:
+            if board.get("id") == board_id:
+                return board
+    return None
+
+
+def _scan_fan(data: dict[str, Any], fan_id: int) -> dict[str, Any] | None:
+    """Find a fan the way the fan sensors used to."""
+    for fan in data.get("cooling", {}).get("fans", []):
+        if fan.get("position") == fan_id:
+            return fan
+    return None
+
+
+def _scan_hashrate(data: dict[str, Any], board_id: str, key: str) -> float | None:
+    if _scan_board(data, board_id) and (
+        stats := _scan_board(data, board_id).get("stats")
+    ):
+        if real_hash := stats.get("real_hashrate"):
+            if window := real_hash.get(key):
+                if (ghs := window.get("gigahash_per_second")) is not None:
+                    return round(ghs / 1000, 2)
+    return None
+
+
+def _scan_chip_temp(data: dict[str, Any], board_id: str) -> float | None:
+    if _scan_board(data, board_id) and (
+        chip_temp := _scan_board(data, board_id).get("highest_chip_temp")
+    ):
+        if temp := chip_temp.get("temperature"):
+            return temp.get("degree_c")
+    return None
+
+
+def _scan_board_temp(data: dict[str, Any], board_id: str) -> float | None:
+    if _scan_board(data, board_id) and (
+        board_temp := _scan_board(data, board_id).get("board_temp")
+    ):
+        return board_temp.get("degree_c")
+    return None
+
+
+def _scan_rpm(data: dict[str, Any], fan_id: int) -> int | None:
+    fan = _scan_fan(data, fan_id)
+    return fan.get("rpm") if fan else None
+
+
+def _scan_percent(data: dict[str, Any], fan_id: int) -> float | None:
+    fan = _scan_fan(data, fan_id)
+    if fan and (ratio := fan.get("target_speed_ratio")) is not None:
+        return round(float(ratio) * 100, 1)
+    return None
+
+
+def scan_reads(data: dict[str, Any]) -> list:
+    """Return an ``(available, native_value)`` pair of calls per sensor."""
+    reads = []
+    for board in data["hashboards"]:
+        board_id = board["id"]
+        available = lambda b=board_id: _scan_board(data, b) is not None  # noqa: E731
+        reads.append((available, lambda b=board_id: _scan_chip_temp(data, b)))
+        reads.append((available, lambda b=board_id: _scan_board_temp(data, b)))
+        for key in ("last_5s", *HASHRATE_WINDOWS.values()):
+            reads.append(
+                (available, lambda b=board_id, k=key: _scan_hashrate(data, b, k))
+            )
+    for fan in data["cooling"]["fans"]:
+        fan_id = fan["position"]
+        reads.append((lambda: True, lambda f=fan_id: _scan_rpm(data, f)))
+        reads.append((lambda: True, lambda f=fan_id: _scan_percent(data, f)))
+    return reads
+
+
+def stand_in_coordinator(data: dict[str, Any]) -> SimpleNamespace:
+    """Return what the sensors read from their coordinator, holding ``data``."""
+    return SimpleNamespace(
+        data=data,
+        last_update_success=True,
+        config_entry=SimpleNamespace(entry_id="bench", options={}),
+    )
+
+
+def sensors_for(coordinator: SimpleNamespace) -> list[sensor.BraiinsSensor]:
+    """Create the hashboard and fan sensors the platform adds for the data."""
+    snapshot = coordinator.data["snapshot"]
+    sensors = []
+    for board_id in snapshot.hashboards:
+        sensors.extend(
+            [
+                sensor.HashboardChipTempSensor(coordinator, board_id),
+                sensor.HashboardBoardTempSensor(coordinator, board_id),
+                sensor.HashboardHashrateSensor(coordinator, board_id),
+            ]
+        )
+        sensors.extend(
+            sensor.HashboardHashrateWindowSensor(coordinator, board_id, window)
+            for window in HASHRATE_WINDOWS
+        )
+    for fan_pos in snapshot.fans:
+        sensors.append(sensor.MinerFanSensor(coordinator, fan_pos))
+        sensors.append(sensor.MinerFanPercentSensor(coordinator, fan_pos))
+    return sensors
+
+
+def best_of(run, rounds: int, repeat: int) -> float:
+    """Return the fastest time of one call over ``repeat`` runs, in µs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            run()
+        best = min(best, (time.perf_counter() - start) / rounds)
+    return best * 1e6
+
+
+def _bench(boards: int, args: argparse.Namespace) -> dict[str, float]:
+    data = fake_miner_data(boards=boards, fans=args.fans)[0]
+    data["snapshot"] = MinerSnapshot.from_data(data)
+    coordinator = stand_in_coordinator(data)
+    sensors = sensors_for(coordinator)
+    reads = scan_reads(data)
+    assert len(reads) == len(sensors)
+
+    def _scan() -> None:
+        for available, value in reads:
+            if available():
+                value()
+
+    def _indexed() -> None:
+        for entity in sensors:
+            if entity.available:
+                entity.native_value  # noqa: B018
+
+    def _indexed_parse() -> None:
+        data["snapshot"] = MinerSnapshot.from_data(data)
+        _indexed()
+
+    return {
+        "sensors": len(sensors),
+        "scan": best_of(_scan, args.rounds, args.repeat),
+        "indexed": best_of(_indexed, args.rounds, args.repeat),
+        "indexed+parse": best_of(_indexed_parse, args.rounds, args.repeat),
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--boards", type=int, nargs="+", default=[3, 12, 48])
+    parser.add_argument("--fans", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> None:
+    print(
+        f"{'boards':>6} {'sensors':>7} {'scan µs':>9} {'indexed µs':>10} "
+        f"{'indexed+parse µs':>16}"
+    )
+    for boards in args.boards:
+        result = _bench(boards, args)
+        print(
+            f"{boards:>6} {result['sensors']:>7} {result['scan']:>9.1f} "
+            f"{result['indexed']:>10.1f} {result['indexed+parse']:>16.1f}",
+            flush=True,
+        )
+
+
+if __name__ == "__main__":
+    main(_parse_args())
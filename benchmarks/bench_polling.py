@@ -0,0 +1,129 @@
+"""Benchmark the polling pipeline against fake Braiins OS+ miners.
+
+For each fleet size, fake miners are started in a separate process so their
+CPU time is not counted, and set up as config entries of a Home Assistant
+test instance, entities included. The fleet poller is stopped, then every
+miner's coordinator is refreshed once per tick, which runs
+BraiinsAPI.async_update_data and lets the sensors write their state as they do
+in production. Reported per fleet size:
+
+- requests/s: HTTP requests sent to the miners per second of wall time
+- p50 / p99: latency of one miner's coordinator refresh
+- CPU/tick: process CPU time spent per tick on polling and entity state
+
+    python benchmarks/bench_polling.py --miners 1 10 100 500 --ticks 20
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from harness import async_bench_hass, async_fake_miners, async_setup_miners, percentile
+
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from custom_components.braiins_os_plus.const import DATA_FLEET, DOMAIN
+
+
+async def _async_bench(miners: int, args: argparse.Namespace) -> dict[str, float]:
+    """Poll ``miners`` fake miners for ``args.ticks`` ticks and report."""
+    options = [
+        f"--latency={args.latency}",
+        f"--jitter={args.jitter}",
+        f"--error-rate-401={args.error_rate_401}",
+        f"--error-rate-500={args.error_rate_500}",
+        f"--token-ttl={args.token_ttl}",
+    ]
+    if args.static:
+        options.append("--static")
+    async with (
+        async_fake_miners(miners, args.port, *options) as hosts,
+        async_bench_hass() as hass,
+    ):
+        # Setting up logs in and fetches every endpoint once before measuring
+        entries = await async_setup_miners(hass, hosts)
+        hass.data[DATA_FLEET].async_shutdown()
+        domain_data = [hass.data[DOMAIN][entry.entry_id] for entry in entries]
+        coordinators: list[DataUpdateCoordinator] = [
+            data["coordinator"] for data in domain_data
+        ]
+        registry = er.async_get(hass)
+        entities = sum(
+            entity.domain == "sensor" and entity.disabled_by is None
+            for entry in entries
+            for entity in er.async_entries_for_config_entry(registry, entry.entry_id)
+        )
+        for data in domain_data:
+            data["api"].metrics.endpoints.clear()
+
+        latencies: list[float] = []
+
+        async def _async_poll(coordinator: DataUpdateCoordinator) -> None:
+            start = time.perf_counter()
+            await coordinator.async_refresh()
+            latencies.append(time.perf_counter() - start)
+
+        cpu = 0.0
+        wall_start = time.perf_counter()
+        for _ in range(args.ticks):
+            cpu_start = time.process_time()
+            await asyncio.gather(*(_async_poll(c) for c in coordinators))
+            cpu += time.process_time() - cpu_start
+            if args.interval:
+                await asyncio.sleep(args.interval)
+        wall = time.perf_counter() - wall_start - args.interval * args.ticks
+
+        requests = sum(
+            metrics.latency.count
+            for data in domain_data
+            for metrics in data["api"].metrics.endpoints.values()
+        )
+        return {
+            "miners": miners,
+            "entities": entities,
+            "requests_per_s": requests / wall,
+            "p50_ms": percentile(latencies, 0.5) * 1000,
+            "p99_ms": percentile(latencies, 0.99) * 1000,
+            "cpu_ms_per_tick": cpu / args.ticks * 1000,
+            "failed_updates": sum(not c.last_update_success for c in coordinators),
+        }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--miners", type=int, nargs="+", default=[1, 10, 100, 500])
+    parser.add_argument("--ticks", type=int, default=20)
+    parser.add_argument(
+        "--interval", type=float, default=0.0, help="seconds between ticks"
+    )
+    parser.add_argument("--port", type=int, default=18000)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate-401", type=float, default=0.0)
+    parser.add_argument("--error-rate-500", type=float, default=0.0)
+    parser.add_argument("--token-ttl", type=int, default=3600, help="seconds")
+    parser.add_argument("--static", action="store_true")
+    return parser.parse_args()
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    print(
+        f"{'miners':>6} {'entities':>8} {'req/s':>9} {'p50 ms':>8} "
+        f"{'p99 ms':>8} {'CPU/tick ms':>11} {'failed':>6}"
+    )
+    for miners in args.miners:
+        result = await _async_bench(miners, args)
+        print(
+            f"{result['miners']:>6} {result['entities']:>8} "
+            f"{result['requests_per_s']:>9.0f} {result['p50_ms']:>8.1f} "
+            f"{result['p99_ms']:>8.1f} {result['cpu_ms_per_tick']:>11.1f} "
+            f"{result['failed_updates']:>6}",
+            flush=True,
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(_async_main(_parse_args()))
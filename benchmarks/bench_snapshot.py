@@ -0,0 +1,195 @@
+"""Compare the parsed telemetry snapshot with reading the raw dicts, fleet-wide.
+
+Before the snapshot, every sensor walked ``.get(..., {})`` chains through the
+raw payloads on each state read. Now the payloads are parsed once per update
+into a slots MinerSnapshot that the sensors read fields from. For a simulated
+fleet, both ways of serving one update of every miner's sensors are compared:
+
+- update ms: parse (snapshot only) plus every sensor's read, for the fleet
+- parse ms: building every miner's snapshot
+- read peak KiB: memory allocated at most while the sensors are read
+- kept KiB: memory the snapshots hold on to between updates
+
+    python benchmarks/bench_snapshot.py --miners 200
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any
+
+from bench_lookup import best_of, scan_reads, sensors_for, stand_in_coordinator
+from harness import fake_miner_data
+
+from custom_components.braiins_os_plus import sensor
+from custom_components.braiins_os_plus.models import MinerSnapshot
+
+
+def _dict_consumption(data: dict[str, Any]) -> int:
+    stats = data.get("stats", {})
+    power_stats = stats.get("power_stats", {})
+    if consumption := power_stats.get("approximated_consumption"):
+        return consumption.get("watt", 0)
+    return 0
+
+
+def _dict_efficiency(data: dict[str, Any]) -> float:
+    stats = data.get("stats", {})
+    power_stats = stats.get("power_stats", {})
+    if efficiency := power_stats.get("efficiency"):
+        if (value := efficiency.get("joule_per_terahash")) is not None:
+            return round(float(value), 2)
+    return 0.0
+
+
+def _dict_total_hashrate(data: dict[str, Any]) -> float | None:
+    if data and (hashboards := data.get("hashboards")):
+        total_ghs = sum(
+            board.get("stats", {})
+            .get("real_hashrate", {})
+            .get("last_5s", {})
+            .get("gigahash_per_second", 0)
+            for board in hashboards
+        )
+        return round(total_ghs / 1000, 2)
+    return None
+
+
+def _dict_chip_temp(data: dict[str, Any]) -> float | None:
+    cooling = data.get("cooling", {})
+    return cooling.get("highest_temperature", {}).get("temperature", {}).get("degree_c")
+
+
+def _dict_board_temp(data: dict[str, Any]) -> float | None:
+    temps = [
+        float(value)
+        for board in data.get("hashboards") or []
+        if board
+        and (board_temp := board.get("board_temp"))
+        and (value := board_temp.get("degree_c")) is not None
+    ]
+    return max(temps) if temps else None
+
+
+def _dict_reads(data: dict[str, Any]) -> list:
+    """Return an ``(available, native_value)`` pair of calls per sensor."""
+    reads = [
+        (lambda: True, lambda read=read: read(data))
+        for read in (
+            _dict_consumption,
+            _dict_efficiency,
+            _dict_total_hashrate,
+            _dict_chip_temp,
+            _dict_board_temp,
+        )
+    ]
+    return reads + scan_reads(data)
+
+
+def _snapshot_sensors(coordinator) -> list[sensor.BraiinsSensor]:
+    return [
+        sensor.MinerConsumptionSensor(coordinator),
+        sensor.MinerEfficiencySensor(coordinator),
+        sensor.TotalHashrateSensor(coordinator),
+        sensor.HighestChipTempSensor(coordinator),
+        sensor.HighestBoardTempSensor(coordinator),
+        *sensors_for(coordinator),
+    ]
+
+
+def _allocated(run) -> tuple[int, int]:
+    """Return the memory ``run`` kept and allocated at most, in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = run()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return current, peak
+
+
+def _bench(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    fleet = fake_miner_data(args.miners, args.boards, args.fans)
+    for data in fleet:
+        data["snapshot"] = MinerSnapshot.from_data(data)
+    dict_reads = [read for data in fleet for read in _dict_reads(data)]
+    snapshot_sensors = [
+        entity
+        for data in fleet
+        for entity in _snapshot_sensors(stand_in_coordinator(data))
+    ]
+
+    def _read_dicts() -> None:
+        for available, value in dict_reads:
+            if available():
+                value()
+
+    def _parse() -> list[MinerSnapshot]:
+        snapshots = []
+        for data in fleet:
+            data["snapshot"] = MinerSnapshot.from_data(data)
+            snapshots.append(data["snapshot"])
+        return snapshots
+
+    def _read_snapshots() -> None:
+        for entity in snapshot_sensors:
+            if entity.available:
+                entity.native_value  # noqa: B018
+
+    def _update_snapshots() -> None:
+        _parse()
+        _read_snapshots()
+
+    rounds, repeat = args.rounds, args.repeat
+    parse_us = best_of(_parse, rounds, repeat)
+    # Only the new snapshots are kept, the payloads already existed
+    kept, _ = _allocated(lambda: [MinerSnapshot.from_data(data) for data in fleet])
+    _, dict_peak = _allocated(_read_dicts)
+    _, snapshot_peak = _allocated(_read_snapshots)
+    return {
+        "dicts": {
+            "sensors": len(dict_reads),
+            "update": best_of(_read_dicts, rounds, repeat),
+            "parse": 0.0,
+            "read_peak": dict_peak,
+            "kept": 0,
+        },
+        "snapshot": {
+            "sensors": len(snapshot_sensors),
+            "update": best_of(_update_snapshots, rounds, repeat),
+            "parse": parse_us,
+            "read_peak": snapshot_peak,
+            "kept": kept,
+        },
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--miners", type=int, default=200)
+    parser.add_argument("--boards", type=int, default=3)
+    parser.add_argument("--fans", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> None:
+    results = _bench(args)
+    print(f"{args.miners} miners, {args.boards} boards and {args.fans} fans each")
+    print(
+        f"{'model':>8} {'sensors':>7} {'update ms':>9} {'parse ms':>8} "
+        f"{'read peak KiB':>13} {'kept KiB':>8}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:>8} {result['sensors']:>7} {result['update'] / 1000:>9.2f} "
+            f"{result['parse'] / 1000:>8.2f} {result['read_peak'] / 1024:>13.1f} "
+            f"{result['kept'] / 1024:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(_parse_args())
@@ -0,0 +1,142 @@
+"""Benchmark how long Home Assistant takes to bring N fake miners' entities up.
+
+Every run sets the integration up as Home Assistant does at boot, with one
+config entry per fake miner, and waits until every enabled entity of every
+entry has a state other than unavailable. Each fleet size is started twice
+from the same config directory:
+
+- cold: first start, every entry waits for its miner's first poll
+- warm: restart, every entry is set up from the snapshot saved by the first
+  start and polls in the background
+
+Reported per start, in seconds since the setup began:
+
+- loaded: every config entry is loaded
+- added: every enabled entity has a state
+- available: the last entity to leave the unavailable state did so, watched
+  for ``--settle`` seconds after that
+
+plus the number of entities and of those still unavailable then, such as the
+hashrate target controls of miners in Power Target mode. ``--profile`` prints
+the functions with the most cumulative time until every entity was added to
+the cold start.
+
+    python benchmarks/bench_startup.py --miners 10 100 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import cProfile
+import logging
+import pstats
+import tempfile
+import time
+
+from harness import add_miner_entries, async_bench_hass, async_fake_miners
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import EVENT_STATE_CHANGED, STATE_UNAVAILABLE
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+
+from custom_components.braiins_os_plus.const import DOMAIN
+
+
+def _entities(hass: HomeAssistant) -> list[str] | None:
+    """Return the enabled entities of every entry, or None until all are loaded."""
+    registry = er.async_get(hass)
+    entity_ids = []
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.state is not ConfigEntryState.LOADED:
+            return None
+        entity_ids.extend(
+            entity.entity_id
+            for entity in er.async_entries_for_config_entry(registry, entry.entry_id)
+            if entity.disabled_by is None
+        )
+    return entity_ids
+
+
+async def _async_start(
+    hosts: list[str], config_dir: str, args: argparse.Namespace, profile: bool
+) -> dict[str, float]:
+    """Start Home Assistant with an entry per host and time it."""
+    async with async_bench_hass(config_dir) as hass:
+        add_miner_entries(hass, hosts)
+        came_up: dict[str, float] = {}
+
+        @callback
+        def _async_state_changed(event: Event[EventStateChangedData]) -> None:
+            state = event.data["new_state"]
+            if state is not None and state.state != STATE_UNAVAILABLE:
+                came_up.setdefault(event.data["entity_id"], time.perf_counter())
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, _async_state_changed)
+        profiler = cProfile.Profile() if profile else None
+        start = time.perf_counter()
+        if profiler is not None:
+            profiler.enable()
+        assert await async_setup_component(hass, DOMAIN, {})
+        loaded = time.perf_counter() - start
+        async with asyncio.timeout(args.timeout):
+            while (entity_ids := _entities(hass)) is None or any(
+                hass.states.get(entity_id) is None for entity_id in entity_ids
+            ):
+                await asyncio.sleep(0.005)
+        added = time.perf_counter() - start
+        if profiler is not None:
+            profiler.disable()
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+        # Give the entities that need a poll or two time to come up
+        await asyncio.sleep(args.settle)
+        up = [came_up[entity_id] for entity_id in entity_ids if entity_id in came_up]
+        return {
+            "loaded": loaded,
+            "added": added,
+            "available": max(up) - start,
+            "entities": len(entity_ids),
+            "unavailable": len(entity_ids) - len(up),
+        }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--miners", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.05, help="seconds")
+    parser.add_argument("--settle", type=float, default=12, help="seconds")
+    parser.add_argument("--timeout", type=float, default=120, help="seconds")
+    parser.add_argument("--port", type=int, default=18000)
+    parser.add_argument("--profile", action="store_true")
+    return parser.parse_args()
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    print(
+        f"{'miners':>6} {'start':>5} {'loaded s':>8} {'added s':>7} "
+        f"{'available s':>11} {'entities':>8} {'unavailable':>11}"
+    )
+    for miners in args.miners:
+        async with async_fake_miners(
+            miners,
+            args.port,
+            f"--latency={args.latency}",
+            f"--jitter={args.jitter}",
+        ) as hosts:
+            with tempfile.TemporaryDirectory() as config_dir:
+                for start in ("cold", "warm"):
+                    result = await _async_start(
+                        hosts, config_dir, args, args.profile and start == "cold"
+                    )
+                    print(
+                        f"{miners:>6} {start:>5} {result['loaded']:>8.2f} "
+                        f"{result['added']:>7.2f} {result['available']:>11.2f} "
+                        f"{result['entities']:>8} {result['unavailable']:>11}",
+                        flush=True,
+                    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(_async_main(_parse_args()))
@@ -0,0 +1,132 @@
+"""Measure the sensor state_changed event rate of N fake miners.
+
+Every sensor used to write its state on each coordinator update, so the
+recorder and the websocket clients received one event per sensor per poll.
+The throttle groups only write a state once the value or a numeric attribute
+moved past the group's deadband, or another attribute changed. The fake miners' readings carry noise,
+as real ones do. Each setting polls the fleet for ``--duration`` seconds after
+the first polls and counts, per miner and minute:
+
+- every update: the events writing on each coordinator update would give
+- events: the state_changed events the sensors actually fired
+- attribute only: those of them with the same state, for attribute changes
+
+Settings compared: ``unthrottled`` sets every deadband to 0, so only
+identical states are skipped; ``defaults`` uses the shipped deadbands.
+
+    python benchmarks/bench_state_writes.py --miners 20 --duration 60
+"""
+
+import argparse
+import asyncio
+import logging
+
+from harness import async_bench_hass, async_fake_miners, async_setup_miners
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, EventStateChangedData, callback
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.braiins_os_plus.const import DOMAIN, THROTTLE_GROUPS
+
+SETTINGS = {
+    "unthrottled": {
+        option: 0
+        for group in THROTTLE_GROUPS
+        for option in (f"{group}_deadband", f"{group}_min_interval")
+    },
+    "defaults": {},
+}
+
+
+async def _async_measure(
+    hosts: list[str], options: dict[str, float], args: argparse.Namespace
+) -> dict[str, float]:
+    """Poll the fleet with the options and count the sensors' state writes."""
+    async with async_bench_hass() as hass:
+        entries = await async_setup_miners(hass, hosts, options)
+        # Let every sensor write its first state
+        await asyncio.sleep(args.warmup)
+
+        registry = er.async_get(hass)
+        sensors = {
+            entry.entry_id: sum(
+                entity.domain == "sensor" and entity.disabled_by is None
+                for entity in er.async_entries_for_config_entry(
+                    registry, entry.entry_id
+                )
+            )
+            for entry in entries
+        }
+        counts = {"every update": 0, "events": 0, "attribute only": 0}
+
+        @callback
+        def _async_state_changed(event: Event[EventStateChangedData]) -> None:
+            if not event.data["entity_id"].startswith("sensor."):
+                return
+            counts["events"] += 1
+            old_state, new_state = event.data["old_state"], event.data["new_state"]
+            if old_state is not None and new_state is not None:
+                counts["attribute only"] += old_state.state == new_state.state
+
+        def _count_updates(entry_id: str):
+            @callback
+            def _async_updated() -> None:
+                counts["every update"] += sensors[entry_id]
+
+            return _async_updated
+
+        unsubscribes = [
+            hass.bus.async_listen(EVENT_STATE_CHANGED, _async_state_changed),
+            *(
+                hass.data[DOMAIN][entry.entry_id]["coordinator"].async_add_listener(
+                    _count_updates(entry.entry_id)
+                )
+                for entry in entries
+            ),
+        ]
+        await asyncio.sleep(args.duration)
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+
+    scale = 60 / args.duration / len(hosts)
+    return {name: count * scale for name, count in counts.items()}
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--miners", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=60, help="seconds")
+    parser.add_argument("--warmup", type=float, default=15, help="seconds")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.05, help="seconds")
+    parser.add_argument("--port", type=int, default=18000)
+    return parser.parse_args()
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    async with async_fake_miners(
+        args.miners,
+        args.port,
+        f"--latency={args.latency}",
+        f"--jitter={args.jitter}",
+    ) as hosts:
+        print(f"{args.miners} miners, per miner and minute")
+        print(
+            f"{'setting':>11} {'every update':>12} {'events':>6} "
+            f"{'attribute only':>14} {'reduction':>9}"
+        )
+        for setting, options in SETTINGS.items():
+            result = await _async_measure(hosts, options, args)
+            reduction = 1 - result["events"] / result["every update"]
+            print(
+                f"{setting:>11} {result['every update']:>12.0f} "
+                f"{result['events']:>6.0f} {result['attribute only']:>14.0f} "
+                f"{reduction:>9.0%}",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(_async_main(_parse_args()))
@@ -0,0 +1,110 @@
+"""Benchmark token renewal when every miner's token is revoked at once.
+
+N fake miners are set up as config entries. The fleet poller is stopped so
+that only the benchmark refreshes the coordinators. Each round revokes every
+token on the fake miners, then refreshes all coordinators at once. Every
+endpoint of a poll is rejected with 401 in parallel, and all of them have to
+wait for the same login. Reported over the rounds:
+
+- logins/expiry: logins each miner served per revocation, 1.00 when the
+  renewal is single-flight
+- max in flight: the most requests one miner served at once
+- failed: refreshes that failed instead of retrying with the new token
+- p50 / max: refresh time with the renewal, against rounds without revocation
+
+    python benchmarks/bench_token_renewal.py --miners 100 --rounds 5
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+import aiohttp
+from harness import async_bench_hass, async_fake_miners, async_setup_miners, percentile
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from custom_components.braiins_os_plus.const import DATA_FLEET, DOMAIN
+
+
+async def _async_control(port: int, method: str, path: str) -> dict[str, int]:
+    """Call the fake miners' control port."""
+    async with (
+        aiohttp.ClientSession() as session,
+        session.request(method, f"http://127.0.0.1:{port - 1}/_fake/{path}") as resp,
+    ):
+        return await resp.json()
+
+
+async def _async_refresh(coordinator: DataUpdateCoordinator) -> tuple[float, bool]:
+    """Refresh a coordinator and return how long it took and if it worked."""
+    start = time.perf_counter()
+    await coordinator.async_refresh()
+    return time.perf_counter() - start, coordinator.last_update_success
+
+
+async def _async_round(
+    hass: HomeAssistant, port: int, expire: bool
+) -> tuple[list[tuple[float, bool]], dict[str, int]]:
+    """Refresh every miner at once, after revoking the tokens if asked to."""
+    coordinators = [data["coordinator"] for data in hass.data[DOMAIN].values()]
+    before = await _async_control(port, "GET", "stats")
+    if expire:
+        await _async_control(port, "POST", "expire-tokens")
+    results = await asyncio.gather(*(_async_refresh(c) for c in coordinators))
+    after = await _async_control(port, "GET", "stats")
+    return results, {
+        "logins": after["logins"] - before["logins"],
+        "max_in_flight": after["max_in_flight"],
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--miners", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.05, help="seconds")
+    parser.add_argument("--port", type=int, default=18000)
+    return parser.parse_args()
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    async with (
+        async_fake_miners(
+            args.miners,
+            args.port,
+            f"--latency={args.latency}",
+            f"--jitter={args.jitter}",
+        ) as hosts,
+        async_bench_hass() as hass,
+    ):
+        await async_setup_miners(hass, hosts)
+        hass.data[DATA_FLEET].async_shutdown()
+
+        print(
+            f"{'tokens':>8} {'logins/expiry':>13} {'max in flight':>13} "
+            f"{'failed':>6} {'p50 ms':>7} {'max ms':>7}"
+        )
+        for expire in (False, True):
+            times, failed, logins, max_in_flight = [], 0, 0, 0
+            for _ in range(args.rounds):
+                results, stats = await _async_round(hass, args.port, expire)
+                times.extend(elapsed for elapsed, _ in results)
+                failed += sum(not success for _, success in results)
+                logins += stats["logins"]
+                max_in_flight = max(max_in_flight, stats["max_in_flight"])
+            print(
+                f"{'revoked' if expire else 'valid':>8} "
+                f"{logins / (args.miners * args.rounds):>13.2f} {max_in_flight:>13} "
+                f"{failed:>6} {percentile(times, 0.5) * 1000:>7.0f} "
+                f"{max(times) * 1000:>7.0f}",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(_async_main(_parse_args()))
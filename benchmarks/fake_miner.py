@@ -0,0 +1,428 @@
+"""Fake Braiins OS+ miners serving the REST API the integration uses.
+
+Every simulated miner listens on its own port of one aiohttp server, so the
+integration reaches each of them as a separate host. Run it on its own to
+point a development Home Assistant at it:
+
+    python benchmarks/fake_miner.py --miners 3 --port 18000
+
+then add a miner at ``127.0.0.1:18000`` with user ``root`` and any password.
+
+Benchmarks use the control port, the one just below the first miner's:
+
+- ``GET /_fake/stats`` returns the request, connection and login counters,
+  and the most requests one miner served at once since the previous read
+- ``POST /_fake/expire-tokens`` revokes every token handed out so far
+"""
+
+import argparse
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import random
+import secrets
+import time
+from typing import Any
+
+from aiohttp import web
+
+
+@dataclass(slots=True)
+class FakeMinerConfig:
+    """Behaviour shared by every simulated miner."""
+
+    # Added to every request, in seconds, plus up to ``jitter`` more
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Probability that a read is answered with 401 or 500
+    error_rate_401: float = 0.0
+    error_rate_500: float = 0.0
+    # Lifetime of the tokens handed out by auth/login, in seconds
+    token_ttl: int = 3600
+    # Keep the telemetry fixed so repeated polls return identical bodies
+    static: bool = False
+    boards: int = 3
+    fans: int = 4
+
+
+@dataclass(slots=True)
+class FakeMiner:
+    """State of one simulated miner."""
+
+    index: int
+    power_target: int = 3000
+    hashrate_target: float = 100.0
+    mode: str = "powertarget"
+    paused: bool = False
+    tokens: dict[str, float] = field(default_factory=dict)
+    requests: int = 0
+    logins: int = 0
+    # TCP connections accepted, so each one is a handshake the client paid for
+    connections: int = 0
+    # Requests being served right now, and the most at once since the last read
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+
+class FakeMinerServer:
+    """Serve any number of fake miners, one per port starting at ``port``."""
+
+    def __init__(
+        self, miners: int, port: int, config: FakeMinerConfig | None = None
+    ) -> None:
+        """Initialize the server."""
+        self.config = config or FakeMinerConfig()
+        self.port = port
+        self.miners = {port + index: FakeMiner(index) for index in range(miners)}
+        self._runner: web.AppRunner | None = None
+
+        app = web.Application()
+        app.router.add_get("/_fake/stats", self._stats_handler)
+        app.router.add_post("/_fake/expire-tokens", self._expire_tokens)
+        app.router.add_post("/api/v1/auth/login", self._login)
+        self._payloads = {
+            "miner/details": self._details,
+            "configuration/constraints": self._constraints,
+            "miner/hw/hashboards": self._hashboards,
+            "miner/stats": self._stats,
+            "performance/mode": self._mode,
+            "cooling/state": self._cooling,
+        }
+        for path, payload in self._payloads.items():
+            app.router.add_get(f"/api/v1/{path}", self._read(payload))
+        app.router.add_put("/api/v1/performance/mode", self._write(self._set_mode))
+        for kind, unit in (("power", "watt"), ("hashrate", "terahash_per_second")):
+            app.router.add_put(
+                f"/api/v1/performance/{kind}-target",
+                self._write(self._set_target(kind, unit, 0)),
+            )
+            app.router.add_patch(
+                f"/api/v1/performance/{kind}-target/increment",
+                self._write(self._set_target(kind, unit, 1)),
+            )
+            app.router.add_patch(
+                f"/api/v1/performance/{kind}-target/decrement",
+                self._write(self._set_target(kind, unit, -1)),
+            )
+        app.router.add_put("/api/v1/actions/pause", self._write(self._pause(True)))
+        app.router.add_put("/api/v1/actions/resume", self._write(self._pause(False)))
+        self._app = app
+
+    @property
+    def hosts(self) -> list[str]:
+        """Return the host of every miner, as used for the ``miner_ip``."""
+        return [f"127.0.0.1:{port}" for port in self.miners]
+
+    @property
+    def requests(self) -> int:
+        """Return how many requests the miners answered."""
+        return sum(miner.requests for miner in self.miners.values())
+
+    @property
+    def connections(self) -> int:
+        """Return how many TCP connections the miners accepted."""
+        return sum(miner.connections for miner in self.miners.values())
+
+    def payloads(self, port: int) -> dict[str, dict[str, Any]]:
+        """Return what the miner on ``port`` answers on every read endpoint."""
+        miner = self.miners[port]
+        return {path: payload(miner) for path, payload in self._payloads.items()}
+
+    async def async_start(self) -> None:
+        """Start listening on every miner's port and on the control port."""
+        self._runner = web.AppRunner(self._app, access_log=None)
+        await self._runner.setup()
+
+        server = self._runner.server
+        connection_made = server.connection_made
+
+        def _count_connection(handler, transport) -> None:
+            port = transport.get_extra_info("sockname")[1]
+            if (miner := self.miners.get(port)) is not None:
+                miner.connections += 1
+            connection_made(handler, transport)
+
+        server.connection_made = _count_connection
+        for port in (self.port - 1, *self.miners):
+            await web.TCPSite(self._runner, "127.0.0.1", port).start()
+
+    async def async_stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @contextmanager
+    def _serving(self, request: web.Request) -> Iterator[FakeMiner]:
+        """Count a request against the miner whose port received it."""
+        miner = self.miners[request.transport.get_extra_info("sockname")[1]]
+        miner.requests += 1
+        miner.in_flight += 1
+        miner.max_in_flight = max(miner.max_in_flight, miner.in_flight)
+        try:
+            yield miner
+        finally:
+            miner.in_flight -= 1
+
+    async def _delay(self) -> None:
+        """Wait for the configured latency."""
+        config = self.config
+        if config.latency or config.jitter:
+            await asyncio.sleep(config.latency + random.uniform(0, config.jitter))
+
+    async def _stats_handler(self, request: web.Request) -> web.Response:
+        """Report the counters of the whole fleet and start a new peak."""
+        max_in_flight = max(miner.max_in_flight for miner in self.miners.values())
+        for miner in self.miners.values():
+            miner.max_in_flight = miner.in_flight
+        return web.json_response(
+            {
+                "requests": self.requests,
+                "connections": self.connections,
+                "logins": sum(miner.logins for miner in self.miners.values()),
+                "max_in_flight": max_in_flight,
+            }
+        )
+
+    async def _expire_tokens(self, request: web.Request) -> web.Response:
+        """Revoke every token, as a miner restart or a password change does."""
+        for miner in self.miners.values():
+            miner.tokens.clear()
+        return web.json_response({})
+
+    def _authorized(self, request: web.Request, miner: FakeMiner) -> bool:
+        """Return True if the request carries a token that has not expired."""
+        expires_at = miner.tokens.get(request.headers.get("Authorization", ""))
+        return expires_at is not None and time.monotonic() < expires_at
+
+    async def _login(self, request: web.Request) -> web.Response:
+        """Hand out a new token."""
+        with self._serving(request) as miner:
+            miner.logins += 1
+            await self._delay()
+            body = await request.json()
+            if body.get("username") != "root":
+                return web.json_response({"message": "Invalid credentials"}, status=401)
+            token = secrets.token_hex(16)
+            miner.tokens = {
+                key: expires_at
+                for key, expires_at in miner.tokens.items()
+                if expires_at > time.monotonic()
+            }
+            miner.tokens[token] = time.monotonic() + self.config.token_ttl
+            return web.json_response(
+                {"token": token, "timeout_s": self.config.token_ttl}
+            )
+
+    def _read(self, payload):
+        """Wrap a payload builder into a GET handler with failure injection."""
+
+        async def _handler(request: web.Request) -> web.Response:
+            with self._serving(request) as miner:
+                await self._delay()
+                if not self._authorized(request, miner) or (
+                    random.random() < self.config.error_rate_401
+                ):
+                    return web.json_response({"message": "Unauthorized"}, status=401)
+                if random.random() < self.config.error_rate_500:
+                    return web.json_response({"message": "Reconfiguring"}, status=500)
+                return web.json_response(payload(miner))
+
+        return _handler
+
+    def _write(self, apply):
+        """Wrap a command into a PUT/PATCH handler."""
+
+        async def _handler(request: web.Request) -> web.Response:
+            with self._serving(request) as miner:
+                await self._delay()
+                if not self._authorized(request, miner):
+                    return web.json_response({"message": "Unauthorized"}, status=401)
+                body = await request.json() if request.can_read_body else {}
+                if (error := apply(miner, body)) is not None:
+                    return web.json_response({"message": error}, status=422)
+                return web.json_response({})
+
+        return _handler
+
+    def _noise(self, scale: float) -> float:
+        """Return random noise, or none with static telemetry."""
+        return 0.0 if self.config.static else random.uniform(-scale, scale)
+
+    def _ths(self, miner: FakeMiner) -> float:
+        """Return the miner's total hashrate."""
+        if miner.paused:
+            return 0.0
+        if miner.mode == "powertarget":
+            return miner.power_target / 30
+        return miner.hashrate_target
+
+    def _details(self, miner: FakeMiner) -> dict[str, Any]:
+        return {
+            "uid": f"fake{miner.index:04d}",
+            "miner_identity": {"miner_model": "Antminer S19j Pro"},
+            "hostname": f"fake-miner-{miner.index}",
+            "mac_address": f"02:00:00:00:{miner.index >> 8:02x}:{miner.index & 255:02x}",
+            "bos_version": {"current": "25.01-fake"},
+            "psu_info": {"model_name": "APW12"},
+        }
+
+    def _constraints(self, miner: FakeMiner) -> dict[str, Any]:
+        return {
+            "tuner_constraints": {
+                "power_target": {
+                    "min": {"watt": 1000},
+                    "default": {"watt": 3000},
+                    "max": {"watt": 4000},
+                },
+                "hashrate_target": {
+                    "min": {"terahash_per_second": 30},
+                    "default": {"terahash_per_second": 100},
+                    "max": {"terahash_per_second": 130},
+                },
+            }
+        }
+
+    def _windows(self, ths: float) -> dict[str, Any]:
+        return {
+            window: {"gigahash_per_second": ths * 1000 * (1 + self._noise(0.02))}
+            for window in ("last_5s", "last_1m", "last_5m", "last_15m", "last_24h")
+        }
+
+    def _hashboards(self, miner: FakeMiner) -> dict[str, Any]:
+        boards = self.config.boards
+        ths = self._ths(miner) / boards
+        return {
+            "hashboards": [
+                {
+                    "id": str(board + 1),
+                    "enabled": True,
+                    "chips_count": 126,
+                    "current_voltage": {"volt": 13.2},
+                    "current_frequency": {"hertz": 525e6},
+                    "highest_chip_temp": {
+                        "temperature": {"degree_c": 70 + board + self._noise(2)}
+                    },
+                    "board_temp": {"degree_c": 60 + board + self._noise(2)},
+                    "lowest_inlet_temp": {"degree_c": 45 + self._noise(1)},
+                    "highest_outlet_temp": {"degree_c": 65 + self._noise(1)},
+                    "stats": {"real_hashrate": self._windows(ths)},
+                }
+                for board in range(boards)
+            ]
+        }
+
+    def _stats(self, miner: FakeMiner) -> dict[str, Any]:
+        ths = self._ths(miner)
+        watt = 0 if miner.paused else round(ths * 30 * (1 + self._noise(0.01)))
+        return {
+            "miner_stats": {"real_hashrate": self._windows(ths)},
+            "power_stats": {
+                "approximated_consumption": {"watt": watt},
+                "efficiency": {"joule_per_terahash": watt / ths if ths else 0},
+            },
+        }
+
+    def _mode(self, miner: FakeMiner) -> dict[str, Any]:
+        if miner.mode == "powertarget":
+            target = {"powertarget": {"power_target": {"watt": miner.power_target}}}
+        else:
+            target = {
+                "hashratetarget": {
+                    "hashrate_target": {"terahash_per_second": miner.hashrate_target}
+                }
+            }
+        return {"tunermode": {"target": target}}
+
+    def _cooling(self, miner: FakeMiner) -> dict[str, Any]:
+        return {
+            "fans": [
+                {
+                    "position": fan,
+                    "rpm": round(4000 + self._noise(100)),
+                    "target_speed_ratio": 0.6,
+                }
+                for fan in range(self.config.fans)
+            ],
+            "highest_temperature": {
+                "temperature": {"degree_c": 70 + self.config.boards + self._noise(2)}
+            },
+        }
+
+    def _set_mode(self, miner: FakeMiner, body: dict[str, Any]) -> str | None:
+        target = body.get("tunermode", {}).get("target", {})
+        if "powertarget" in target:
+            miner.mode = "powertarget"
+            return self._set_target("power", "watt", 0)(
+                miner, target["powertarget"]["power_target"]
+            )
+        if "hashratetarget" in target:
+            miner.mode = "hashratetarget"
+            return self._set_target("hashrate", "terahash_per_second", 0)(
+                miner, target["hashratetarget"]["hashrate_target"]
+            )
+        return "Unknown tuner mode"
+
+    def _set_target(self, kind: str, unit: str, sign: int):
+        """Return a command setting (0) or moving (1/-1) a target."""
+        attr = f"{kind}_target"
+
+        def _apply(miner: FakeMiner, body: dict[str, Any]) -> str | None:
+            limits = self._constraints(miner)["tuner_constraints"][attr]
+            value = float(body[unit])
+            if sign:
+                value = getattr(miner, attr) + sign * value
+            if not limits["min"][unit] <= value <= limits["max"][unit]:
+                return f"{attr} {value} is out of range"
+            setattr(miner, attr, int(value) if kind == "power" else value)
+            return None
+
+        return _apply
+
+    def _pause(self, paused: bool):
+        def _apply(miner: FakeMiner, body: dict[str, Any]) -> None:
+            miner.paused = paused
+
+        return _apply
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--miners", type=int, default=1)
+    parser.add_argument("--port", type=int, default=18000)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate-401", type=float, default=0.0)
+    parser.add_argument("--error-rate-500", type=float, default=0.0)
+    parser.add_argument("--token-ttl", type=int, default=3600, help="seconds")
+    parser.add_argument("--static", action="store_true")
+    return parser.parse_args()
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    server = FakeMinerServer(
+        args.miners,
+        args.port,
+        FakeMinerConfig(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate_401=args.error_rate_401,
+            error_rate_500=args.error_rate_500,
+            token_ttl=args.token_ttl,
+            static=args.static,
+        ),
+    )
+    await server.async_start()
+    print(f"Serving {args.miners} fake miners from port {args.port}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.async_stop()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(_async_main(_parse_args()))
+    except KeyboardInterrupt:
+        pass
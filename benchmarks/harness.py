@@ -0,0 +1,181 @@
+"""Shared setup for the benchmarks: fake miners and a Home Assistant instance.
+
+The benchmarks set miners up as real config entries, so polling, state writes
+and services run exactly as they do in production. They need Home Assistant
+and the test helpers from ``requirements_test.txt`` installed.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+import logging
+import math
+from pathlib import Path
+import sys
+import tempfile
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from homeassistant import loader  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import frame  # noqa: E402
+from homeassistant.setup import async_setup_component  # noqa: E402
+from pytest_homeassistant_custom_component.common import (  # noqa: E402
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.braiins_os_plus.const import DOMAIN  # noqa: E402
+from fake_miner import FakeMinerConfig, FakeMinerServer  # noqa: E402
+
+
+@asynccontextmanager
+async def async_fake_miners(
+    miners: int, port: int, *options: str
+) -> AsyncIterator[list[str]]:
+    """Serve fake miners from another process and yield their hosts.
+
+    ``options`` are passed to ``fake_miner.py`` as they are, for example
+    ``"--latency=0.05"``. Running them in their own process keeps their CPU
+    time out of the measurements.
+    """
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        str(Path(__file__).with_name("fake_miner.py")),
+        f"--miners={miners}",
+        f"--port={port}",
+        *options,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    try:
+        await process.stdout.readline()
+        yield [f"127.0.0.1:{port + index}" for index in range(miners)]
+    finally:
+        process.terminate()
+        await process.wait()
+
+
+def fake_miner_data(
+    miners: int = 1, boards: int = 3, fans: int = 4
+) -> list[dict[str, Any]]:
+    """Return every fake miner's payloads merged as the API client does it.
+
+    The data is built in process, without a server, for the benchmarks that
+    only parse and read telemetry. The parsed snapshot is left out.
+    """
+    server = FakeMinerServer(miners, 0, FakeMinerConfig(boards=boards, fans=fans))
+    fleet = []
+    for port in server.miners:
+        payloads = server.payloads(port)
+        fleet.append(
+            {
+                "details": payloads["miner/details"],
+                "constraints": payloads["configuration/constraints"],
+                "cooling": payloads["cooling/state"],
+                "hashboards": payloads["miner/hw/hashboards"]["hashboards"],
+                "stats": payloads["miner/stats"],
+            }
+        )
+    return fleet
+
+
+@asynccontextmanager
+async def async_bench_hass(
+    config_dir: str | None = None,
+) -> AsyncIterator[HomeAssistant]:
+    """Yield a running Home Assistant with the custom integration available.
+
+    Without ``config_dir``, a temporary one is used and removed afterwards.
+    Pass the same directory twice to start the second instance from what the
+    first one stored.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        async with async_test_home_assistant(config_dir=config_dir or temp_dir) as hass:
+            frame.async_setup(hass)
+            # The test helper hides custom integrations unless told otherwise
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+            logging.getLogger("homeassistant.loader").setLevel(logging.ERROR)
+            try:
+                yield hass
+            finally:
+                await hass.async_stop(force=True)
+
+
+def add_miner_entries(
+    hass: HomeAssistant, hosts: Iterable[str], options: dict[str, Any] | None = None
+) -> list[MockConfigEntry]:
+    """Add a config entry for every host, with a token that must be renewed.
+
+    Entry IDs only depend on the host's position, so data stored per entry is
+    found again by an instance set up with the same hosts.
+    """
+    entries = []
+    for index, host in enumerate(hosts):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=host,
+            entry_id=f"bench{index:04d}",
+            unique_id=host,
+            data={
+                "miner_ip": host,
+                "username": "root",
+                "password": "bench",
+                "token": "",
+                "expires_at": 0,
+            },
+            options=options or {},
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+    return entries
+
+
+async def async_setup_miners(
+    hass: HomeAssistant,
+    hosts: Iterable[str],
+    options: dict[str, Any] | None = None,
+    config: dict[str, Any] | None = None,
+) -> list[MockConfigEntry]:
+    """Set the integration up with one entry per host, as at startup."""
+    entries = add_miner_entries(hass, hosts, options)
+    assert await async_setup_component(hass, DOMAIN, config or {})
+    await hass.async_block_till_done()
+    return entries
+
+
+class LoopLagProbe:
+    """Measure how late the event loop runs a timer due every ``interval``."""
+
+    def __init__(self, interval: float = 0.1) -> None:
+        """Initialize the probe."""
+        self.interval = interval
+        self.lags: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lags.append(loop.time() - start - self.interval)
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of the values, or NaN if empty."""
+    if not values:
+        return math.nan
+    ordered = sorted(values)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
@@ -1,46 +1,225 @@
 # custom_components/braiins_os_plus/__init__.py
 
+import asyncio
 import logging
-from datetime import timedelta
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DOMAIN, PLATFORMS
+from .const import (
+    CONF_DETAILED_TELEMETRY,
+    CONF_ENTRY_TYPE,
+    CONF_HASHRATE_WINDOWS,
+    CONF_POWER_BUDGET_ENTITY,
+    CONF_TRANSPORT,
+    DATA_FLEET,
+    DATA_SITE_CONTROLLER,
+    DEFAULT_DETAILED_TELEMETRY,
+    DEFAULT_HASHRATE_WINDOWS,
+    DEFAULT_TRANSPORT,
+    DOMAIN,
+    ENTRY_TYPE_SITE,
+    MAX_CONCURRENT_REQUESTS,
+    PLATFORMS,
+    POLL_INTERVAL,
+)
 from .api import BraiinsAPI
+from .cache import BraiinsSnapshotCache
+from .commands import BraiinsCommandQueue
+from .controller import BraiinsSiteController
+from .efficiency import EfficiencyCurve
+from .history import MinerHistory
+from .fleet import BraiinsFleetPoller
+from .services import async_setup_services
+from .transport import create_transport
 
 _LOGGER = logging.getLogger(__name__)
 
+# Miners and the site power budget are both set up from the UI
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Braiins OS+ services."""
+    async_setup_services(hass)
+
+    async def _async_shutdown(event: Event) -> None:
+        """Stop polling and close every miner's connections on shutdown.
+
+        Config entries are not unloaded when Home Assistant stops, so nothing
+        else cancels the fleet's timers or closes the per-miner sessions.
+        """
+        if (controller := hass.data.get(DATA_SITE_CONTROLLER)) is not None:
+            controller.async_stop()
+        if (fleet := hass.data.get(DATA_FLEET)) is not None:
+            fleet.async_shutdown()
+        miners = list(hass.data.get(DOMAIN, {}).values())
+        # Send the presses still waiting to be merged, then close the sessions
+        await asyncio.gather(*(d["commands"].async_flush() for d in miners))
+        await asyncio.gather(*(d["api"].async_close() for d in miners))
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_shutdown)
+    return True
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Braiins OS+ from a config entry."""
+    if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_SITE:
+        return _async_setup_site_entry(hass, entry)
+
     hass.data.setdefault(DOMAIN, {})
-    
-    session = async_get_clientsession(hass)
-    api = BraiinsAPI(hass, entry, session)
+    if (fleet := hass.data.get(DATA_FLEET)) is None:
+        fleet = hass.data[DATA_FLEET] = BraiinsFleetPoller(
+            hass, POLL_INTERVAL, MAX_CONCURRENT_REQUESTS
+        )
 
+    transport = create_transport(
+        entry.data.get(CONF_TRANSPORT, DEFAULT_TRANSPORT), entry.data["miner_ip"]
+    )
+    api = BraiinsAPI(hass, entry, transport, fleet.request_semaphore)
+    # Keep the token fresh so polls never have to wait for a login
+    api.async_start_token_refresh()
+
+    # Polling is driven by the fleet poller, not by the coordinator itself
     coordinator = DataUpdateCoordinator(
         hass,
         _LOGGER,
-        name=f"{DOMAIN}_data_coordinator",
+        name=f"{DOMAIN}_data_coordinator_{entry.entry_id}",
         update_method=api.async_update_data, # Point to the new master method
-        update_interval=timedelta(seconds=5),
+        update_interval=None,
+        # Unchanged polls return the same data object; don't notify entities
+        always_update=False,
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    # Set up straight from the last saved data when there is some and let the
+    # first poll happen in the background; otherwise wait for the miner.
+    cache = BraiinsSnapshotCache(hass, entry.entry_id)
+    if cached := await cache.async_load():
+        coordinator.async_set_updated_data(api.restore_data(cached))
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            await api.async_close()
+            raise
+
+    # Fill in the device's details once; entities only name its identifier,
+    # so the platform's registry call for each of them is a plain lookup
+    _async_update_device(hass, entry, coordinator.data)
+    details = coordinator.data.get("details")
+    efficiency = EfficiencyCurve()
+    history = MinerHistory()
+    detailed = entry.options.get(CONF_DETAILED_TELEMETRY, DEFAULT_DETAILED_TELEMETRY)
+
+    @callback
+    def _async_on_update() -> None:
+        """Persist and learn from the latest good data; keep the device info current."""
+        nonlocal details
+        if not coordinator.last_update_success or not coordinator.data:
+            return
+        cache.async_schedule_save(coordinator.data)
+        efficiency.async_add_sample(coordinator.data)
+        history.async_add_sample(coordinator.data["snapshot"])
+        if coordinator.data.get("details") is not details:
+            details = coordinator.data.get("details")
+            _async_update_device(hass, entry, coordinator.data)
+
+    entry.async_on_unload(coordinator.async_add_listener(_async_on_update))
+    if not cached:
+        # Learn from the first refresh too, so the rolling averages have a
+        # sample when their entities are added
+        _async_on_update()
+
+    hashrate_windows = entry.options.get(CONF_HASHRATE_WINDOWS, DEFAULT_HASHRATE_WINDOWS)
+
+    async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Reload when the set of optional sensors changed, not on every option."""
+        if (
+            entry.options.get(CONF_HASHRATE_WINDOWS, DEFAULT_HASHRATE_WINDOWS) != hashrate_windows
+            or entry.options.get(CONF_DETAILED_TELEMETRY, DEFAULT_DETAILED_TELEMETRY) != detailed
+        ):
+            await hass.config_entries.async_reload(entry.entry_id)
+
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+
+    # Added before the entities, so they show what the miner reported
+    commands = BraiinsCommandQueue(hass, api, coordinator)
+    entry.async_on_unload(
+        coordinator.async_add_listener(commands.async_handle_coordinator_update)
+    )
 
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
         "coordinator": coordinator,
+        "commands": commands,
+        "efficiency": efficiency,
+        "history": history,
     }
+    fleet.async_add(
+        entry.entry_id, coordinator, api.poll_policy, refresh_now=bool(cached)
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
+@callback
+def _async_setup_site_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Start keeping the loaded miners within the site power budget."""
+    controller = BraiinsSiteController(hass, entry.options[CONF_POWER_BUDGET_ENTITY])
+    hass.data[DATA_SITE_CONTROLLER] = controller
+    controller.async_start()
+
+    async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Follow the newly chosen budget entity."""
+        await hass.config_entries.async_reload(entry.entry_id)
+
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+    return True
+
+@callback
+def _async_update_device(
+    hass: HomeAssistant, entry: ConfigEntry, data: dict[str, Any]
+) -> None:
+    """Create or update the miner's device from its details."""
+    details = data.get("details") or {}
+    ident = details.get("miner_identity") or {}
+    mac = details.get("mac_address")
+
+    dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id,
+        identifiers={(DOMAIN, entry.entry_id)},
+        connections={(dr.CONNECTION_NETWORK_MAC, mac)} if mac else set(),
+        name=details.get("hostname") or f"Braiins OS+ Miner ({entry.data['miner_ip']})",
+        manufacturer="Braiins",
+        model=ident.get("miner_model") or "Miner with Braiins OS+",
+        sw_version=(details.get("bos_version") or {}).get("current"),
+        hw_version=(details.get("psu_info") or {}).get("model_name"),
+        configuration_url=f"http://{entry.data['miner_ip']}",
+    )
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_SITE:
+        hass.data.pop(DATA_SITE_CONTROLLER).async_stop()
+        return True
+
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
-    return unload_ok
\ No newline at end of file
+        domain_data = hass.data[DOMAIN].pop(entry.entry_id)
+        fleet: BraiinsFleetPoller = hass.data[DATA_FLEET]
+        fleet.async_remove(entry.entry_id)
+        if fleet.is_empty:
+            hass.data.pop(DATA_FLEET)
+        # Don't drop presses that are still waiting to be merged
+        await domain_data["commands"].async_flush()
+        await domain_data["api"].async_close()
+    return unload_ok
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached data of a deleted config entry."""
+    if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_SITE:
+        return
+    await BraiinsSnapshotCache(hass, entry.entry_id).async_remove()
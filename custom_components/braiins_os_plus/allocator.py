@@ -0,0 +1,237 @@
+# custom_components/braiins_os_plus/allocator.py
+"""Split a site power budget across miners to maximize total hashrate."""
+
+from dataclasses import dataclass
+import heapq
+from typing import Any
+
+from .const import POWER_ALLOCATION_STEP
+from .efficiency import EfficiencyCurve, interpolate_hashrate
+
+# Used for a miner whose efficiency is unknown and no other miner reports one
+_FALLBACK_EFFICIENCY = 30.0
+
+
+@dataclass(slots=True, frozen=True)
+class MinerPowerProfile:
+    """What the allocator knows about one miner."""
+
+    miner_id: str
+    min_w: float
+    max_w: float
+    efficiency_jth: float
+    # Learned (power target W, hashrate TH/s) points, if any
+    curve: tuple[tuple[float, float], ...] = ()
+
+    def hashrate_at(self, watt: float) -> float:
+        """Return the expected hashrate in TH/s at the given power target."""
+        if self.curve:
+            return interpolate_hashrate(self.curve, watt)
+        return watt / self.efficiency_jth
+
+    @classmethod
+    def from_data(
+        cls,
+        miner_id: str,
+        data: dict[str, Any],
+        default_efficiency: float,
+        curve: EfficiencyCurve | None = None,
+    ) -> "MinerPowerProfile":
+        """Build the profile from a miner's coordinator data."""
+        try:
+            limits = data["constraints"]["tuner_constraints"]["power_target"]
+            min_w = float(limits["min"]["watt"])
+            max_w = float(limits["max"]["watt"])
+        except KeyError, TypeError, ValueError:
+            # Without constraints, leave the miner where it is
+            min_w = max_w = float(data.get("power_target") or 0)
+        snapshot = data.get("snapshot")
+        efficiency = snapshot.efficiency_jth if snapshot is not None else None
+        return cls(
+            miner_id=miner_id,
+            min_w=min_w,
+            max_w=max(max_w, min_w),
+            # Rounded so a profile only changes when the efficiency really does
+            efficiency_jth=round(efficiency, 1) if efficiency else default_efficiency,
+            curve=tuple(curve.points) if curve is not None else (),
+        )
+
+
+def build_power_profiles(
+    miners: dict[str, dict[str, Any]],
+    curves: dict[str, EfficiencyCurve] | None = None,
+) -> list[MinerPowerProfile]:
+    """Build the profiles of every miner from their coordinator data.
+
+    A miner's learned efficiency curve is used where there is one.
+    Miners that report no efficiency (paused, or not polled yet) are assumed
+    to be as efficient as the fleet average. Without tuner constraints a miner
+    is pinned to its current power target.
+    """
+    efficiencies = [
+        snapshot.efficiency_jth
+        for data in miners.values()
+        if (snapshot := (data or {}).get("snapshot")) is not None
+        and snapshot.efficiency_jth
+    ]
+    default = (
+        round(sum(efficiencies) / len(efficiencies), 1)
+        if efficiencies
+        else _FALLBACK_EFFICIENCY
+    )
+    profiles = (
+        MinerPowerProfile.from_data(
+            miner_id, data or {}, default, (curves or {}).get(miner_id)
+        )
+        for miner_id, data in miners.items()
+    )
+    # A miner with no limits and no known target cannot be given one
+    return [profile for profile in profiles if profile.max_w > 0]
+
+
+class PowerBudgetAllocator:
+    """Greedy power allocation, re-solved incrementally.
+
+    Every miner starts at its minimum, then the budget is handed out in
+    POWER_ALLOCATION_STEP slices to whichever miner gains the most hashrate per
+    watt from the next slice. This is optimal as long as each miner's hashrate
+    has diminishing returns in power, and takes O(slices * log(miners)).
+
+    The previous allocation is kept between solves. Miners whose limits changed
+    are clamped into them and new miners start at their minimum; the result is
+    then grown or shrunk to the budget. Since a miner's efficiency changes a
+    little with every poll, watts are finally moved, a slice at a time, from
+    the miners that lose the least hashrate per watt to those that gain the
+    most, until no move pays off. When little changed, that takes a few moves
+    instead of a solve from scratch.
+    """
+
+    def __init__(self, step: float = POWER_ALLOCATION_STEP) -> None:
+        """Initialize the allocator."""
+        self._step = step
+        self._profiles: dict[str, MinerPowerProfile] = {}
+        self._bounds: dict[str, tuple[float, float]] = {}
+        self._allocation: dict[str, float] = {}
+
+    def solve(self, budget: float, profiles: list[MinerPowerProfile]) -> dict[str, int]:
+        """Return the power target of every miner for the given budget."""
+        # Curves and efficiencies only change the rates, which are read from
+        # the profiles as they are; only new limits move the allocation
+        self._profiles = {profile.miner_id: profile for profile in profiles}
+        bounds = {
+            miner_id: (profile.min_w, profile.max_w)
+            for miner_id, profile in self._profiles.items()
+        }
+        if bounds != self._bounds:
+            self._bounds = bounds
+            self._allocation = {
+                miner_id: min(max(self._allocation.get(miner_id, min_w), min_w), max_w)
+                for miner_id, (min_w, max_w) in bounds.items()
+            }
+
+        allocated = sum(self._allocation.values())
+        if budget > allocated:
+            self._grow(budget - allocated)
+        elif budget < allocated:
+            self._shrink(allocated - budget)
+        self._rebalance()
+
+        return {miner_id: int(watt) for miner_id, watt in self._allocation.items()}
+
+    def _gain(self, profile: MinerPowerProfile, watt: float) -> tuple[float, float]:
+        """Return the next slice a miner can take and its hashrate per watt."""
+        size = min(self._step, profile.max_w - watt)
+        if size <= 0:
+            return 0.0, 0.0
+        return size, (
+            profile.hashrate_at(watt + size) - profile.hashrate_at(watt)
+        ) / size
+
+    def _loss(self, profile: MinerPowerProfile, watt: float) -> tuple[float, float]:
+        """Return the next slice a miner can give up and its hashrate per watt."""
+        size = min(self._step, watt - profile.min_w)
+        if size <= 0:
+            return 0.0, 0.0
+        return size, (
+            profile.hashrate_at(watt) - profile.hashrate_at(watt - size)
+        ) / size
+
+    def _grow(self, amount: float) -> None:
+        """Hand out ``amount`` watts to the miners that gain the most from them."""
+        heap = []
+        for miner_id, profile in self._profiles.items():
+            size, rate = self._gain(profile, self._allocation[miner_id])
+            if size:
+                heap.append((-rate, miner_id, size))
+        heapq.heapify(heap)
+
+        while amount > 0 and heap:
+            _, miner_id, size = heapq.heappop(heap)
+            size = min(size, amount)
+            self._allocation[miner_id] += size
+            amount -= size
+            size, rate = self._gain(
+                self._profiles[miner_id], self._allocation[miner_id]
+            )
+            if size:
+                heapq.heappush(heap, (-rate, miner_id, size))
+
+    def _shrink(self, amount: float) -> None:
+        """Take ``amount`` watts from the miners that lose the least from it."""
+        heap = []
+        for miner_id, profile in self._profiles.items():
+            size, rate = self._loss(profile, self._allocation[miner_id])
+            if size:
+                heap.append((rate, miner_id, size))
+        heapq.heapify(heap)
+
+        while amount > 0 and heap:
+            _, miner_id, size = heapq.heappop(heap)
+            size = min(size, amount)
+            self._allocation[miner_id] -= size
+            amount -= size
+            size, rate = self._loss(
+                self._profiles[miner_id], self._allocation[miner_id]
+            )
+            if size:
+                heapq.heappush(heap, (rate, miner_id, size))
+
+    def _rebalance(self) -> None:
+        """Move watts between miners until no move adds hashrate."""
+        gains: list[tuple[float, str, float]] = []
+        losses: list[tuple[float, str, float]] = []
+
+        def _push(miner_id: str) -> None:
+            profile, watt = self._profiles[miner_id], self._allocation[miner_id]
+            size, rate = self._gain(profile, watt)
+            if size:
+                heapq.heappush(gains, (-rate, miner_id, watt))
+            size, rate = self._loss(profile, watt)
+            if size:
+                heapq.heappush(losses, (rate, miner_id, watt))
+
+        for miner_id in self._profiles:
+            _push(miner_id)
+
+        while gains and losses:
+            # Entries pushed before their miner last moved are out of date
+            if self._allocation[gains[0][1]] != gains[0][2]:
+                heapq.heappop(gains)
+                continue
+            if self._allocation[losses[0][1]] != losses[0][2]:
+                heapq.heappop(losses)
+                continue
+            (_, taker, taker_w), (_, giver, giver_w) = gains[0], losses[0]
+            if taker == giver:
+                break
+            take, give = self._profiles[taker], self._profiles[giver]
+            size = min(self._gain(take, taker_w)[0], self._loss(give, giver_w)[0])
+            gained = take.hashrate_at(taker_w + size) - take.hashrate_at(taker_w)
+            lost = give.hashrate_at(giver_w) - give.hashrate_at(giver_w - size)
+            # The margin keeps rounding errors from moving watts back and forth
+            if gained - lost <= 1e-9:
+                break
+            self._allocation[taker] += size
+            self._allocation[giver] -= size
+            _push(taker)
+            _push(giver)
@@ -2,171 +2,450 @@
 """Braiins OS+ integration API client for token management and miner control."""
 
 import asyncio
+import contextlib
+from enum import Enum
 import logging
+import random
 import time
 from typing import Any
 
 import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
+from .const import (
+    CIRCUIT_BREAKER_THRESHOLD,
+    CIRCUIT_PROBE_ENDPOINT,
+    CONF_TOKEN_REFRESH_FRACTION,
+    CONNECT_TIMEOUT,
+    DEFAULT_TOKEN_LIFETIME,
+    DEFAULT_TOKEN_REFRESH_FRACTION,
+    READ_TIMEOUT,
+    TOKEN_PERSIST_INTERVAL,
+    TOKEN_REFRESH_JITTER,
+    TOKEN_REFRESH_RETRY_DELAY,
+)
+from .metrics import PipelineMetrics
+from .models import MinerSnapshot
+from .polling import AdaptivePollInterval
+from .transport import (
+    BraiinsAuthError,
+    BraiinsBusyError,
+    BraiinsCommandError,
+    BraiinsConnectionError,
+    BraiinsTransport,
+    BraiinsTransportError,
+    UNCHANGED,
+)
+
 _LOGGER = logging.getLogger(__name__)
 
+# Refresh interval in seconds for each polled endpoint. ``0`` fetches the
+# endpoint on every coordinator update, ``None`` only on (re)connect or after
+# the endpoint has been invalidated by a command.
+# Neither the REST gateway nor the gRPC API pushes these payloads, so every
+# one of them is polled.
+ENDPOINT_REFRESH_INTERVALS: dict[str, float | None] = {
+    "miner/details": 600,
+    "configuration/constraints": None,
+    "performance/mode": 30,
+    "miner/hw/hashboards": 0,
+    "miner/stats": 0,
+    "cooling/state": 0,
+}
+
+# Endpoints that all fail with 500 while the miner is reconfiguring
+_BUSY_ENDPOINTS = ("performance/mode", "miner/stats", "miner/hw/hashboards")
+
+
+class _Failure(Enum):
+    """Why a request got no payload."""
+
+    # The miner answered 500, usually because it is reconfiguring
+    BUSY = "busy"
+    # Timeout or connection error: the miner did not answer at all
+    UNREACHABLE = "unreachable"
+    # The miner answered, but not with the payload, or the re-login failed
+    ERROR = "error"
+
 
 class BraiinsAPI:
     """A class for handling API calls and token renewal."""
 
     def __init__(
-        self, hass: HomeAssistant, entry: ConfigEntry, session: aiohttp.ClientSession
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        transport: BraiinsTransport,
+        request_semaphore: asyncio.Semaphore | None = None,
     ) -> None:
         """Initialize the API object."""
         self._hass = hass
         self._entry = entry
-        self._session = session
-        self._base_url = f"http://{self._entry.data['miner_ip']}/api/v1"
+        self._transport = transport
+        self.metrics = transport.metrics = PipelineMetrics()
+        # Shared with the rest of the fleet to cap concurrent polling requests
+        self._request_semaphore = request_semaphore or contextlib.nullcontext()
         self._token = self._entry.data["token"]
-        self._headers = {"Authorization": self._token}
-        self._lock = asyncio.Lock()
+        self._expires_at: float = self._entry.data["expires_at"]
+        # Shared by every caller waiting for the same re-login
+        self._renew_task: asyncio.Task[bool] | None = None
+        # Background refresh; renewed tokens are only written to the config
+        # entry every TOKEN_PERSIST_INTERVAL and on close
+        self._refresh_timer: asyncio.TimerHandle | None = None
+        self._refresh_task: asyncio.Task | None = None
+        self._refresh_active = False
+        self._persisted_at = time.monotonic()
         self._last_data = {}
+        self._next_fetch: dict[str, float] = {}
+        # Last decoded payload per endpoint, and the ones not merged yet
+        self._payloads: dict[str, dict[str, Any]] = {}
+        self._unmerged: set[str] = set()
+        self.poll_policy = AdaptivePollInterval()
+
+    async def async_close(self) -> None:
+        """Stop the token refresh and close the underlying transport."""
+        self._refresh_active = False
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        self._async_persist_token(force=True)
+        await self._transport.async_close()
 
     def get_cached_value(self, key: str) -> Any:
         """Public method to get a value from the internal cache."""
         return self._last_data.get(key)
 
-    def update_last_data(self, key: str, value: Any) -> None:
-        """Public method to update the internal cache for optimistic UI updates."""
-        if self._last_data is not None:
-            self._last_data[key] = value
+    def restore_data(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Seed the cache with data saved by a previous run and return it."""
+        self._last_data = {**data, "snapshot": MinerSnapshot.from_data(data)}
+        return self._last_data
+
+    def invalidate_endpoints(self, *endpoints: str) -> None:
+        """Force the given endpoints (or all of them) to be fetched on the next update."""
+        for endpoint in endpoints or ENDPOINT_REFRESH_INTERVALS:
+            self._next_fetch.pop(endpoint, None)
+
+    def _due_endpoints(self, now: float) -> list[str]:
+        """Return the endpoints whose refresh interval has elapsed."""
+        return [
+            endpoint
+            for endpoint in ENDPOINT_REFRESH_INTERVALS
+            if now >= self._next_fetch.get(endpoint, 0)
+        ]
 
     async def async_relogin(self) -> bool:
         """Perform a login to get a new token."""
-        url = f"{self._base_url}/auth/login"
-        payload = {
-            "username": self._entry.data["username"],
-            "password": self._entry.data["password"],
-        }
         try:
             async with asyncio.timeout(10):
-                async with self._session.post(url, json=payload) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-
-                    new_token = data["token"]
-                    new_timeout = data.get("timeout_s", 3600)
-                    new_expires_at = time.time() + new_timeout - 60
-
-                    _LOGGER.info(
-                        "Successfully re-authenticated with Braiins OS+ and got a new token"
-                    )
-
-                    self._token = new_token
-                    self._headers = {"Authorization": self._token}
-
-                    new_data = {
-                        **self._entry.data,
-                        "token": new_token,
-                        "expires_at": new_expires_at,
-                    }
-                    self._hass.config_entries.async_update_entry(
-                        self._entry, data=new_data
-                    )
-
-                    return True
-
-        except (TimeoutError, aiohttp.ClientError) as err:
+                data = await self._transport.async_login(
+                    self._entry.data["username"], self._entry.data["password"]
+                )
+        except (TimeoutError, aiohttp.ClientError, BraiinsTransportError) as err:
             _LOGGER.warning("Failed to re-authenticate with Braiins OS+: %s", err)
+            self.metrics.record_relogin(False)
             return False
         except Exception as err:  # noqa: BLE001
             _LOGGER.error(
                 "An unexpected error occurred during re-authentication: %s", err
             )
+            self.metrics.record_relogin(False)
             return False
 
+        new_token = data["token"]
+        new_timeout = data.get("timeout_s", DEFAULT_TOKEN_LIFETIME)
+        new_expires_at = time.time() + new_timeout - 60
+
+        _LOGGER.info(
+            "Successfully re-authenticated with Braiins OS+ and got a new token"
+        )
+
+        self._token = new_token
+        self._expires_at = new_expires_at
+        self.metrics.record_relogin(True)
+        self._async_persist_token()
+        if self._refresh_active:
+            self._async_schedule_token_refresh(new_timeout)
+
+        return True
+
+    @callback
+    def async_start_token_refresh(self) -> None:
+        """Renew the token in the background before it expires.
+
+        Polls then keep using a valid token and only log in themselves if the
+        background refresh keeps failing until the token has expired.
+        """
+        self._refresh_active = True
+        self._async_schedule_token_refresh(max(self._expires_at - time.time(), 0))
+
+    @callback
+    def _async_schedule_token_refresh(self, lifetime: float) -> None:
+        """Arm the refresh timer for a token valid for ``lifetime`` seconds."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        fraction = self._entry.options.get(
+            CONF_TOKEN_REFRESH_FRACTION, DEFAULT_TOKEN_REFRESH_FRACTION
+        )
+        if lifetime > 0:
+            delay = lifetime * fraction * random.uniform(1 - TOKEN_REFRESH_JITTER, 1)
+        else:
+            # Every token of the fleet may have gone stale while Home Assistant
+            # was stopped; a poll that needs a token logs in first anyway
+            delay = random.uniform(0, TOKEN_REFRESH_JITTER * DEFAULT_TOKEN_LIFETIME)
+        self._refresh_timer = self._hass.loop.call_later(
+            delay, self._async_dispatch_token_refresh
+        )
+
+    @callback
+    def _async_dispatch_token_refresh(self) -> None:
+        """Start a background token refresh."""
+        self._refresh_timer = None
+        self._refresh_task = self._hass.async_create_background_task(
+            self._async_refresh_token(), "braiins_os_plus token refresh"
+        )
+
+    async def _async_refresh_token(self) -> None:
+        """Renew the token, retrying later if the miner cannot be reached."""
+        _LOGGER.debug("Renewing token ahead of expiry")
+        # A successful login schedules the next refresh itself
+        if not await self.async_renew_token() and self._refresh_active:
+            self._refresh_timer = self._hass.loop.call_later(
+                TOKEN_REFRESH_RETRY_DELAY, self._async_dispatch_token_refresh
+            )
+
+    @callback
+    def _async_persist_token(self, force: bool = False) -> None:
+        """Write the current token to the config entry, at most every so often."""
+        if self._entry.data.get("token") == self._token:
+            return
+        if not force and time.monotonic() - self._persisted_at < TOKEN_PERSIST_INTERVAL:
+            return
+
+        self._persisted_at = time.monotonic()
+        new_data = {
+            **self._entry.data,
+            "token": self._token,
+            "expires_at": self._expires_at,
+        }
+        self._hass.config_entries.async_update_entry(self._entry, data=new_data)
+
+    async def async_renew_token(self, rejected_token: str | None = None) -> bool:
+        """Re-login once for every caller that needs a new token.
+
+        Concurrent callers share the same login instead of queueing behind a
+        lock. When ``rejected_token`` is given and the token has already been
+        replaced since, the caller can simply retry with the new one.
+        """
+        if rejected_token is not None and rejected_token != self._token:
+            return True
+        if self._renew_task is None or self._renew_task.done():
+            self._renew_task = self._hass.async_create_background_task(
+                self.async_relogin(), "braiins_os_plus token renewal"
+            )
+        # Shielded so a cancelled caller does not abort the shared login
+        return await asyncio.shield(self._renew_task)
+
     async def _is_token_valid_and_renew(self) -> bool:
         """Helper to check token validity and renew if needed."""
-        async with self._lock:
-            if time.time() > self._entry.data["expires_at"]:
-                _LOGGER.info("Token expired based on time, attempting re-login")
-                return await self.async_relogin()
-        return True
+        if time.time() <= self._expires_at:
+            return True
+        _LOGGER.info("Token expired based on time, attempting re-login")
+        return await self.async_renew_token()
+
+    async def _async_get(self, endpoint: str, token: str) -> dict[str, Any]:
+        """Fetch an endpoint within the fleet's concurrency cap.
+
+        The latency is measured, and the timeout budget spent, from when the
+        request leaves the queue.
+        """
+        async with self._request_semaphore:
+            start = time.monotonic()
+            try:
+                async with asyncio.timeout(CONNECT_TIMEOUT + READ_TIMEOUT):
+                    return await self._transport.async_get(endpoint, token)
+            except TimeoutError:
+                self.metrics.record_outcome(endpoint, "timeout")
+                raise
+            except aiohttp.ClientConnectionError, BraiinsConnectionError:
+                self.metrics.record_outcome(endpoint, "error")
+                raise
+            finally:
+                self.metrics.record_latency(endpoint, time.monotonic() - start)
+
+    async def _async_send(
+        self, method: str, endpoint: str, token: str, data: dict | None
+    ) -> None:
+        """Send a command to an endpoint."""
+        async with asyncio.timeout(10):
+            await self._transport.async_send(method, endpoint, token, data)
 
-    async def _make_get_request(self, endpoint: str) -> dict[str, Any] | None:
-        """Make a GET request and return the JSON response, or None on failure."""
+    async def _make_get_request(self, endpoint: str) -> dict[str, Any] | _Failure:
+        """Make a GET request and return the JSON response, or why it failed."""
         if not await self._is_token_valid_and_renew():
-            return None
+            return _Failure.ERROR
 
-        url = f"{self._base_url}/{endpoint}"
-        _LOGGER.debug("Sending GET request to %s", url)
+        token = self._token
         try:
-            async with asyncio.timeout(10):
-                async with self._session.get(url, headers=self._headers) as response:
-                    if response.status == 401:
-                        _LOGGER.info(
-                            "Token rejected by miner (401), attempting re-login"
-                        )
-                        async with self._lock:
-                            if await self.async_relogin():
-                                _LOGGER.info(
-                                    "Re-login successful, retrying request for %s", url
-                                )
-                                async with self._session.get(
-                                    url, headers=self._headers
-                                ) as retry_response:
-                                    retry_response.raise_for_status()
-                                    return await retry_response.json()
-
-                            _LOGGER.warning(
-                                "Re-login failed after 401, aborting request for %s",
-                                url,
-                            )
-                            return None
-
-                    if response.status == 500:
-                        _LOGGER.debug(
-                            "Miner returned 500 at %s (likely reconfiguring)", endpoint
-                        )
-                        return None
-
-                    response.raise_for_status()
-                    return await response.json()
-
-        except (TimeoutError, aiohttp.ClientError) as err:
-            _LOGGER.warning("Failed to get data from %s: %s", url, err)
-            return None
+            try:
+                payload = await self._async_get(endpoint, token)
+            except BraiinsAuthError:
+                _LOGGER.info("Token rejected by miner (401), attempting re-login")
+                if not await self.async_renew_token(token):
+                    _LOGGER.warning(
+                        "Re-login failed after 401, aborting request for %s", endpoint
+                    )
+                    return _Failure.ERROR
+
+                _LOGGER.info("Re-login successful, retrying request for %s", endpoint)
+                payload = await self._async_get(endpoint, self._token)
+
+        except BraiinsBusyError:
+            _LOGGER.debug("Miner returned 500 at %s (likely reconfiguring)", endpoint)
+            return _Failure.BUSY
+        except (
+            TimeoutError,
+            aiohttp.ClientConnectionError,
+            BraiinsConnectionError,
+        ) as err:
+            _LOGGER.warning("Failed to get data from %s: %s", endpoint, err)
+            return _Failure.UNREACHABLE
+        except (aiohttp.ClientError, BraiinsTransportError) as err:
+            _LOGGER.warning("Failed to get data from %s: %s", endpoint, err)
+            return _Failure.ERROR
         except Exception as err:  # noqa: F841
             _LOGGER.exception(
-                "An unexpected error occurred while getting data from %s", url
+                "An unexpected error occurred while getting data from %s", endpoint
             )
-            return None
+            return _Failure.ERROR
 
-    async def async_update_data(self) -> dict[str, Any]:
-        """Fetch data from all endpoints and combine them. Raise UpdateFailed only if all fail."""
-        results = await asyncio.gather(
-            self._make_get_request("miner/details"),
-            self._make_get_request("configuration/constraints"),
-            self._make_get_request("miner/hw/hashboards"),
-            self._make_get_request("miner/stats"),
-            self._make_get_request("performance/mode"),
-            self._make_get_request("cooling/state"),
-        )
+        if payload is UNCHANGED:
+            return self._payloads.get(endpoint)
 
-        details, constraints, hashboards_raw, stats, mode, cooling = results
+        self._payloads[endpoint] = payload
+        self._unmerged.add(endpoint)
+        return payload
 
-        # If all heavy endpoints return 500, the miner is reconfiguring.
-        # Return the last successful data to prevent the UI from reverting.
-        if mode is None and stats is None and hashboards_raw is None:
-            if self._last_data:
-                _LOGGER.info(
-                    "Miner is reconfiguring; using cached data to prevent UI revert"
+    async def async_update_data(self) -> dict[str, Any]:
+        """Fetch the endpoints that are due, timing the whole update."""
+        start = time.monotonic()
+        try:
+            return await self._async_update_data()
+        finally:
+            self.metrics.record_update(time.monotonic() - start)
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch the endpoints that are due and merge them with the cached data.
+
+        If every fetched endpoint fails, the cached data is kept until
+        CIRCUIT_BREAKER_THRESHOLD polls in a row went unanswered, then
+        UpdateFailed is raised. While the circuit is open a single probe is sent
+        first, and the full poll only happens once the miner answers it.
+        """
+        now = time.monotonic()
+        if self.poll_policy.circuit_open:
+            probe = await self._make_get_request(CIRCUIT_PROBE_ENDPOINT)
+            if probe is _Failure.UNREACHABLE or probe is _Failure.ERROR:
+                self.poll_policy.record_failure()
+                raise UpdateFailed(
+                    f"Miner is unreachable, probing again in "
+                    f"{self.poll_policy.interval:.0f} s"
                 )
+            _LOGGER.info(
+                "Miner at %s is reachable again, resuming polling",
+                self._entry.data["miner_ip"],
+            )
+            if probe is _Failure.BUSY:
+                # It answers, but is reconfiguring; poll it once it is done
+                self.poll_policy.record_busy()
+                return self._busy_data()
+            # The probe's payload is merged below instead of being fetched twice
+            interval = ENDPOINT_REFRESH_INTERVALS[CIRCUIT_PROBE_ENDPOINT]
+            self._next_fetch[CIRCUIT_PROBE_ENDPOINT] = now + interval
+
+        due = self._due_endpoints(now)
+        responses = await asyncio.gather(
+            *(self._make_get_request(endpoint) for endpoint in due)
+        )
+        results = dict(zip(due, responses))
+
+        if not results:
+            # Nothing is due
+            return self._last_data
+
+        # If the heavy endpoints all fail and at least one answered 500, the
+        # miner is reconfiguring. Return the last successful data to prevent
+        # the UI from reverting.
+        heavy = [
+            results[endpoint] for endpoint in _BUSY_ENDPOINTS if endpoint in results
+        ]
+        if (
+            heavy
+            and all(isinstance(response, _Failure) for response in heavy)
+            and _Failure.BUSY in heavy
+        ):
+            self.poll_policy.record_busy()
+            return self._busy_data()
+
+        if all(isinstance(response, _Failure) for response in results.values()):
+            # Treat the next successful update as a reconnect
+            self.invalidate_endpoints()
+            if self.poll_policy.record_failure():
+                _LOGGER.warning(
+                    "Miner at %s did not answer %d polls in a row; "
+                    "probing it with a backoff until it is back",
+                    self._entry.data["miner_ip"],
+                    CIRCUIT_BREAKER_THRESHOLD,
+                )
+            elif self._last_data:
+                # A poll or two can go missing without the sensors dropping out
+                _LOGGER.debug("Miner did not answer; keeping the cached data")
                 return self._last_data
-            raise UpdateFailed("Miner is busy and no cached data is available.")
-
-        if not any([details, constraints, hashboards_raw, stats, mode, cooling]):
             raise UpdateFailed("Failed to fetch any data from the miner.")
 
+        for endpoint, response in results.items():
+            if isinstance(response, _Failure):
+                # Keep failed endpoints due so they are retried on the next tick
+                continue
+            interval = ENDPOINT_REFRESH_INTERVALS[endpoint]
+            self._next_fetch[endpoint] = (
+                now + interval if interval is not None else float("inf")
+            )
+
+        if not self._unmerged:
+            # The miner returned the same bodies as last time; handing back the
+            # same object lets the coordinator skip notifying its entities.
+            self.poll_policy.record_update(self._last_data["snapshot"])
+            return self._last_data
+
+        fresh = {endpoint: self._payloads[endpoint] for endpoint in self._unmerged}
+        self._unmerged.clear()
+        combined_data = self._merge_results(fresh)
+        self.poll_policy.record_update(combined_data["snapshot"])
+        return combined_data
+
+    def _busy_data(self) -> dict[str, Any]:
+        """Return the cached data while the miner is reconfiguring."""
+        if self._last_data:
+            _LOGGER.info(
+                "Miner is reconfiguring; using cached data to prevent UI revert"
+            )
+            return self._last_data
+        raise UpdateFailed("Miner is busy and no cached data is available.")
+
+    def _merge_results(self, results: dict[str, Any]) -> dict[str, Any]:
+        """Merge fresh endpoint payloads into the cached data."""
+        details = results.get("miner/details")
+        constraints = results.get("configuration/constraints")
+        hashboards_raw = results.get("miner/hw/hashboards")
+        stats = results.get("miner/stats")
+        mode = results.get("performance/mode")
+        cooling = results.get("cooling/state")
+
         combined_data = {
             "details": details or self._last_data.get("details", {}),
             "constraints": constraints or self._last_data.get("constraints", {}),
@@ -177,8 +456,13 @@ class BraiinsAPI:
             "performance_mode": self._last_data.get("performance_mode"),
             "power_target": self._last_data.get("power_target"),  # From Cache
             "hashrate_target": self._last_data.get("hashrate_target"),  # From Cache
+            "snapshot": self._last_data.get("snapshot"),
         }
 
+        # Parse the telemetry once per update so entities only read fields
+        if hashboards_raw or stats or cooling or combined_data["snapshot"] is None:
+            combined_data["snapshot"] = MinerSnapshot.from_data(combined_data)
+
         if mode:
             try:
                 tuner_target = mode.get("tunermode", {}).get("target", {})
@@ -238,65 +522,41 @@ class BraiinsAPI:
         if not await self._is_token_valid_and_renew():
             return False
 
-        url = f"{self._base_url}/{endpoint}"
-        _LOGGER.debug(
-            "Sending %s request to %s with data: %s", method.upper(), url, data
-        )
+        token = self._token
         try:
-            async with asyncio.timeout(10):
-                async with self._session.request(
-                    method, url, headers=self._headers, json=data
-                ) as response:
-                    if response.status == 401:
-                        _LOGGER.info(
-                            "Token rejected by miner (401) for command, attempting re-login"
-                        )
-                        async with self._lock:
-                            if await self.async_relogin():
-                                _LOGGER.info(
-                                    "Re-login successful, retrying command for %s", url
-                                )
-                                async with self._session.request(
-                                    method, url, headers=self._headers, json=data
-                                ) as retry_response:
-                                    if retry_response.status == 422:
-                                        response_text = await retry_response.text()
-                                        _LOGGER.error(
-                                            "Unprocessable Entity on retry for %s. Miner Response: %s",
-                                            url,
-                                            response_text,
-                                        )
-                                    retry_response.raise_for_status()
-                                    _LOGGER.info(
-                                        "Successfully sent command to %s on retry", url
-                                    )
-                                    return True
-
-                            _LOGGER.error(
-                                "Re-login failed after 401, aborting command for %s",
-                                url,
-                            )
-                            return False
-
-                    if response.status == 422:
-                        response_text = await response.text()
-                        _LOGGER.error(
-                            "Unprocessable Entity for %s. Miner Response: %s",
-                            url,
-                            response_text,
-                        )
-                    response.raise_for_status()
-                    _LOGGER.info("Successfully sent command to %s", url)
-                    return True
-        except (TimeoutError, aiohttp.ClientError) as err:
-            _LOGGER.error("Failed to send command to %s: %s", url, err)
+            try:
+                await self._async_send(method, endpoint, token, data)
+            except BraiinsAuthError:
+                _LOGGER.info(
+                    "Token rejected by miner (401) for command, attempting re-login"
+                )
+                if not await self.async_renew_token(token):
+                    _LOGGER.error(
+                        "Re-login failed after 401, aborting command for %s", endpoint
+                    )
+                    return False
+
+                _LOGGER.info("Re-login successful, retrying command for %s", endpoint)
+                await self._async_send(method, endpoint, self._token, data)
+        except BraiinsCommandError as err:
+            _LOGGER.error(
+                "Unprocessable Entity for %s. Miner Response: %s", endpoint, err
+            )
+            return False
+        except (TimeoutError, aiohttp.ClientError, BraiinsTransportError) as err:
+            _LOGGER.error("Failed to send command to %s: %s", endpoint, err)
             return False
         except Exception as err:  # noqa: F841
             _LOGGER.exception(
-                "An unexpected error occurred while sending command to %s", url
+                "An unexpected error occurred while sending command to %s", endpoint
             )
             return False
 
+        _LOGGER.info("Successfully sent command to %s", endpoint)
+        self.invalidate_endpoints("performance/mode")
+        self.poll_policy.record_command()
+        return True
+
     async def set_hashrate_target(self, th: int) -> bool:
         """Set the miner hashrate target."""
         return await self._make_request(
@@ -364,4 +624,9 @@ class BraiinsAPI:
                 }
             }
 
-        return await self._make_request("put", "performance/mode", payload)
+        if not await self._make_request("put", "performance/mode", payload):
+            return False
+
+        # Tuner constraints depend on the active mode
+        self.invalidate_endpoints("configuration/constraints")
+        return True
@@ -11,6 +11,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .api import BraiinsAPI
+from .commands import BraiinsCommandQueue
 from .const import (
     CONF_HASHRATE_STEP,
     CONF_POWER_STEP,
@@ -31,14 +32,15 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][config_entry.entry_id]
     api = data["api"]
     coordinator = data["coordinator"]
+    commands = data["commands"]
 
     buttons = [
-        IncrementPowerButton(api, config_entry, coordinator),
-        DecrementPowerButton(api, config_entry, coordinator),
-        IncrementHashrateButton(api, config_entry, coordinator),
-        DecrementHashrateButton(api, config_entry, coordinator),
-        PauseMinerButton(api, config_entry, coordinator),
-        ResumeMinerButton(api, config_entry, coordinator),
+        IncrementPowerButton(api, config_entry, coordinator, commands),
+        DecrementPowerButton(api, config_entry, coordinator, commands),
+        IncrementHashrateButton(api, config_entry, coordinator, commands),
+        DecrementHashrateButton(api, config_entry, coordinator, commands),
+        PauseMinerButton(api, config_entry, coordinator, commands),
+        ResumeMinerButton(api, config_entry, coordinator, commands),
     ]
     async_add_entities(buttons)
 
@@ -46,27 +48,17 @@ async def async_setup_entry(
 class BraiinsButton(CoordinatorEntity, ButtonEntity):
     """Base button entity for a Braiins OS+ miner."""
 
-    def __init__(self, api, config_entry, coordinator) -> None:
+    def __init__(self, api, config_entry, coordinator, commands) -> None:
         """Initialize the base Braiins OS+ button."""
         super().__init__(coordinator)
         self._api = api
+        self._commands: BraiinsCommandQueue = commands
         self._config_entry = config_entry
         # self.coordinator = coordinator
         self._attr_has_entity_name = True
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for this miner."""
-        data = self.coordinator.data.get("details", {})
-        ident = data.get("miner_identity", {})
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._config_entry.entry_id)},
-            name=data.get("hostname")
-            or f"Braiins OS+ Miner ({self._config_entry.data['miner_ip']})",
-            manufacturer="Braiins",
-            model=ident.get("miner_model") or "Miner with Braiins OS+",
-            sw_version=data.get("bos_version", {}).get("current"),
+        # The device itself is registered once in __init__.py
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)}
         )
 
 
@@ -76,9 +68,11 @@ class IncrementPowerButton(BraiinsButton):
     _attr_name = "Increment Power Target"
     _attr_icon = "mdi:arrow-up-bold"
 
-    def __init__(self, api: BraiinsAPI, config_entry: ConfigEntry, coordinator) -> None:
+    def __init__(
+        self, api: BraiinsAPI, config_entry: ConfigEntry, coordinator, commands
+    ) -> None:
         """Initialize the increment power button."""
-        super().__init__(api, config_entry, coordinator)
+        super().__init__(api, config_entry, coordinator, commands)
         self._attr_unique_id = f"{config_entry.entry_id}_increment_power_target"
 
     @property
@@ -92,15 +86,8 @@ class IncrementPowerButton(BraiinsButton):
     async def async_press(self) -> None:
         """Handle the button press with dynamic step and Optimistic UI."""
         step = self._config_entry.options.get(CONF_POWER_STEP, DEFAULT_POWER_STEP)
-        success = await self._api.increment_power_target(step)
-
-        if success and self.coordinator.data:
-            current_watt = self.coordinator.data.get("power_target", 0)
-            new_watt = current_watt + step
-
-            new_data = dict(self.coordinator.data)
-            new_data["power_target"] = new_watt
-            self.coordinator.async_set_updated_data(new_data)
+        # Quick presses are merged into one power target change
+        self._commands.async_adjust("power_target", step)
 
 
 class DecrementPowerButton(BraiinsButton):
@@ -109,9 +96,11 @@ class DecrementPowerButton(BraiinsButton):
     _attr_name = "Decrement Power Target"
     _attr_icon = "mdi:arrow-down-bold"
 
-    def __init__(self, api: BraiinsAPI, config_entry: ConfigEntry, coordinator) -> None:
+    def __init__(
+        self, api: BraiinsAPI, config_entry: ConfigEntry, coordinator, commands
+    ) -> None:
         """Initialize the decrement power button."""
-        super().__init__(api, config_entry, coordinator)
+        super().__init__(api, config_entry, coordinator, commands)
         self._attr_unique_id = f"{config_entry.entry_id}_decrement_power_target"
 
     @property
@@ -125,15 +114,7 @@ class DecrementPowerButton(BraiinsButton):
     async def async_press(self) -> None:
         """Handle the button press with dynamic step and Optimistic UI."""
         step = self._config_entry.options.get(CONF_POWER_STEP, DEFAULT_POWER_STEP)
-        success = await self._api.decrement_power_target(step)
-
-        if success and self.coordinator.data:
-            current_watt = self.coordinator.data.get("power_target", 0)
-            new_watt = max(0, current_watt - step)
-
-            new_data = dict(self.coordinator.data)
-            new_data["power_target"] = new_watt
-            self.coordinator.async_set_updated_data(new_data)
+        self._commands.async_adjust("power_target", -step)
 
 
 class IncrementHashrateButton(BraiinsButton):
@@ -142,9 +123,9 @@ class IncrementHashrateButton(BraiinsButton):
     _attr_name = "Increment Hashrate Target"
     _attr_icon = "mdi:trending-up"
 
-    def __init__(self, api, config_entry, coordinator) -> None:
+    def __init__(self, api, config_entry, coordinator, commands) -> None:
         """Initialize the increment hashrate button."""
-        super().__init__(api, config_entry, coordinator)
+        super().__init__(api, config_entry, coordinator, commands)
         self._attr_unique_id = f"{config_entry.entry_id}_increment_hashrate_target"
 
     @property
@@ -160,12 +141,7 @@ class IncrementHashrateButton(BraiinsButton):
         step = int(
             self._config_entry.options.get(CONF_HASHRATE_STEP, DEFAULT_HASHRATE_STEP)
         )
-        success = await self._api.increment_hashrate_target(step)
-        if success and self.coordinator.data:
-            current = self.coordinator.data.get("hashrate_target", 0)
-            new_data = dict(self.coordinator.data)
-            new_data["hashrate_target"] = int(current + step)
-            self.coordinator.async_set_updated_data(new_data)
+        self._commands.async_adjust("hashrate_target", step)
 
 
 class DecrementHashrateButton(BraiinsButton):
@@ -174,9 +150,9 @@ class DecrementHashrateButton(BraiinsButton):
     _attr_name = "Decrement Hashrate Target"
     _attr_icon = "mdi:trending-down"
 
-    def __init__(self, api, config_entry, coordinator) -> None:
+    def __init__(self, api, config_entry, coordinator, commands) -> None:
         """Initialize the decrement hashrate button."""
-        super().__init__(api, config_entry, coordinator)
+        super().__init__(api, config_entry, coordinator, commands)
         self._attr_unique_id = f"{config_entry.entry_id}_decrement_hashrate_target"
 
     @property
@@ -192,12 +168,7 @@ class DecrementHashrateButton(BraiinsButton):
         step = int(
             self._config_entry.options.get(CONF_HASHRATE_STEP, DEFAULT_HASHRATE_STEP)
         )
-        success = await self._api.decrement_hashrate_target(step)
-        if success and self.coordinator.data:
-            current = self.coordinator.data.get("hashrate_target", 0)
-            new_data = dict(self.coordinator.data)
-            new_data["hashrate_target"] = int(max(0, current - step))
-            self.coordinator.async_set_updated_data(new_data)
+        self._commands.async_adjust("hashrate_target", -step)
 
 
 class PauseMinerButton(BraiinsButton):
@@ -206,14 +177,16 @@ class PauseMinerButton(BraiinsButton):
     _attr_name = "Pause Miner"
     _attr_icon = "mdi:pause"
 
-    def __init__(self, api: BraiinsAPI, config_entry: ConfigEntry, coordinator) -> None:
+    def __init__(
+        self, api: BraiinsAPI, config_entry: ConfigEntry, coordinator, commands
+    ) -> None:
         """Initialize the pause miner button."""
-        super().__init__(api, config_entry, coordinator)
+        super().__init__(api, config_entry, coordinator, commands)
         self._attr_unique_id = f"{config_entry.entry_id}_pause_miner"
 
     async def async_press(self) -> None:
         """Handle the button press to pause mining."""
-        await self._api.pause_mining()
+        await self._commands.async_run(self._api.pause_mining)
 
 
 class ResumeMinerButton(BraiinsButton):
@@ -222,11 +195,13 @@ class ResumeMinerButton(BraiinsButton):
     _attr_name = "Resume Miner"
     _attr_icon = "mdi:play"
 
-    def __init__(self, api: BraiinsAPI, config_entry: ConfigEntry, coordinator) -> None:
+    def __init__(
+        self, api: BraiinsAPI, config_entry: ConfigEntry, coordinator, commands
+    ) -> None:
         """Initialize the resume miner button."""
-        super().__init__(api, config_entry, coordinator)
+        super().__init__(api, config_entry, coordinator, commands)
         self._attr_unique_id = f"{config_entry.entry_id}_resume_miner"
 
     async def async_press(self) -> None:
         """Handle the button press to resume mining."""
-        await self._api.resume_mining()
+        await self._commands.async_run(self._api.resume_mining)
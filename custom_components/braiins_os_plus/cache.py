@@ -0,0 +1,59 @@
+# custom_components/braiins_os_plus/cache.py
+"""On-disk cache of the last good miner data."""
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY, STORAGE_VERSION
+
+# Keys of the coordinator data that are persisted; the rest is derived
+_PERSISTED_KEYS = (
+    "details",
+    "constraints",
+    "cooling",
+    "hashboards",
+    "stats",
+    "performance_mode",
+    "power_target",
+    "hashrate_target",
+)
+
+
+class BraiinsSnapshotCache:
+    """Persist the coordinator data so entities can be set up from it on boot."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._data: dict[str, Any] | None = None
+        self._save_pending = False
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Return the data saved by a previous run, if any."""
+        return await self._store.async_load()
+
+    @callback
+    def async_schedule_save(self, data: dict[str, Any]) -> None:
+        """Save the data at most once per save delay.
+
+        The latest data is what gets written, and a pending save is flushed
+        when Home Assistant stops.
+        """
+        self._data = data
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Delete the cache file."""
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the JSON-serializable part of the latest data."""
+        self._save_pending = False
+        return {key: self._data.get(key) for key in _PERSISTED_KEYS}
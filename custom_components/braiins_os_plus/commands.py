@@ -0,0 +1,259 @@
+# custom_components/braiins_os_plus/commands.py
+"""Per-miner command queue that coalesces target adjustments."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .api import BraiinsAPI
+from .const import COMMAND_COALESCE_WINDOW
+
+_LOGGER = logging.getLogger(__name__)
+
+# Target key in the coordinator data -> constraint path to its min/max value
+_TARGET_LIMITS = {
+    "power_target": ("power_target", "watt"),
+    "hashrate_target": ("hashrate_target", "terahash_per_second"),
+}
+
+
+@dataclass(slots=True)
+class _PendingAdjustment:
+    """Net adjustment of one target that has not been sent yet."""
+
+    base: int | None
+    delta: int
+    timer: asyncio.TimerHandle | None = None
+
+
+@dataclass(slots=True)
+class _OptimisticValue:
+    """Value shown by the entities until the miner reports the change."""
+
+    value: Any
+    # What the coordinator reported when the value was set
+    reported: Any
+    # Coordinator updates seen since the command was sent, None while it is not
+    updates: int | None = None
+
+
+class BraiinsCommandQueue:
+    """Send a miner's commands one at a time, merging quick target steps.
+
+    Every target change restarts the miner's tuner, so a burst of increment and
+    decrement presses is held for a short window and sent as a single absolute
+    target with the net value. Commands run in the order they were issued: any
+    other command first sends the adjustments still pending, except an absolute
+    target, which replaces the pending adjustment of that same target.
+
+    New values are shown as soon as they are issued, without touching the
+    coordinator data: the entities read them through ``value`` until a poll
+    reports what the miner did, so nothing the miner has not confirmed reaches
+    the snapshot cache, the efficiency curve or the history.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, api: BraiinsAPI, coordinator: DataUpdateCoordinator
+    ) -> None:
+        """Initialize the command queue."""
+        self._hass = hass
+        self._api = api
+        self._coordinator = coordinator
+        self._lock = asyncio.Lock()
+        self._pending: dict[str, _PendingAdjustment] = {}
+        self._optimistic: dict[str, _OptimisticValue] = {}
+        self._listeners: list[Callable[[], None]] = []
+
+    def value(self, key: str) -> Any:
+        """Return a value of the coordinator data, or the one last issued."""
+        if (optimistic := self._optimistic.get(key)) is not None:
+            return optimistic.value
+        return (self._coordinator.data or {}).get(key)
+
+    def add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Call ``update_callback`` when a shown value changes; return how to stop."""
+        self._listeners.append(update_callback)
+        return lambda: self._listeners.remove(update_callback)
+
+    @callback
+    def async_set_optimistic(self, values: dict[str, Any], sent: bool = True) -> None:
+        """Show new values before the miner reports them.
+
+        ``sent`` is False while the command carrying them is still held back.
+        """
+        data = self._coordinator.data or {}
+        for key, value in values.items():
+            previous = self._optimistic.get(key)
+            self._optimistic[key] = _OptimisticValue(
+                value,
+                previous.reported if previous is not None else data.get(key),
+                0 if sent else None,
+            )
+        self._async_notify()
+
+    @callback
+    def async_handle_coordinator_update(self) -> None:
+        """Drop the values the miner has reported on since they were sent.
+
+        A poll that was already running when a command went out may still
+        carry the old value, so a value the miner neither confirmed nor moved
+        away from is kept for one more update. The entities write their state
+        right after this, as the coordinator calls them too.
+        """
+        data = self._coordinator.data or {}
+        for key, optimistic in list(self._optimistic.items()):
+            if optimistic.updates is None:
+                continue
+            optimistic.updates += 1
+            reported = data.get(key)
+            if (
+                reported == optimistic.value
+                or reported != optimistic.reported
+                or optimistic.updates > 1
+            ):
+                del self._optimistic[key]
+
+    @callback
+    def async_adjust(self, key: str, delta: int) -> None:
+        """Queue a relative change of ``power_target`` or ``hashrate_target``.
+
+        The new value shows up right away; the command itself is sent once no
+        further adjustment of the same target arrived for the coalesce window.
+        """
+        if (pending := self._pending.get(key)) is None:
+            current = self.value(key)
+            pending = self._pending[key] = _PendingAdjustment(
+                base=int(current) if current is not None else None, delta=0
+            )
+        elif pending.timer is not None:
+            pending.timer.cancel()
+
+        if pending.base is not None:
+            # Keep the net value within what the miner accepts
+            low, high = self._limits(key)
+            value = int(min(max(pending.base + pending.delta + delta, low), high))
+            pending.delta = value - pending.base
+            self.async_set_optimistic({key: value}, sent=False)
+        else:
+            pending.delta += delta
+
+        pending.timer = self._hass.loop.call_later(
+            COMMAND_COALESCE_WINDOW, self._async_dispatch, key
+        )
+
+    async def async_run(
+        self, command: Callable[[], Awaitable[bool]], replaces: str | None = None
+    ) -> bool:
+        """Run a command after everything queued before it.
+
+        ``replaces`` names a target whose pending adjustment the command makes
+        obsolete.
+        """
+        if replaces is not None and (pending := self._pending.pop(replaces, None)):
+            if pending.timer is not None:
+                pending.timer.cancel()
+            self._async_drop_optimistic(replaces)
+        await self.async_flush()
+        async with self._lock:
+            return await command()
+
+    async def async_set_power_target(self, watt: int) -> bool:
+        """Set the power target, switching to Power Target mode if needed."""
+        if self.value("performance_mode") == "Power Target":
+            success = await self.async_run(
+                lambda: self._api.set_power_target(watt), replaces="power_target"
+            )
+        else:
+            success = await self.async_run(
+                lambda: self._api.set_performance_mode("Power Target", watt)
+            )
+
+        if success:
+            self.async_set_optimistic(
+                {"performance_mode": "Power Target", "power_target": watt}
+            )
+        return success
+
+    async def async_flush(self) -> None:
+        """Send every pending adjustment now."""
+        for key in list(self._pending):
+            await self._async_send(key)
+
+    @callback
+    def _async_dispatch(self, key: str) -> None:
+        """Send an adjustment once its coalesce window has passed."""
+        if (pending := self._pending.get(key)) is None:
+            return
+        pending.timer = None
+        self._hass.async_create_background_task(
+            self._async_send(key), f"{self._coordinator.name} {key} command"
+        )
+
+    async def _async_send(self, key: str) -> None:
+        """Send the net value of a pending adjustment."""
+        if (pending := self._pending.pop(key, None)) is None:
+            return
+        if pending.timer is not None:
+            pending.timer.cancel()
+        if not pending.delta:
+            self._async_drop_optimistic(key)
+            return
+
+        _LOGGER.debug("Sending coalesced %s change of %+d", key, pending.delta)
+        async with self._lock:
+            if pending.base is None:
+                # The current target is unknown; fall back to a relative step
+                success = await self._async_send_relative(key, pending.delta)
+            elif key == "power_target":
+                success = await self._api.set_power_target(pending.base + pending.delta)
+            else:
+                success = await self._api.set_hashrate_target(
+                    pending.base + pending.delta
+                )
+
+        if key in self._pending:
+            # Newer presses are pending on top; they keep showing their value
+            return
+        if success and pending.base is not None:
+            self.async_set_optimistic({key: pending.base + pending.delta})
+        else:
+            # Show the miner's value again
+            self._async_drop_optimistic(key)
+
+    async def _async_send_relative(self, key: str, delta: int) -> bool:
+        """Send a net adjustment as a single increment or decrement."""
+        if key == "power_target":
+            if delta > 0:
+                return await self._api.increment_power_target(delta)
+            return await self._api.decrement_power_target(-delta)
+        if delta > 0:
+            return await self._api.increment_hashrate_target(delta)
+        return await self._api.decrement_hashrate_target(-delta)
+
+    def _limits(self, key: str) -> tuple[float, float]:
+        """Return the lowest and highest value the miner accepts for a target."""
+        constraint, unit = _TARGET_LIMITS[key]
+        try:
+            limits = (self._coordinator.data or {})["constraints"]["tuner_constraints"][
+                constraint
+            ]
+            return float(limits["min"][unit]), float(limits["max"][unit])
+        except KeyError, TypeError, ValueError:
+            return 0.0, float("inf")
+
+    @callback
+    def _async_drop_optimistic(self, key: str) -> None:
+        """Stop showing the value issued for ``key``."""
+        if self._optimistic.pop(key, None) is not None:
+            self._async_notify()
+
+    @callback
+    def _async_notify(self) -> None:
+        """Let the entities write the values they show."""
+        for update_callback in list(self._listeners):
+            update_callback()
@@ -8,11 +8,35 @@ import time  # Import the time library
 
 from homeassistant import config_entries
 from homeassistant.core import callback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from .const import DOMAIN
+from homeassistant.helpers import config_validation as cv, selector
+from .const import (
+    CONF_DETAILED_TELEMETRY,
+    CONF_ENTRY_TYPE,
+    CONF_HASHRATE_WINDOWS,
+    CONF_HOT_CHIP_THRESHOLD,
+    CONF_POWER_BUDGET_ENTITY,
+    CONF_TOKEN_REFRESH_FRACTION,
+    CONF_TRANSPORT,
+    DEFAULT_DETAILED_TELEMETRY,
+    DEFAULT_HASHRATE_WINDOWS,
+    DEFAULT_HOT_CHIP_THRESHOLD,
+    DEFAULT_TOKEN_REFRESH_FRACTION,
+    DEFAULT_TRANSPORT,
+    DOMAIN,
+    ENTRY_TYPE_SITE,
+    HASHRATE_WINDOWS,
+    THROTTLE_GROUPS,
+    TRANSPORTS,
+)
+from .transport import BraiinsAuthError, BraiinsTransportError, create_transport
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entities that can hold the site power budget, in W or kW
+BUDGET_ENTITY_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain=["input_number", "number", "sensor"])
+)
+
 class BraiinsOSPlusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Braiins OS+ config flow."""
 
@@ -20,71 +44,92 @@ class BraiinsOSPlusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_user(self, user_input=None):
         """Handle a flow initiated by the user."""
+        return self.async_show_menu(step_id="user", menu_options=["miner", "site"])
+
+    async def async_step_site(self, user_input=None):
+        """Set up the site power budget, once for all miners."""
+        if any(
+            entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_SITE
+            for entry in self._async_current_entries()
+        ):
+            return self.async_abort(reason="site_already_configured")
+
+        if user_input is not None:
+            return self.async_create_entry(
+                title="Site power budget",
+                data={CONF_ENTRY_TYPE: ENTRY_TYPE_SITE},
+                options=user_input,
+            )
+
+        return self.async_show_form(
+            step_id="site",
+            data_schema=vol.Schema(
+                {vol.Required(CONF_POWER_BUDGET_ENTITY): BUDGET_ENTITY_SELECTOR}
+            ),
+        )
+
+    async def async_step_miner(self, user_input=None):
+        """Add a miner."""
         errors = {}
 
         if user_input is not None:
             miner_ip = user_input["miner_ip"]
             username = user_input["username"]
             password = user_input.get("password")
+            transport_kind = user_input.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)
 
             if not username:
                 errors["base"] = "missing_info"
             else:
+                # Log in over the selected API, so a wrong choice fails here
+                transport = create_transport(transport_kind, miner_ip)
                 try:
-                    url = f"http://{miner_ip}/api/v1/auth/login"
-                    payload = {"username": username, "password": password or ""}
-                    session = async_get_clientsession(self.hass)
-
                     async with asyncio.timeout(10):
-                        async with session.post(url, json=payload) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                token = data.get("token")
-                                timeout_s = data.get("timeout_s", 3600)
-
-                                # Calculate the expiration time (with a 60-second buffer)
-                                expires_at = time.time() + timeout_s - 60
-
-                                await self.async_set_unique_id(miner_ip)
-                                self._abort_if_unique_id_configured()
-
-                                # ### THE FIX IS HERE ###
-                                # Store everything needed for re-authentication
-                                return self.async_create_entry(
-                                    title=miner_ip,
-                                    data={
-                                        "miner_ip": miner_ip,
-                                        "username": username,
-                                        "password": password or "",
-                                        "token": token,
-                                        "expires_at": expires_at,
-                                    },
-                                )
-                            elif response.status == 401:
-                                errors["base"] = "invalid_auth"
-                            else:
-                                response_text = await response.text()
-                                _LOGGER.warning(
-                                    "Login failed with status code %s: %s",
-                                    response.status,
-                                    response_text,
-                                )
-                                errors["base"] = "cannot_connect"
-
-                except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                        data = await transport.async_login(username, password or "")
+                except BraiinsAuthError:
+                    errors["base"] = "invalid_auth"
+                except (aiohttp.ClientError, asyncio.TimeoutError, BraiinsTransportError) as err:
                     _LOGGER.error("Failed to connect to miner at %s: %s", miner_ip, err)
                     errors["base"] = "cannot_connect"
                 except Exception:
                     _LOGGER.exception("An unexpected error occurred")
                     errors["base"] = "unknown"
+                else:
+                    token = data.get("token")
+                    timeout_s = data.get("timeout_s", 3600)
+
+                    # Calculate the expiration time (with a 60-second buffer)
+                    expires_at = time.time() + timeout_s - 60
+
+                    await self.async_set_unique_id(miner_ip)
+                    self._abort_if_unique_id_configured()
+
+                    # ### THE FIX IS HERE ###
+                    # Store everything needed for re-authentication
+                    return self.async_create_entry(
+                        title=miner_ip,
+                        data={
+                            "miner_ip": miner_ip,
+                            "username": username,
+                            "password": password or "",
+                            "token": token,
+                            "expires_at": expires_at,
+                            CONF_TRANSPORT: transport_kind,
+                        },
+                    )
+                finally:
+                    await transport.async_close()
 
         return self.async_show_form(
-            step_id="user",
+            step_id="miner",
             data_schema=vol.Schema(
                 {
                     vol.Required("miner_ip"): str,
                     vol.Required("username"): str,
                     vol.Optional("password"): str,
+                    vol.Optional(CONF_TRANSPORT, default=DEFAULT_TRANSPORT): vol.In(
+                        TRANSPORTS
+                    ),
                 }
             ),
             errors=errors,
@@ -93,11 +138,75 @@ class BraiinsOSPlusConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
-        return OptionsFlowHandler(config_entry)
+        if config_entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_SITE:
+            return SiteOptionsFlowHandler()
+        return OptionsFlowHandler()
+
+class SiteOptionsFlowHandler(config_entries.OptionsFlow):
+    """Site power budget options flow."""
+
+    async def async_step_init(self, user_input=None):
+        """Choose the entity holding the power budget."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_POWER_BUDGET_ENTITY,
+                        default=self.config_entry.options.get(CONF_POWER_BUDGET_ENTITY),
+                    ): BUDGET_ENTITY_SELECTOR,
+                }
+            ),
+        )
 
 class OptionsFlowHandler(config_entries.OptionsFlow):
-    def __init__(self, config_entry):
-        self.config_entry = config_entry
+    """Braiins OS+ options flow."""
 
     async def async_step_init(self, user_input=None):
-        return self.async_create_entry(title="", data={})
\ No newline at end of file
+        """Choose the optional sensors, sensor write rates and token renewal."""
+        if user_input is not None:
+            # Keep the options set from the entities, like the adjustment steps
+            return self.async_create_entry(
+                title="", data={**self.config_entry.options, **user_input}
+            )
+
+        options = self.config_entry.options
+        schema = {
+            vol.Optional(
+                CONF_HASHRATE_WINDOWS,
+                default=options.get(CONF_HASHRATE_WINDOWS, DEFAULT_HASHRATE_WINDOWS),
+            ): cv.multi_select({window: window for window in HASHRATE_WINDOWS}),
+            vol.Optional(
+                CONF_DETAILED_TELEMETRY,
+                default=options.get(CONF_DETAILED_TELEMETRY, DEFAULT_DETAILED_TELEMETRY),
+            ): bool,
+            vol.Optional(
+                CONF_HOT_CHIP_THRESHOLD,
+                default=options.get(CONF_HOT_CHIP_THRESHOLD, DEFAULT_HOT_CHIP_THRESHOLD),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=150)),
+            vol.Optional(
+                CONF_TOKEN_REFRESH_FRACTION,
+                default=options.get(
+                    CONF_TOKEN_REFRESH_FRACTION, DEFAULT_TOKEN_REFRESH_FRACTION
+                ),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=0.95)),
+        }
+        # Deadband and minimum write interval of every sensor group
+        for group, (deadband, min_interval) in THROTTLE_GROUPS.items():
+            schema[
+                vol.Optional(
+                    f"{group}_deadband",
+                    default=options.get(f"{group}_deadband", deadband),
+                )
+            ] = vol.All(vol.Coerce(float), vol.Range(min=0))
+            schema[
+                vol.Optional(
+                    f"{group}_min_interval",
+                    default=options.get(f"{group}_min_interval", min_interval),
+                )
+            ] = vol.All(vol.Coerce(int), vol.Range(min=0, max=3600))
+
+        return self.async_show_form(step_id="init", data_schema=vol.Schema(schema))
\ No newline at end of file
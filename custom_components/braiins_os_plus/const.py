@@ -10,3 +10,119 @@ DEFAULT_POWER_STEP = 250
 
 CONF_HASHRATE_STEP = "hashrate_step"
 DEFAULT_HASHRATE_STEP = 10
+
+# Fleet-wide polling
+DATA_FLEET = f"{DOMAIN}_fleet"
+POLL_INTERVAL = 5
+MAX_CONCURRENT_REQUESTS = 32
+
+# Transport used to reach the miner
+CONF_TRANSPORT = "transport"
+DEFAULT_TRANSPORT = "rest"
+TRANSPORTS = ("rest", "grpc")
+# Port of the gRPC API when the host does not name one
+GRPC_PORT = 50051
+
+# On-disk cache of the last good data
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60
+
+# Adaptive polling
+MIN_POLL_INTERVAL = 2
+MAX_POLL_INTERVAL = 30
+POLL_BACKOFF_FACTOR = 1.5
+COMMAND_FAST_POLL_WINDOW = 60
+# Relative hashrate change and absolute chip temperature change (°C) between
+# two polls above which the miner is considered to be ramping
+HASHRATE_CHANGE_THRESHOLD = 0.05
+TEMPERATURE_CHANGE_THRESHOLD = 1.0
+
+# Proactive token refresh. The token is renewed in the background once this
+# fraction of its lifetime has passed, minus up to TOKEN_REFRESH_JITTER of it so
+# miners set up together do not log in at the same moment. Tokens that are
+# already stale are renewed within TOKEN_REFRESH_JITTER of the default lifetime.
+CONF_TOKEN_REFRESH_FRACTION = "token_refresh_fraction"
+DEFAULT_TOKEN_REFRESH_FRACTION = 0.75
+TOKEN_REFRESH_JITTER = 0.1
+# Lifetime of a token when the miner does not say
+DEFAULT_TOKEN_LIFETIME = 3600
+TOKEN_REFRESH_RETRY_DELAY = 30
+# Minimum time between two writes of a renewed token to the config entry
+TOKEN_PERSIST_INTERVAL = 6 * 3600
+
+# Increment/decrement presses of the same target within this many seconds of
+# each other are sent to the miner as a single command
+COMMAND_COALESCE_WINDOW = 1.5
+
+# Miners commanded at once by the fleet-wide services and the site controller
+BULK_COMMAND_CONCURRENCY = 16
+
+# Site power budget, set up as its own config entry. Watts are handed out in
+# POWER_ALLOCATION_STEP slices, and the budget entity is re-applied at most once
+# per SITE_BUDGET_COOLDOWN seconds.
+CONF_ENTRY_TYPE = "entry_type"
+ENTRY_TYPE_SITE = "site"
+CONF_POWER_BUDGET_ENTITY = "power_budget_entity"
+DATA_SITE_CONTROLLER = f"{DOMAIN}_site_controller"
+POWER_ALLOCATION_STEP = 50
+SITE_BUDGET_COOLDOWN = 30
+
+# Efficiency curve learning. Samples are taken once a power target has been
+# held for EFFICIENCY_SETTLE_TIME seconds, in EFFICIENCY_CURVE_BIN_W wide bins
+# of EFFICIENCY_CURVE_SAMPLES samples each, keeping at most
+# EFFICIENCY_CURVE_MAX_BINS bins per miner.
+EFFICIENCY_SETTLE_TIME = 300
+EFFICIENCY_CURVE_BIN_W = 50
+EFFICIENCY_CURVE_SAMPLES = 32
+EFFICIENCY_CURVE_MAX_BINS = 64
+
+# Rolling statistics kept in memory, over windows in seconds. One sample is
+# kept per HISTORY_SAMPLE_INTERVAL seconds.
+HISTORY_SAMPLE_INTERVAL = 10
+ROLLING_WINDOWS = (60, 900, 3600)
+
+# Hashrate averages computed by the miner: option value -> payload key. Only
+# the windows enabled in the options get sensors.
+CONF_HASHRATE_WINDOWS = "hashrate_windows"
+HASHRATE_WINDOWS = {
+    "1m": "last_1m",
+    "5m": "last_5m",
+    "15m": "last_15m",
+    "24h": "last_24h",
+}
+DEFAULT_HASHRATE_WINDOWS = ["15m"]
+
+# Sensor state write throttling per group: default deadband (in the sensors'
+# unit) and default minimum interval between two writes (seconds). Both can be
+# changed from the options as "<group>_deadband" and "<group>_min_interval".
+THROTTLE_GROUPS = {
+    "hashrate": (0.5, 0),
+    "power": (10, 0),
+    "efficiency": (0.1, 0),
+    "temperature": (0.5, 0),
+    "fan_speed": (100, 0),
+}
+
+# Opt-in sensor counting the voltage domains whose chips run hotter than the
+# threshold (°C)
+CONF_DETAILED_TELEMETRY = "detailed_telemetry"
+DEFAULT_DETAILED_TELEMETRY = False
+CONF_HOT_CHIP_THRESHOLD = "hot_chip_threshold"
+DEFAULT_HOT_CHIP_THRESHOLD = 85
+
+# Pipeline instrumentation: upper bounds (ms) of the latency histogram buckets;
+# slower requests fall in a last, open-ended bucket.
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Request timeouts, split so a poll that times out still fits in POLL_INTERVAL:
+# establishing the connection, then waiting for each chunk of the response.
+CONNECT_TIMEOUT = 2
+READ_TIMEOUT = 3
+
+# Circuit breaker. After CIRCUIT_BREAKER_THRESHOLD polls in a row got no answer
+# at all, only CIRCUIT_PROBE_ENDPOINT is fetched, with a delay doubling from
+# POLL_INTERVAL up to CIRCUIT_MAX_PROBE_INTERVAL, until the miner answers. The
+# probe is an endpoint that still answers while the miner is reconfiguring.
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_PROBE_ENDPOINT = "miner/details"
+CIRCUIT_MAX_PROBE_INTERVAL = 300
@@ -0,0 +1,152 @@
+# custom_components/braiins_os_plus/controller.py
+"""Site controller that keeps the fleet within a power budget."""
+
+import asyncio
+import logging
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN, UnitOfPower
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.start import async_at_started
+
+from .allocator import PowerBudgetAllocator, build_power_profiles
+from .const import (
+    BULK_COMMAND_CONCURRENCY,
+    DOMAIN,
+    POWER_ALLOCATION_STEP,
+    SITE_BUDGET_COOLDOWN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BraiinsSiteController:
+    """Split the power budget held by an entity across every loaded miner.
+
+    The budget is re-solved whenever the entity changes, at most once per
+    cooldown, and only miners whose target moves by at least one allocation
+    step are sent a command.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        """Initialize the site controller."""
+        self._hass = hass
+        self._entity_id = entity_id
+        self._allocator = PowerBudgetAllocator()
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=SITE_BUDGET_COOLDOWN,
+            immediate=True,
+            function=self._async_apply_budget,
+        )
+        self._unsub: list = []
+        self.budget: float | None = None
+        self.targets: dict[str, int] = {}
+
+    @callback
+    def async_start(self) -> None:
+        """Follow the budget entity, starting once Home Assistant is up."""
+        self._unsub = [
+            async_track_state_change_event(
+                self._hass, [self._entity_id], self._async_on_budget_change
+            ),
+            async_at_started(self._hass, self._async_on_started),
+        ]
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the budget entity."""
+        for unsub in self._unsub:
+            unsub()
+        self._unsub = []
+        self._debouncer.async_cancel()
+
+    @callback
+    def _async_on_started(self, _hass: HomeAssistant) -> None:
+        """Apply the budget the entity holds at startup."""
+        self._debouncer.async_schedule_call()
+
+    @callback
+    def _async_on_budget_change(self, event: Event[EventStateChangedData]) -> None:
+        """Re-solve when the budget changes."""
+        self._debouncer.async_schedule_call()
+
+    def _read_budget(self) -> float | None:
+        """Return the budget in watts, or None if the entity has no usable value."""
+        state = self._hass.states.get(self._entity_id)
+        if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return None
+        try:
+            budget = float(state.state)
+        except ValueError:
+            _LOGGER.warning(
+                "Power budget %s is not a number: %s", self._entity_id, state.state
+            )
+            return None
+        if state.attributes.get("unit_of_measurement") == UnitOfPower.KILO_WATT:
+            budget *= 1000
+        return budget
+
+    async def _async_apply_budget(self) -> None:
+        """Solve the allocation and send the targets that changed."""
+        if (budget := self._read_budget()) is None:
+            return
+        miners = dict(self._hass.data.get(DOMAIN, {}))
+        if not miners:
+            return
+
+        profiles = build_power_profiles(
+            {
+                entry_id: domain_data["coordinator"].data
+                for entry_id, domain_data in miners.items()
+            },
+            {
+                entry_id: domain_data["efficiency"]
+                for entry_id, domain_data in miners.items()
+            },
+        )
+        if budget < sum(profile.min_w for profile in profiles):
+            _LOGGER.warning(
+                "Power budget of %.0f W is below the fleet's minimum; "
+                "running every miner at its lowest power target",
+                budget,
+            )
+        self.budget = budget
+        self.targets = self._allocator.solve(budget, profiles)
+
+        changes = {}
+        for entry_id, watt in self.targets.items():
+            # Compare with the targets already issued, not only the polled ones
+            commands = miners[entry_id]["commands"]
+            if (
+                commands.value("performance_mode") != "Power Target"
+                or abs((commands.value("power_target") or 0) - watt)
+                >= POWER_ALLOCATION_STEP
+            ):
+                changes[entry_id] = watt
+        if not changes:
+            return
+
+        _LOGGER.debug(
+            "Applying a %.0f W budget, changing %d of %d miners",
+            budget,
+            len(changes),
+            len(self.targets),
+        )
+        semaphore = asyncio.Semaphore(BULK_COMMAND_CONCURRENCY)
+
+        async def _async_apply(entry_id: str, watt: int) -> bool:
+            async with semaphore:
+                return await miners[entry_id]["commands"].async_set_power_target(watt)
+
+        results = await asyncio.gather(
+            *(_async_apply(entry_id, watt) for entry_id, watt in changes.items())
+        )
+        if failed := results.count(False):
+            _LOGGER.warning(
+                "Failed to apply the power budget to %d of %d miners",
+                failed,
+                len(changes),
+            )
@@ -0,0 +1,57 @@
+# custom_components/braiins_os_plus/diagnostics.py
+"""Diagnostics support for Braiins OS+."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_ENTRY_TYPE, DATA_SITE_CONTROLLER, DOMAIN, ENTRY_TYPE_SITE
+
+TO_REDACT = {
+    "username",
+    "password",
+    "token",
+    "mac_address",
+    "serial_number",
+    "hostname",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_SITE:
+        controller = hass.data[DATA_SITE_CONTROLLER]
+        return {
+            "entry": {"options": dict(entry.options)},
+            "budget": controller.budget,
+            "targets": controller.targets,
+        }
+
+    domain_data = hass.data[DOMAIN][entry.entry_id]
+    api = domain_data["api"]
+    coordinator = domain_data["coordinator"]
+    data = coordinator.data or {}
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "last_exception": repr(coordinator.last_exception)
+            if coordinator.last_exception
+            else None,
+            "poll_interval": api.poll_policy.interval,
+        },
+        "metrics": api.metrics.as_dict(),
+        # The parsed snapshot is derived from the payloads and left out
+        "data": async_redact_data(
+            {key: value for key, value in data.items() if key != "snapshot"},
+            TO_REDACT,
+        ),
+    }
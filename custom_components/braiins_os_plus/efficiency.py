@@ -0,0 +1,142 @@
+# custom_components/braiins_os_plus/efficiency.py
+"""Online model of a miner's hashrate versus its power target."""
+
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+from homeassistant.core import callback
+
+from .const import (
+    EFFICIENCY_CURVE_BIN_W,
+    EFFICIENCY_CURVE_MAX_BINS,
+    EFFICIENCY_CURVE_SAMPLES,
+    EFFICIENCY_SETTLE_TIME,
+)
+
+
+def interpolate_hashrate(
+    points: list[tuple[float, float]] | tuple[tuple[float, float], ...], watt: float
+) -> float:
+    """Return the hashrate at ``watt`` from (power W, hashrate TH/s) points.
+
+    Between points the curve is interpolated linearly; outside of them the
+    efficiency of the nearest point is assumed.
+    """
+    index = bisect_left(points, (watt,))
+    if index == 0:
+        near_w, near_ths = points[0]
+        return watt * near_ths / near_w
+    if index == len(points):
+        near_w, near_ths = points[-1]
+        return watt * near_ths / near_w
+    (low_w, low_ths), (high_w, high_ths) = points[index - 1], points[index]
+    return low_ths + (high_ths - low_ths) * (watt - low_w) / (high_w - low_w)
+
+
+@dataclass(slots=True)
+class _CurveBin:
+    """Recent steady-state samples taken at one power target."""
+
+    hashrate: deque[float] = field(
+        default_factory=lambda: deque(maxlen=EFFICIENCY_CURVE_SAMPLES)
+    )
+    consumption: deque[float] = field(
+        default_factory=lambda: deque(maxlen=EFFICIENCY_CURVE_SAMPLES)
+    )
+
+
+class EfficiencyCurve:
+    """Learn how much hashrate a miner delivers at each power target.
+
+    Samples are only taken in Power Target mode, once the target has been
+    left alone for EFFICIENCY_SETTLE_TIME so the tuner had time to settle.
+    They are grouped in EFFICIENCY_CURVE_BIN_W wide bins, each keeping its last
+    EFFICIENCY_CURVE_SAMPLES samples; past EFFICIENCY_CURVE_MAX_BINS bins the
+    least recently sampled one is dropped, so memory per miner is bounded.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty curve."""
+        self._bins: dict[int, _CurveBin] = {}
+        self._target: float | None = None
+        self._target_since = 0.0
+        self._points: list[tuple[float, float]] | None = None
+
+    @callback
+    def async_add_sample(self, data: dict[str, Any]) -> None:
+        """Record the miner's current operating point, if it is steady."""
+        target = data.get("power_target")
+        if (
+            data.get("performance_mode") != "Power Target"
+            or target is None
+            or target <= 0
+        ):
+            self._target = None
+            return
+
+        now = time.monotonic()
+        if target != self._target:
+            self._target = target
+            self._target_since = now
+            return
+        if now - self._target_since < EFFICIENCY_SETTLE_TIME:
+            return
+
+        snapshot = data.get("snapshot")
+        if snapshot is None or not snapshot.total_hashrate_ths:
+            return
+
+        key = round(target / EFFICIENCY_CURVE_BIN_W) * EFFICIENCY_CURVE_BIN_W
+        if (curve_bin := self._bins.pop(key, None)) is None:
+            curve_bin = _CurveBin()
+            if len(self._bins) >= EFFICIENCY_CURVE_MAX_BINS:
+                del self._bins[next(iter(self._bins))]
+        # Re-inserted so the dict stays ordered by last sample
+        self._bins[key] = curve_bin
+        curve_bin.hashrate.append(snapshot.total_hashrate_ths)
+        if snapshot.consumption_w:
+            curve_bin.consumption.append(snapshot.consumption_w)
+        self._points = None
+
+    @property
+    def points(self) -> list[tuple[float, float]]:
+        """Return the learned (power target W, hashrate TH/s) points, by power."""
+        if self._points is None:
+            self._points = sorted(
+                (float(key), sum(curve_bin.hashrate) / len(curve_bin.hashrate))
+                for key, curve_bin in self._bins.items()
+            )
+        return self._points
+
+    def predict(self, watt: float) -> float | None:
+        """Return the expected hashrate at a power target, or None if unknown."""
+        if not (points := self.points):
+            return None
+        return interpolate_hashrate(points, watt)
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the curve as JSON-serializable points."""
+        result = []
+        for key in sorted(self._bins):
+            curve_bin = self._bins[key]
+            hashrate = sum(curve_bin.hashrate) / len(curve_bin.hashrate)
+            consumption = (
+                sum(curve_bin.consumption) / len(curve_bin.consumption)
+                if curve_bin.consumption
+                else None
+            )
+            result.append(
+                {
+                    "power_target": key,
+                    "hashrate_ths": round(hashrate, 2),
+                    "consumption_w": round(consumption) if consumption else None,
+                    "efficiency_jth": (
+                        round(consumption / hashrate, 2) if consumption else None
+                    ),
+                    "samples": len(curve_bin.hashrate),
+                }
+            )
+        return result
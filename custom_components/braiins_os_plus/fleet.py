@@ -0,0 +1,151 @@
+# custom_components/braiins_os_plus/fleet.py
+"""Fleet-level poller that schedules updates for every configured miner."""
+
+import asyncio
+from dataclasses import dataclass
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .polling import AdaptivePollInterval
+
+_LOGGER = logging.getLogger(__name__)
+
+# Fractional part of the golden ratio; successive multiples of it are spread
+# evenly over [0, 1) no matter how many miners are added.
+_PHASE_STEP = 0.6180339887498949
+
+
+@dataclass(slots=True)
+class _FleetMember:
+    """Scheduling state for a single miner."""
+
+    coordinator: DataUpdateCoordinator
+    policy: AdaptivePollInterval
+    next_due: float
+    last_started: float
+    timer: asyncio.TimerHandle | None = None
+    task: asyncio.Task | None = None
+
+
+class BraiinsFleetPoller:
+    """Poll many miners from one scheduler with bounded concurrency.
+
+    Every miner keeps its own coordinator, but the poller decides when each one
+    refreshes. Poll phases are staggered over the interval so the fleet does not
+    hit the network in one burst, and the shared semaphore caps how many HTTP
+    requests are in flight at once. The delay between two polls of a miner
+    comes from its adaptive poll interval and is measured from the start of the
+    previous poll, which keeps the phases apart; a poll never overlaps the
+    previous one of the same miner.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, interval: float, max_concurrent_requests: int
+    ) -> None:
+        """Initialize the fleet poller."""
+        self._hass = hass
+        self.interval = interval
+        self.request_semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self._members: dict[str, _FleetMember] = {}
+        self._phase_index = 0
+
+    @property
+    def is_empty(self) -> bool:
+        """Return True if no miner is registered."""
+        return not self._members
+
+    @callback
+    def async_add(
+        self,
+        entry_id: str,
+        coordinator: DataUpdateCoordinator,
+        policy: AdaptivePollInterval,
+        refresh_now: bool = False,
+    ) -> None:
+        """Start polling a miner at the next free phase of the interval.
+
+        With ``refresh_now`` the first poll happens within the current interval
+        instead of the next one.
+        """
+        self.async_remove(entry_id)
+
+        phase = (self._phase_index * _PHASE_STEP) % 1
+        self._phase_index += 1
+
+        now = self._hass.loop.time()
+        member = _FleetMember(
+            coordinator=coordinator,
+            policy=policy,
+            next_due=now + self.interval * (phase if refresh_now else 1 + phase),
+            last_started=now,
+        )
+        self._members[entry_id] = member
+        policy.async_set_listener(lambda: self._async_poll_sooner(entry_id))
+        self._async_schedule(entry_id, member)
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        """Stop polling a miner."""
+        if (member := self._members.pop(entry_id, None)) is None:
+            return
+        member.policy.async_set_listener(None)
+        if member.timer is not None:
+            member.timer.cancel()
+        if member.task is not None and not member.task.done():
+            member.task.cancel()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop polling every miner."""
+        for entry_id in list(self._members):
+            self.async_remove(entry_id)
+
+    @callback
+    def _async_schedule(self, entry_id: str, member: _FleetMember) -> None:
+        """Arm the timer for the member's next poll."""
+        member.timer = self._hass.loop.call_at(
+            member.next_due, self._async_dispatch, entry_id
+        )
+
+    @callback
+    def _async_poll_sooner(self, entry_id: str) -> None:
+        """Pull the next poll in if the miner's interval just shrank."""
+        if (member := self._members.get(entry_id)) is None or member.timer is None:
+            # Unknown miner, or a poll is running and will pick up the change
+            return
+
+        due = max(member.last_started + member.policy.interval, self._hass.loop.time())
+        if due < member.next_due:
+            member.timer.cancel()
+            member.next_due = due
+            self._async_schedule(entry_id, member)
+
+    @callback
+    def _async_dispatch(self, entry_id: str) -> None:
+        """Start a poll for a miner."""
+        if (member := self._members.get(entry_id)) is None:
+            return
+
+        member.timer = None
+        member.task = self._hass.async_create_background_task(
+            self._async_poll(entry_id, member),
+            f"{member.coordinator.name} fleet poll",
+        )
+
+    async def _async_poll(self, entry_id: str, member: _FleetMember) -> None:
+        """Refresh a miner, then schedule its next poll."""
+        member.last_started = self._hass.loop.time()
+        try:
+            await member.coordinator.async_refresh()
+        finally:
+            # A cancelled poll belongs to a miner that is going away, or to
+            # Home Assistant shutting down; don't arm another timer for it
+            task = asyncio.current_task()
+            if self._members.get(entry_id) is member and not task.cancelling():
+                member.next_due = max(
+                    member.last_started + member.policy.interval,
+                    self._hass.loop.time(),
+                )
+                self._async_schedule(entry_id, member)
@@ -0,0 +1,324 @@
+# custom_components/braiins_os_plus/grpc_transport.py
+"""Transport for the Braiins OS+ gRPC API."""
+
+import hashlib
+import logging
+import time
+from typing import Any
+
+import grpc
+from google.protobuf import descriptor_pb2, descriptor_pool, json_format
+from google.protobuf.descriptor import Descriptor, FieldDescriptor, MethodDescriptor
+from google.protobuf.message_factory import GetMessageClass
+from grpc_reflection.v1alpha import reflection_pb2, reflection_pb2_grpc
+
+from .const import CONNECT_TIMEOUT, GRPC_PORT, READ_TIMEOUT
+from .transport import (
+    UNCHANGED,
+    BraiinsAuthError,
+    BraiinsBusyError,
+    BraiinsCommandError,
+    BraiinsConnectionError,
+    BraiinsTransport,
+    BraiinsTransportError,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_PACKAGE = "braiins.bos.v1"
+
+# RPC answering each REST gateway endpoint, as (service, method)
+_LOGIN_RPC = ("AuthenticationService", "Login")
+_READ_RPCS = {
+    "miner/details": ("MinerService", "GetMinerDetails"),
+    "configuration/constraints": ("ConfigurationService", "GetConstraints"),
+    "performance/mode": ("PerformanceService", "GetActivePerformanceMode"),
+    "miner/hw/hashboards": ("MinerService", "GetHashboards"),
+    "miner/stats": ("MinerService", "GetMinerStats"),
+    "cooling/state": ("CoolingService", "GetCoolingState"),
+}
+_WRITE_RPCS = {
+    ("put", "performance/mode"): ("PerformanceService", "SetPerformanceMode"),
+    ("put", "performance/power-target"): ("PerformanceService", "SetPowerTarget"),
+    ("patch", "performance/power-target/increment"): (
+        "PerformanceService",
+        "IncrementPowerTarget",
+    ),
+    ("patch", "performance/power-target/decrement"): (
+        "PerformanceService",
+        "DecrementPowerTarget",
+    ),
+    ("put", "performance/hashrate-target"): (
+        "PerformanceService",
+        "SetHashrateTarget",
+    ),
+    ("patch", "performance/hashrate-target/increment"): (
+        "PerformanceService",
+        "IncrementHashrateTarget",
+    ),
+    ("patch", "performance/hashrate-target/decrement"): (
+        "PerformanceService",
+        "DecrementHashrateTarget",
+    ),
+    ("put", "actions/pause"): ("ActionsService", "PauseMining"),
+    ("put", "actions/resume"): ("ActionsService", "ResumeMining"),
+}
+
+# Commands are applied right away, like the REST gateway does
+_SAVE_ACTION_FIELD = "save_action"
+_SAVE_AND_APPLY = "SAVE_ACTION_SAVE_AND_APPLY"
+
+# Statuses of calls the miner never answered
+_NO_ANSWER = (grpc.StatusCode.DEADLINE_EXCEEDED, grpc.StatusCode.UNAVAILABLE)
+
+_COMMAND_ERRORS = (
+    grpc.StatusCode.INVALID_ARGUMENT,
+    grpc.StatusCode.FAILED_PRECONDITION,
+    grpc.StatusCode.OUT_OF_RANGE,
+)
+
+_INT64_TYPES = (
+    FieldDescriptor.TYPE_INT64,
+    FieldDescriptor.TYPE_UINT64,
+    FieldDescriptor.TYPE_SINT64,
+    FieldDescriptor.TYPE_FIXED64,
+    FieldDescriptor.TYPE_SFIXED64,
+)
+
+
+class GrpcTransport(BraiinsTransport):
+    """Transport for the gRPC API on port 50051.
+
+    The integration ships no generated protobuf code. The message types are
+    loaded from the miner's server reflection the first time a service is
+    used, so they always match the firmware. Responses are converted to the
+    JSON the REST gateway returns for the same call, and REST command bodies
+    are placed in the matching request message.
+    """
+
+    name = "grpc"
+
+    def __init__(self, host: str) -> None:
+        """Initialize the gRPC transport."""
+        self._target = host if ":" in host else f"{host}:{GRPC_PORT}"
+        self._channel: grpc.aio.Channel | None = None
+        self._pool = descriptor_pool.DescriptorPool()
+        self._files: dict[str, descriptor_pb2.FileDescriptorProto] = {}
+        self._services: set[str] = set()
+        self._methods: dict[tuple[str, str], tuple[MethodDescriptor, Any]] = {}
+        self._digests: dict[str, bytes] = {}
+
+    async def async_login(self, username: str, password: str) -> dict[str, Any]:
+        """Log in and return the payload holding ``token`` and ``timeout_s``."""
+        output_type, body = await self._async_call(
+            _LOGIN_RPC, {"username": username, "password": password}
+        )
+        return _to_payload(output_type, body)
+
+    async def async_get(self, endpoint: str, token: str) -> dict[str, Any]:
+        """Call the RPC behind an endpoint and return its payload, or UNCHANGED.
+
+        Identical serialized responses are reported as UNCHANGED without being
+        decoded again.
+        """
+        output_type, body = await self._async_call(
+            _READ_RPCS[endpoint],
+            None,
+            token,
+            timeout=CONNECT_TIMEOUT + READ_TIMEOUT,
+            endpoint=endpoint,
+        )
+        if self.metrics is not None:
+            self.metrics.record_body(endpoint, len(body))
+
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if self._digests.get(endpoint) == digest:
+            return UNCHANGED
+        start = time.perf_counter()
+        payload = _to_payload(output_type, body)
+        if self.metrics is not None:
+            self.metrics.record_decode(endpoint, time.perf_counter() - start)
+        self._digests[endpoint] = digest
+        return payload
+
+    async def async_send(
+        self, method: str, endpoint: str, token: str, data: dict | None = None
+    ) -> None:
+        """Send a command to the RPC behind an endpoint."""
+        _LOGGER.debug("Sending %s %s over gRPC with data: %s", method, endpoint, data)
+        await self._async_call(_WRITE_RPCS[(method, endpoint)], data, token)
+
+    async def async_close(self) -> None:
+        """Close the channel."""
+        if self._channel is not None:
+            await self._channel.close()
+            self._channel = None
+            self._methods.clear()
+
+    async def _async_call(
+        self,
+        rpc: tuple[str, str],
+        data: dict[str, Any] | None,
+        token: str | None = None,
+        timeout: float | None = None,
+        endpoint: str | None = None,
+    ) -> tuple[Descriptor, bytes]:
+        """Call an RPC and return its output type and serialized response.
+
+        With ``endpoint``, the status of an answered call is recorded for it;
+        deadlines and unreachable miners are recorded by the API client.
+        """
+        if self._channel is None:
+            self._channel = grpc.aio.insecure_channel(self._target)
+        service, name = rpc
+        try:
+            method, call = await self._async_method(service, name)
+            body = await call(
+                _build_request(method.input_type, data),
+                timeout=timeout,
+                metadata=(("authorization", token),) if token else None,
+            )
+        except grpc.aio.AioRpcError as err:
+            code = err.code()
+            if endpoint and self.metrics is not None and code not in _NO_ANSWER:
+                self.metrics.record_outcome(endpoint, code.name)
+            raise _translate_error(err, f"{service}/{name}") from err
+        if endpoint and self.metrics is not None:
+            self.metrics.record_outcome(endpoint, grpc.StatusCode.OK.name)
+        return method.output_type, body
+
+    async def _async_method(
+        self, service: str, name: str
+    ) -> tuple[MethodDescriptor, Any]:
+        """Return a method's descriptor and callable, loading its service once.
+
+        The response is left serialized so that it can be hashed before it is
+        decoded.
+        """
+        if (cached := self._methods.get((service, name))) is not None:
+            return cached
+        if service not in self._services:
+            await self._async_load(f"{_PACKAGE}.{service}")
+            self._services.add(service)
+        try:
+            method = self._pool.FindMethodByName(f"{_PACKAGE}.{service}.{name}")
+        except KeyError as err:
+            raise BraiinsTransportError(f"Miner has no {service}/{name}") from err
+        call = self._channel.unary_unary(
+            f"/{_PACKAGE}.{service}/{name}",
+            request_serializer=GetMessageClass(method.input_type).SerializeToString,
+            response_deserializer=None,
+        )
+        self._methods[(service, name)] = method, call
+        return method, call
+
+    async def _async_load(self, symbol: str) -> None:
+        """Add the files defining ``symbol``, and their imports, to the pool."""
+        stub = reflection_pb2_grpc.ServerReflectionStub(self._channel)
+        requests = [
+            reflection_pb2.ServerReflectionRequest(file_containing_symbol=symbol)
+        ]
+        while requests:
+            async for response in stub.ServerReflectionInfo(iter(requests)):
+                if response.HasField("error_response"):
+                    raise BraiinsTransportError(
+                        f"Reflection of {symbol} failed: "
+                        f"{response.error_response.error_message}"
+                    )
+                for raw in response.file_descriptor_response.file_descriptor_proto:
+                    proto = descriptor_pb2.FileDescriptorProto.FromString(raw)
+                    self._files.setdefault(proto.name, proto)
+            # Some servers only return the file itself, not what it imports
+            requests = [
+                reflection_pb2.ServerReflectionRequest(file_by_filename=dependency)
+                for proto in list(self._files.values())
+                for dependency in proto.dependency
+                if dependency not in self._files
+            ]
+        for file_name in list(self._files):
+            self._add_file(file_name)
+
+    def _add_file(self, file_name: str) -> None:
+        """Add a file to the pool after the files it imports."""
+        if (proto := self._files.get(file_name)) is None:
+            return
+        try:
+            self._pool.FindFileByName(file_name)
+        except KeyError:
+            for dependency in proto.dependency:
+                self._add_file(dependency)
+            self._pool.Add(proto)
+
+
+def _build_request(descriptor: Descriptor, data: dict[str, Any] | None) -> Any:
+    """Build a request from a REST command body.
+
+    The body either matches the request itself or, as for the target setters,
+    the request's only message field besides the save action.
+    """
+    request = GetMessageClass(descriptor)()
+    if (field := descriptor.fields_by_name.get(_SAVE_ACTION_FIELD)) is not None and (
+        value := field.enum_type.values_by_name.get(_SAVE_AND_APPLY)
+    ) is not None:
+        setattr(request, _SAVE_ACTION_FIELD, value.number)
+    if not data:
+        return request
+
+    if all(key in descriptor.fields_by_name for key in data):
+        json_format.ParseDict(data, request)
+        return request
+    body_fields = [
+        field
+        for field in descriptor.fields
+        if field.message_type is not None and field.name != _SAVE_ACTION_FIELD
+    ]
+    if len(body_fields) != 1:
+        raise BraiinsCommandError(f"Cannot map {data} onto {descriptor.full_name}")
+    json_format.ParseDict(data, getattr(request, body_fields[0].name))
+    return request
+
+
+def _to_payload(descriptor: Descriptor, body: bytes) -> dict[str, Any]:
+    """Decode a response into the JSON the REST gateway returns for it."""
+    message = GetMessageClass(descriptor).FromString(body)
+    payload = json_format.MessageToDict(
+        message,
+        always_print_fields_with_no_presence=True,
+        preserving_proto_field_name=True,
+    )
+    _unquote_int64(descriptor, payload)
+    return payload
+
+
+def _unquote_int64(descriptor: Descriptor, payload: dict[str, Any]) -> None:
+    """Turn the 64-bit integers the JSON mapping quotes back into numbers."""
+    for name, value in payload.items():
+        if (field := descriptor.fields_by_name.get(name)) is None:
+            continue
+        items = value if isinstance(value, list) else [value]
+        if field.message_type is not None:
+            if field.message_type.GetOptions().map_entry:
+                continue
+            for item in items:
+                if isinstance(item, dict):
+                    _unquote_int64(field.message_type, item)
+        elif field.type in _INT64_TYPES:
+            numbers = [int(item) for item in items]
+            payload[name] = numbers if isinstance(value, list) else numbers[0]
+
+
+def _translate_error(err: grpc.aio.AioRpcError, rpc: str) -> Exception:
+    """Map a gRPC status to the error the REST transport raises for it."""
+    code = err.code()
+    message = f"{rpc}: {code.name} {err.details()}"
+    if code is grpc.StatusCode.DEADLINE_EXCEEDED:
+        return TimeoutError(message)
+    if code is grpc.StatusCode.UNAUTHENTICATED:
+        return BraiinsAuthError(message)
+    if code is grpc.StatusCode.INTERNAL:
+        return BraiinsBusyError(message)
+    if code is grpc.StatusCode.UNAVAILABLE:
+        return BraiinsConnectionError(message)
+    if code in _COMMAND_ERRORS:
+        return BraiinsCommandError(message)
+    return BraiinsTransportError(message)
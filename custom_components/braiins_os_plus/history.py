@@ -0,0 +1,143 @@
+# custom_components/braiins_os_plus/history.py
+"""In-memory telemetry history with rolling statistics."""
+
+from array import array
+from dataclasses import dataclass
+import math
+import time
+
+from homeassistant.core import callback
+
+from .const import HISTORY_SAMPLE_INTERVAL, ROLLING_WINDOWS
+from .models import MinerSnapshot
+
+# Samples needed to cover the longest window
+HISTORY_CAPACITY = math.ceil(max(ROLLING_WINDOWS) / HISTORY_SAMPLE_INTERVAL) + 1
+
+
+@dataclass(slots=True, frozen=True)
+class WindowStats:
+    """Statistics of the samples within a window."""
+
+    mean: float
+    min: float
+    max: float
+    stddev: float
+    count: int
+
+
+class RingBuffer:
+    """Fixed-size buffer of timestamped samples backed by two float arrays.
+
+    Once full, every new sample overwrites the oldest one, so the memory used
+    is 16 bytes per slot no matter how long the miner runs.
+    """
+
+    __slots__ = ("_times", "_values", "_next", "_size")
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty buffer."""
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return self._size
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a sample, dropping the oldest one if the buffer is full."""
+        self._times[self._next] = timestamp
+        self._values[self._next] = value
+        self._next = (self._next + 1) % len(self._times)
+        self._size = min(self._size + 1, len(self._times))
+
+    def stats(self, since: float) -> WindowStats | None:
+        """Return the statistics of the samples taken at or after ``since``."""
+        capacity = len(self._times)
+        count = 0
+        total = total_sq = 0.0
+        low = math.inf
+        high = -math.inf
+        # Walk back from the newest sample until one is older than the window
+        index = self._next
+        for _ in range(self._size):
+            index = (index - 1) % capacity
+            if self._times[index] < since:
+                break
+            value = self._values[index]
+            count += 1
+            total += value
+            total_sq += value * value
+            low = min(low, value)
+            high = max(high, value)
+
+        if not count:
+            return None
+        mean = total / count
+        return WindowStats(
+            mean=mean,
+            min=low,
+            max=high,
+            stddev=math.sqrt(max(total_sq / count - mean * mean, 0.0)),
+            count=count,
+        )
+
+
+class MinerHistory:
+    """Rolling history of a miner's and its hashboards' telemetry.
+
+    At most one sample is kept per HISTORY_SAMPLE_INTERVAL. Every series holds
+    HISTORY_CAPACITY samples, enough for the longest rolling window, which with
+    the default settings is 361 slots or about 5.8 KB per series: 5 miner-wide
+    series plus 3 per hashboard, so roughly 81 KB for a three-board miner.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty history."""
+        self._series: dict[tuple[str, str | None], RingBuffer] = {}
+        self._last_sample = -math.inf
+        self._stats: dict[tuple[str, str | None, int], WindowStats | None] = {}
+
+    @callback
+    def async_add_sample(self, snapshot: MinerSnapshot) -> None:
+        """Record the telemetry of an update."""
+        now = time.monotonic()
+        if now - self._last_sample < HISTORY_SAMPLE_INTERVAL:
+            return
+        self._last_sample = now
+        self._stats.clear()
+
+        self._record(now, "hashrate", None, snapshot.total_hashrate_ths)
+        self._record(now, "consumption", None, snapshot.consumption_w)
+        # Efficiency reads 0 while paused, which is not a sample
+        self._record(now, "efficiency", None, snapshot.efficiency_jth or None)
+        self._record(now, "chip_temp", None, snapshot.highest_chip_temp_c)
+        self._record(now, "board_temp", None, snapshot.highest_board_temp_c)
+        for board_id, board in snapshot.hashboards.items():
+            self._record(now, "hashrate", board_id, board.hashrate_ths)
+            self._record(now, "chip_temp", board_id, board.chip_temp_c)
+            self._record(now, "board_temp", board_id, board.board_temp_c)
+
+    def stats(
+        self, metric: str, window: int, board_id: str | None = None
+    ) -> WindowStats | None:
+        """Return the statistics of a series over the last ``window`` seconds."""
+        key = (metric, board_id, window)
+        if key not in self._stats:
+            series = self._series.get((metric, board_id))
+            self._stats[key] = (
+                series.stats(time.monotonic() - window) if series else None
+            )
+        return self._stats[key]
+
+    def _record(
+        self, now: float, metric: str, board_id: str | None, value: float | None
+    ) -> None:
+        """Append a value to a series, creating the series on first use."""
+        if value is None:
+            return
+        if (series := self._series.get((metric, board_id))) is None:
+            series = self._series[(metric, board_id)] = RingBuffer(HISTORY_CAPACITY)
+        series.append(now, value)
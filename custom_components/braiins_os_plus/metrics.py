@@ -0,0 +1,179 @@
+# custom_components/braiins_os_plus/metrics.py
+"""Counters and latency histograms of a miner's polling pipeline."""
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+from .const import LATENCY_BUCKETS_MS
+
+# Outcomes of requests that got the payload, or learned it had not changed
+SUCCESS_OUTCOMES = ("200", "304", "OK")
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram.
+
+    Only one counter per bucket is kept, so the memory used does not grow with
+    the number of requests; percentiles are reported as the upper bound of the
+    bucket they fall in.
+    """
+
+    __slots__ = ("_counts", "count", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self._counts = array("Q", bytes(8 * (len(LATENCY_BUCKETS_MS) + 1)))
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add a duration."""
+        ms = seconds * 1000
+        self._counts[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the bucket bound below which ``fraction`` of durations fall."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                break
+        if index == len(LATENCY_BUCKETS_MS):
+            return round(self.max_ms, 1)
+        return float(LATENCY_BUCKETS_MS[index])
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as JSON-serializable data."""
+        bounds = [f"<={bound}" for bound in LATENCY_BUCKETS_MS]
+        bounds.append(f">{LATENCY_BUCKETS_MS[-1]}")
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 1) if self.count else None,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max_ms, 1),
+            "buckets": dict(zip(bounds, self._counts)),
+        }
+
+
+class EndpointMetrics:
+    """What happened to the requests sent to one endpoint."""
+
+    __slots__ = ("latency", "outcomes", "bytes_received", "decode_ms", "decodes")
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.latency = LatencyHistogram()
+        # HTTP status codes or gRPC status names, plus "timeout" and "error"
+        # for requests without one
+        self.outcomes: Counter[str] = Counter()
+        self.bytes_received = 0
+        self.decode_ms = 0.0
+        self.decodes = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as JSON-serializable data."""
+        return {
+            "latency": self.latency.as_dict(),
+            "outcomes": dict(self.outcomes),
+            "bytes_received": self.bytes_received,
+            "decodes": self.decodes,
+            "mean_decode_ms": (
+                round(self.decode_ms / self.decodes, 2) if self.decodes else None
+            ),
+        }
+
+
+class PipelineMetrics:
+    """Instrumentation of a miner's polling pipeline since it was set up.
+
+    The transport records status codes, bytes and decode time, the API client
+    the request latencies, re-logins and coordinator update durations.
+    Listeners are called after every update, including failed ones, which the
+    coordinator does not tell its own listeners about.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self.updates = LatencyHistogram()
+        self.last_update_ms: float | None = None
+        self.relogins = 0
+        self.relogin_failures = 0
+        self._listeners: list[Callable[[], None]] = []
+
+    def add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Call ``update_callback`` after every update; return how to stop."""
+        self._listeners.append(update_callback)
+        return lambda: self._listeners.remove(update_callback)
+
+    def endpoint(self, endpoint: str) -> EndpointMetrics:
+        """Return the metrics of an endpoint, creating them on first use."""
+        if (metrics := self.endpoints.get(endpoint)) is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics()
+        return metrics
+
+    def record_outcome(self, endpoint: str, outcome: int | str) -> None:
+        """Count a status, or "timeout" or "error", for an endpoint."""
+        self.endpoint(endpoint).outcomes[str(outcome)] += 1
+
+    def record_body(self, endpoint: str, size: int) -> None:
+        """Count the bytes of a response body."""
+        self.endpoint(endpoint).bytes_received += size
+
+    def record_decode(self, endpoint: str, seconds: float) -> None:
+        """Add the time spent decoding a response body."""
+        metrics = self.endpoint(endpoint)
+        metrics.decode_ms += seconds * 1000
+        metrics.decodes += 1
+
+    def record_latency(self, endpoint: str, seconds: float) -> None:
+        """Add the duration of a request."""
+        self.endpoint(endpoint).latency.record(seconds)
+
+    def record_update(self, seconds: float) -> None:
+        """Add the duration of a coordinator update."""
+        self.updates.record(seconds)
+        self.last_update_ms = round(seconds * 1000, 1)
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    def record_relogin(self, success: bool) -> None:
+        """Count a login attempt."""
+        if success:
+            self.relogins += 1
+        else:
+            self.relogin_failures += 1
+
+    @property
+    def failed_requests(self) -> int:
+        """Return how many requests got no successful answer."""
+        return sum(
+            count
+            for metrics in self.endpoints.values()
+            for outcome, count in metrics.outcomes.items()
+            if outcome not in SUCCESS_OUTCOMES
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as JSON-serializable data."""
+        return {
+            "updates": self.updates.as_dict(),
+            "last_update_ms": self.last_update_ms,
+            "relogins": self.relogins,
+            "relogin_failures": self.relogin_failures,
+            "endpoints": {
+                endpoint: metrics.as_dict()
+                for endpoint, metrics in sorted(self.endpoints.items())
+            },
+        }
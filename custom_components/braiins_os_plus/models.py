@@ -0,0 +1,141 @@
+# custom_components/braiins_os_plus/models.py
+"""Typed telemetry snapshot parsed from the raw miner payloads."""
+
+from dataclasses import dataclass
+from typing import Any
+
+from .const import HASHRATE_WINDOWS
+
+
+def _dig(data: Any, *keys: str) -> Any:
+    """Walk nested dicts, returning None as soon as a level is missing."""
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _float(value: Any) -> float | None:
+    """Return value as a float, or None if it is missing or not numeric."""
+    try:
+        return float(value)
+    except TypeError, ValueError:
+        return None
+
+
+def _ths_windows(real_hashrate: Any) -> dict[str, float]:
+    """Return the miner-computed hashrate windows in TH/s, by window name."""
+    windows = {}
+    for window, key in HASHRATE_WINDOWS.items():
+        ghs = _float(_dig(real_hashrate, key, "gigahash_per_second"))
+        if ghs is not None:
+            windows[window] = ghs / 1000
+    return windows
+
+
+@dataclass(slots=True)
+class HashboardSnapshot:
+    """Telemetry of a single hashboard."""
+
+    id: str
+    hashrate_ths: float | None
+    chip_temp_c: float | None
+    board_temp_c: float | None
+    # Averages computed by the miner itself, e.g. "15m" -> TH/s
+    hashrate_windows_ths: dict[str, float]
+
+    @classmethod
+    def from_payload(cls, board: dict[str, Any]) -> "HashboardSnapshot":
+        """Parse a board from the ``miner/hw/hashboards`` payload."""
+        ghs = _float(
+            _dig(board, "stats", "real_hashrate", "last_5s", "gigahash_per_second")
+        )
+        return cls(
+            id=board["id"],
+            hashrate_ths=ghs / 1000 if ghs is not None else None,
+            chip_temp_c=_float(
+                _dig(board, "highest_chip_temp", "temperature", "degree_c")
+            ),
+            board_temp_c=_float(_dig(board, "board_temp", "degree_c")),
+            hashrate_windows_ths=_ths_windows(_dig(board, "stats", "real_hashrate")),
+        )
+
+
+@dataclass(slots=True)
+class FanSnapshot:
+    """Telemetry of a single fan."""
+
+    position: int
+    rpm: int | None
+    target_speed_ratio: float | None
+
+    @classmethod
+    def from_payload(cls, fan: dict[str, Any]) -> "FanSnapshot":
+        """Parse a fan from the ``cooling/state`` payload."""
+        return cls(
+            position=fan["position"],
+            rpm=fan.get("rpm"),
+            target_speed_ratio=_float(fan.get("target_speed_ratio")),
+        )
+
+
+@dataclass(slots=True)
+class MinerSnapshot:
+    """Flat, validated view of a miner's telemetry for one update.
+
+    The raw payloads are walked once per update; entities only read fields.
+    """
+
+    consumption_w: int
+    efficiency_jth: float
+    total_hashrate_ths: float | None
+    highest_chip_temp_c: float | None
+    highest_board_temp_c: float | None
+    hashboards: dict[str, HashboardSnapshot]
+    fans: dict[int, FanSnapshot]
+    hashrate_windows_ths: dict[str, float]
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any]) -> "MinerSnapshot":
+        """Parse the telemetry out of the merged coordinator data."""
+        power_stats = _dig(data, "stats", "power_stats")
+        consumption = _dig(power_stats, "approximated_consumption", "watt")
+        efficiency = _float(_dig(power_stats, "efficiency", "joule_per_terahash"))
+
+        hashboards = {
+            board["id"]: HashboardSnapshot.from_payload(board)
+            for board in data.get("hashboards") or []
+            if board and board.get("id") is not None
+        }
+
+        fans = {
+            fan["position"]: FanSnapshot.from_payload(fan)
+            for fan in _dig(data, "cooling", "fans") or []
+            if fan and fan.get("position") is not None
+        }
+
+        board_temps = [
+            board.board_temp_c
+            for board in hashboards.values()
+            if board.board_temp_c is not None
+        ]
+
+        return cls(
+            consumption_w=consumption or 0,
+            efficiency_jth=efficiency if efficiency is not None else 0.0,
+            total_hashrate_ths=sum(
+                board.hashrate_ths or 0 for board in hashboards.values()
+            )
+            if hashboards
+            else None,
+            highest_chip_temp_c=_float(
+                _dig(data, "cooling", "highest_temperature", "temperature", "degree_c")
+            ),
+            highest_board_temp_c=max(board_temps) if board_temps else None,
+            hashboards=hashboards,
+            fans=fans,
+            hashrate_windows_ths=_ths_windows(
+                _dig(data, "stats", "miner_stats", "real_hashrate")
+            ),
+        )
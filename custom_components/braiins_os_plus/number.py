@@ -28,12 +28,13 @@ async def async_setup_entry(
     domain_data = hass.data[DOMAIN][entry.entry_id]
     coordinator = domain_data["coordinator"]
     api = domain_data["api"]
+    commands = domain_data["commands"]
 
     async_add_entities(
         [
-            BraiinsPowerTargetNumber(coordinator, api, entry),
+            BraiinsPowerTargetNumber(coordinator, api, entry, commands),
             BraiinsPowerStepNumber(coordinator, entry),
-            BraiinsHashrateTargetNumber(coordinator, api, entry),
+            BraiinsHashrateTargetNumber(coordinator, api, entry, commands),
             BraiinsHashrateStepNumber(coordinator, entry),
         ]
     )
@@ -48,18 +49,19 @@ class BraiinsHashrateTargetNumber(CoordinatorEntity, NumberEntity):
     _attr_icon = "mdi:speedometer"
     _attr_native_step = 1
 
-    def __init__(self, coordinator, api, entry) -> None:
+    def __init__(self, coordinator, api, entry, commands) -> None:
         """Initialize the number entity."""
         super().__init__(coordinator)
         self.api = api
+        self.commands = commands
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_hashrate_target"
-        # Use shared device info logic
-        data = self.coordinator.data.get("details", {})
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": data.get("hostname", "Braiins Miner"),
-        }
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry.entry_id)})
+
+    async def async_added_to_hass(self) -> None:
+        """Also write the state when a new target is issued."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.commands.add_listener(self.async_write_ha_state))
 
     @property
     def native_min_value(self) -> float:
@@ -97,7 +99,7 @@ class BraiinsHashrateTargetNumber(CoordinatorEntity, NumberEntity):
     @property
     def native_value(self) -> int | None:
         """Return the current hashrate target fetched from the miner."""
-        val = self.coordinator.data.get("hashrate_target")
+        val = self.commands.value("hashrate_target")
         return int(val) if val is not None else None
 
     @property
@@ -105,17 +107,17 @@ class BraiinsHashrateTargetNumber(CoordinatorEntity, NumberEntity):
         """Only available if Hashrate Target mode is active."""
         return (
             super().available
-            and self.coordinator.data.get("performance_mode") == "Hashrate Target"
+            and self.commands.value("performance_mode") == "Hashrate Target"
         )
 
     async def async_set_native_value(self, value: float) -> None:
         """Send the new hashrate target to the miner."""
         target = int(value)
-        success = await self.api.set_hashrate_target(target)
-        if success and self.coordinator.data:
-            new_data = dict(self.coordinator.data)
-            new_data["hashrate_target"] = target
-            self.coordinator.async_set_updated_data(new_data)
+        success = await self.commands.async_run(
+            lambda: self.api.set_hashrate_target(target), replaces="hashrate_target"
+        )
+        if success:
+            self.commands.async_set_optimistic({"hashrate_target": target})
 
 
 class BraiinsHashrateStepNumber(NumberEntity):
@@ -135,11 +137,7 @@ class BraiinsHashrateStepNumber(NumberEntity):
         self.coordinator = coordinator
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_hashrate_step_config"
-        data = self.coordinator.data.get("details", {})
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": data.get("hostname", "Braiins Miner"),
-        }
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry.entry_id)})
 
     @property
     def native_value(self) -> float:
@@ -171,12 +169,7 @@ class BraiinsPowerStepNumber(NumberEntity):
         self.coordinator = coordinator
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_power_step_config"
-        # Shared device info logic
-        data = self.coordinator.data.get("details", {})
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": data.get("hostname", "Braiins Miner"),
-        }
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry.entry_id)})
 
     @property
     def native_value(self) -> int:
@@ -203,43 +196,45 @@ class BraiinsPowerTargetNumber(CoordinatorEntity, NumberEntity):
     _attr_native_max_value = 6400  # Maximum Watts
     _attr_native_step = 1  # Allows adjustments in increments of 10W
 
-    def __init__(self, coordinator, api, entry) -> None:
+    def __init__(self, coordinator, api, entry, commands) -> None:
         """Initialize the number entity."""
         super().__init__(coordinator)
         self.api = api
+        self.commands = commands
 
         # Link this entity to the existing Braiins OS device in HA
-        self._attr_device_info = {"identifiers": {(DOMAIN, entry.entry_id)}}
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry.entry_id)})
         self._attr_unique_id = f"{entry.entry_id}_power_target"
 
+    async def async_added_to_hass(self) -> None:
+        """Also write the state when a new target is issued."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.commands.add_listener(self.async_write_ha_state))
+
     @property
     def native_value(self):
         """Return the current power target fetched from the miner."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("power_target")
-        return None
+        return self.commands.value("power_target")
 
     @property
     def available(self) -> bool:
         """Only available if Power Target mode is active."""
         return (
             super().available
-            and self.coordinator.data.get("performance_mode") == "Power Target"
+            and self.commands.value("performance_mode") == "Power Target"
         )
 
     async def async_set_native_value(self, value: float) -> None:
         """Send the new power target to the miner."""
         watt_value = int(value)
 
-        success = await self.api.set_power_target(watt_value)
+        success = await self.commands.async_run(
+            lambda: self.api.set_power_target(watt_value), replaces="power_target"
+        )
 
         if success:
-            # Optimistically update the coordinator data without a full API poll
-            if self.coordinator.data is not None:
-                new_data = dict(self.coordinator.data)
-                new_data["power_target"] = watt_value
-
-                self.coordinator.async_set_updated_data(new_data)
+            # Show the new target until the next poll reports it
+            self.commands.async_set_optimistic({"power_target": watt_value})
 
     @property
     def native_min_value(self) -> float:
@@ -264,18 +259,3 @@ class BraiinsPowerTargetNumber(CoordinatorEntity, NumberEntity):
             )
         except KeyError, TypeError:
             return 6500.0
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for this miner."""
-        data = self.coordinator.data.get("details", {})
-        ident = data.get("miner_identity", {})
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            name=data.get("hostname")
-            or f"Braiins OS+ Miner ({self.coordinator.config_entry.data['miner_ip']})",
-            manufacturer="Braiins",
-            model=ident.get("miner_model") or "Miner with Braiins OS+",
-            sw_version=data.get("bos_version", {}).get("current"),
-        )
@@ -0,0 +1,129 @@
+# custom_components/braiins_os_plus/polling.py
+"""Adaptive poll interval for a single miner."""
+
+from collections.abc import Callable
+import time
+
+from homeassistant.core import callback
+
+from .const import (
+    CIRCUIT_BREAKER_THRESHOLD,
+    CIRCUIT_MAX_PROBE_INTERVAL,
+    COMMAND_FAST_POLL_WINDOW,
+    HASHRATE_CHANGE_THRESHOLD,
+    MAX_POLL_INTERVAL,
+    MIN_POLL_INTERVAL,
+    POLL_BACKOFF_FACTOR,
+    POLL_INTERVAL,
+    TEMPERATURE_CHANGE_THRESHOLD,
+)
+from .models import MinerSnapshot
+
+
+class AdaptivePollInterval:
+    """Pick the next poll interval from the miner's recent behaviour.
+
+    - Right after a command, poll at the minimum interval so the new target
+      shows up as soon as the tuner settles.
+    - While the miner keeps answering 500 (reconfiguring), back off
+      exponentially from the minimum interval.
+    - While temperatures or hashrate move quickly, poll at the minimum
+      interval; once they flatten out, stretch the interval gradually.
+    - While the miner is paused (no hashrate), poll at the maximum interval.
+    - Once CIRCUIT_BREAKER_THRESHOLD polls in a row got no answer, open the
+      circuit: the miner is only probed, with an exponential backoff, until it
+      answers again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the policy at the base interval."""
+        self._steady = float(POLL_INTERVAL)
+        self._busy_streak = 0
+        self._failure_streak = 0
+        self._fast_until = 0.0
+        self._last_hashrate: float | None = None
+        self._last_temp: float | None = None
+        self._listener: Callable[[], None] | None = None
+
+    @property
+    def interval(self) -> float:
+        """Return the delay until the next poll, in seconds."""
+        if self.circuit_open:
+            return min(
+                POLL_INTERVAL * 2 ** (self._failure_streak - CIRCUIT_BREAKER_THRESHOLD),
+                float(CIRCUIT_MAX_PROBE_INTERVAL),
+            )
+        if self._busy_streak:
+            return min(
+                MIN_POLL_INTERVAL * 2**self._busy_streak, float(MAX_POLL_INTERVAL)
+            )
+        if time.monotonic() < self._fast_until:
+            return float(MIN_POLL_INTERVAL)
+        return self._steady
+
+    @property
+    def circuit_open(self) -> bool:
+        """Return True while the miner is unreachable and only probed."""
+        return self._failure_streak >= CIRCUIT_BREAKER_THRESHOLD
+
+    @callback
+    def async_set_listener(self, listener: Callable[[], None] | None) -> None:
+        """Set the callback run when the interval shrinks before the next poll."""
+        self._listener = listener
+
+    @callback
+    def record_command(self) -> None:
+        """Poll fast for a while after a command was accepted."""
+        self._fast_until = time.monotonic() + COMMAND_FAST_POLL_WINDOW
+        self._busy_streak = 0
+        if self._listener is not None:
+            self._listener()
+
+    @callback
+    def record_busy(self) -> None:
+        """Back off while the miner is reconfiguring."""
+        self._busy_streak += 1
+        self._failure_streak = 0
+
+    @callback
+    def record_failure(self) -> bool:
+        """Count a poll that got no answer; return True if it opened the circuit."""
+        self._failure_streak += 1
+        return self._failure_streak == CIRCUIT_BREAKER_THRESHOLD
+
+    @callback
+    def record_update(self, snapshot: MinerSnapshot) -> None:
+        """Adjust the steady interval from how fast the telemetry moves."""
+        self._busy_streak = 0
+        self._failure_streak = 0
+        hashrate = snapshot.total_hashrate_ths
+        temp = snapshot.highest_chip_temp_c
+
+        if not hashrate:
+            # Paused or not hashing; nothing interesting is going to change
+            self._steady = float(MAX_POLL_INTERVAL)
+        elif self._is_moving(hashrate, temp):
+            self._steady = float(MIN_POLL_INTERVAL)
+        else:
+            self._steady = min(
+                max(self._steady, MIN_POLL_INTERVAL) * POLL_BACKOFF_FACTOR,
+                float(MAX_POLL_INTERVAL),
+            )
+
+        self._last_hashrate = hashrate
+        self._last_temp = temp
+
+    def _is_moving(self, hashrate: float, temp: float | None) -> bool:
+        """Return True if hashrate or temperature changed quickly."""
+        if not self._last_hashrate:
+            return True
+        if (
+            abs(hashrate - self._last_hashrate) / self._last_hashrate
+            >= HASHRATE_CHANGE_THRESHOLD
+        ):
+            return True
+        return (
+            temp is not None
+            and self._last_temp is not None
+            and abs(temp - self._last_temp) >= TEMPERATURE_CHANGE_THRESHOLD
+        )
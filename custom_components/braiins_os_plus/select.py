@@ -16,7 +16,11 @@ async def async_setup_entry(
     """Set up select entities for Braiins OS+ from a config entry."""
     data = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        [BraiinsPerformanceModeSelect(data["coordinator"], data["api"], entry)]
+        [
+            BraiinsPerformanceModeSelect(
+                data["coordinator"], data["api"], entry, data["commands"]
+            )
+        ]
     )
 
 
@@ -28,20 +32,28 @@ class BraiinsPerformanceModeSelect(CoordinatorEntity, SelectEntity):
     _attr_options = ["Power Target", "Hashrate Target"]
     _attr_icon = "mdi:tune"
 
-    def __init__(self, coordinator, api, entry) -> None:
+    def __init__(self, coordinator, api, entry, commands) -> None:
         """Initialize the performance mode select entity."""
         super().__init__(coordinator)
         self.api = api
+        self.commands = commands
         self._attr_unique_id = f"{entry.entry_id}_performance_mode"
         self._attr_device_info = {"identifiers": {(DOMAIN, entry.entry_id)}}
 
+    async def async_added_to_hass(self) -> None:
+        """Also write the state when a new mode is issued."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.commands.add_listener(self.async_write_ha_state))
+
     @property
     def current_option(self) -> str | None:
         """Return the currently active performance mode."""
-        return self.coordinator.data.get("performance_mode")
+        return self.commands.value("performance_mode")
 
     async def async_select_option(self, option: str) -> None:
         """Handle option selection to switch performance modes on the miner."""
+        # Let pending target presses reach the miner before switching modes
+        await self.commands.async_flush()
         data = self.coordinator.data
         if not data:
             return
@@ -50,9 +62,9 @@ class BraiinsPerformanceModeSelect(CoordinatorEntity, SelectEntity):
 
         if option == "Power Target":
             # 1. Try last known value
-            target_value = data.get("power_target") or self.api.get_cached_value(
+            target_value = self.commands.value(
                 "power_target"
-            )
+            ) or self.api.get_cached_value("power_target")
             # 2. Fallback to constraints default
             if target_value is None:
                 try:
@@ -64,9 +76,9 @@ class BraiinsPerformanceModeSelect(CoordinatorEntity, SelectEntity):
 
         else:  # Hashrate Target
             # 1. Try last known value
-            target_value = data.get("hashrate_target") or self.api.get_cached_value(
+            target_value = self.commands.value(
                 "hashrate_target"
-            )
+            ) or self.api.get_cached_value("hashrate_target")
 
             # 2. Fallback to constraints default
             if target_value is None:
@@ -77,17 +89,13 @@ class BraiinsPerformanceModeSelect(CoordinatorEntity, SelectEntity):
                 except KeyError, TypeError:
                     target_value = 100  # Last resort fallback
 
-        if await self.api.set_performance_mode(option, target_value):
-            new_data = dict(self.coordinator.data)
-            new_data["performance_mode"] = option
-
-            if option == "Power Target":
-                new_data["power_target"] = int(target_value)
-                self.api.update_last_data("power_target", int(target_value))
-            else:
-                new_data["hashrate_target"] = int(target_value)
-                self.api.update_last_data("hashrate_target", int(target_value))
-
-            # Keep both the state and the cache in sync
-            self.api.update_last_data("performance_mode", option)
-            self.coordinator.async_set_updated_data(new_data)
+        if await self.commands.async_run(
+            lambda: self.api.set_performance_mode(option, target_value)
+        ):
+            target_key = (
+                "power_target" if option == "Power Target" else "hashrate_target"
+            )
+            # Show the new mode until the next poll reports it
+            self.commands.async_set_optimistic(
+                {"performance_mode": option, target_key: int(target_value)}
+            )
@@ -2,7 +2,7 @@
 """Braiins OS+ integration sensor entities."""
 
 import logging
-from typing import Any
+import time
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -10,19 +10,71 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfPower, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfPower,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    CONF_DETAILED_TELEMETRY,
+    CONF_HASHRATE_WINDOWS,
+    CONF_HOT_CHIP_THRESHOLD,
+    DEFAULT_DETAILED_TELEMETRY,
+    DEFAULT_HASHRATE_WINDOWS,
+    DEFAULT_HOT_CHIP_THRESHOLD,
+    DOMAIN,
+    HASHRATE_WINDOWS,
+    ROLLING_WINDOWS,
+    THROTTLE_GROUPS,
+)
+from .history import MinerHistory, WindowStats
+from .metrics import SUCCESS_OUTCOMES, PipelineMetrics
+from .models import FanSnapshot, HashboardSnapshot, MinerSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
 TERAHASH_PER_SECOND = "TH/s"
 JOULE_PER_TERAHASH = "J/TH"
 
+# Metrics with rolling statistics: name, unit, device class, icon and the
+# group whose state write throttling applies
+ROLLING_METRICS = {
+    "hashrate": ("Hashrate", TERAHASH_PER_SECOND, None, "mdi:speedometer", "hashrate"),
+    "consumption": (
+        "Consumption",
+        UnitOfPower.WATT,
+        SensorDeviceClass.POWER,
+        None,
+        "power",
+    ),
+    "efficiency": ("Efficiency", JOULE_PER_TERAHASH, None, "mdi:flash", "efficiency"),
+    "chip_temp": (
+        "Chip Temp",
+        UnitOfTemperature.CELSIUS,
+        SensorDeviceClass.TEMPERATURE,
+        None,
+        "temperature",
+    ),
+    "board_temp": (
+        "Board Temp",
+        UnitOfTemperature.CELSIUS,
+        SensorDeviceClass.TEMPERATURE,
+        None,
+        "temperature",
+    ),
+}
+BOARD_ROLLING_METRICS = ("hashrate", "chip_temp", "board_temp")
+# Only the miner-wide averages over this window are enabled by default
+DEFAULT_ROLLING_WINDOW = 900
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -31,31 +83,69 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Braiins OS+ sensors from a config entry."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    history = hass.data[DOMAIN][config_entry.entry_id]["history"]
+    metrics = hass.data[DOMAIN][config_entry.entry_id]["api"].metrics
+    hashrate_windows = config_entry.options.get(
+        CONF_HASHRATE_WINDOWS, DEFAULT_HASHRATE_WINDOWS
+    )
+    _async_remove_disabled_windows(hass, config_entry, hashrate_windows)
+
+    known_boards: set[str] = set()
+    known_fans: set[int] = set()
+    last_snapshot: MinerSnapshot | None = None
+
+    @callback
+    def _async_add_new_components() -> None:
+        """Add sensors for hashboards and fans that were not seen before.
+
+        The snapshot is only rebuilt when the telemetry changed, so updates
+        that leave it alone cost a single identity check.
+        """
+        nonlocal last_snapshot
+        if not coordinator.data:
+            return
+        snapshot: MinerSnapshot = coordinator.data["snapshot"]
+        if snapshot is last_snapshot:
+            return
+        last_snapshot = snapshot
+
+        sensors = []
+        for board_id in snapshot.hashboards.keys() - known_boards:
+            known_boards.add(board_id)
+            sensors.extend(
+                [
+                    HashboardChipTempSensor(coordinator, board_id),
+                    HashboardBoardTempSensor(coordinator, board_id),
+                    HashboardHashrateSensor(coordinator, board_id),
+                ]
+            )
+            sensors.extend(
+                HashboardHashrateWindowSensor(coordinator, board_id, window)
+                for window in hashrate_windows
+            )
+            sensors.extend(
+                RollingStatSensor(coordinator, history, metric, window, board_id)
+                for metric in BOARD_ROLLING_METRICS
+                for window in ROLLING_WINDOWS
+            )
 
-    sensors = []
+        # --- Per-Fan Sensors ---
+        for fan_pos in snapshot.fans.keys() - known_fans:
+            known_fans.add(fan_pos)
+            sensors.append(MinerFanSensor(coordinator, fan_pos))
+            sensors.append(MinerFanPercentSensor(coordinator, fan_pos))
 
-    # Create sensors for each hashboard if data is available on first load
-    if coordinator.data and "hashboards" in coordinator.data:
-        for board in coordinator.data.get("hashboards", []):
-            board_id = board.get("id")
-            if board_id is not None:
-                sensors.extend(
-                    [
-                        HashboardChipTempSensor(coordinator, board_id),
-                        HashboardBoardTempSensor(coordinator, board_id),
-                        HashboardHashrateSensor(coordinator, board_id),
-                    ]
-                )
-
-    # --- Per-Fan Sensors ---
-    if coordinator.data and (cooling := coordinator.data.get("cooling")):
-        for fan in cooling.get("fans", []):
-            fan_pos = fan.get("position")
-            if fan_pos is not None:
-                sensors.append(MinerFanSensor(coordinator, fan_pos))
-                sensors.append(MinerFanPercentSensor(coordinator, fan_pos))
+        if sensors:
+            async_add_entities(sensors)
+
+    # Hashboards and fans present now, then any that show up later
+    _async_add_new_components()
+    config_entry.async_on_unload(
+        coordinator.async_add_listener(_async_add_new_components)
+    )
 
     # Create aggregate and stats sensors
+    sensors = []
     sensors.extend(
         [
             TotalHashrateSensor(coordinator),
@@ -65,12 +155,58 @@ async def async_setup_entry(
             MinerEfficiencySensor(coordinator),
         ]
     )
+    sensors.extend(
+        TotalHashrateWindowSensor(coordinator, window) for window in hashrate_windows
+    )
+    sensors.extend(
+        RollingStatSensor(coordinator, history, metric, window)
+        for metric in ROLLING_METRICS
+        for window in ROLLING_WINDOWS
+    )
+    if config_entry.options.get(CONF_DETAILED_TELEMETRY, DEFAULT_DETAILED_TELEMETRY):
+        sensors.append(HotDomainsSensor(coordinator))
+    sensors.extend(
+        [
+            UpdateDurationSensor(coordinator, metrics),
+            SlowestEndpointSensor(coordinator, metrics),
+            FailedRequestsSensor(coordinator, metrics),
+        ]
+    )
 
     async_add_entities(sensors)
 
 
+@callback
+def _async_remove_disabled_windows(
+    hass: HomeAssistant, config_entry: ConfigEntry, hashrate_windows: list[str]
+) -> None:
+    """Drop the hashrate window sensors of windows that were turned off."""
+    disabled = tuple(
+        f"_hashrate_{window}"
+        for window in HASHRATE_WINDOWS
+        if window not in hashrate_windows
+    )
+    if not disabled:
+        return
+    registry = er.async_get(hass)
+    for entity in er.async_entries_for_config_entry(registry, config_entry.entry_id):
+        if entity.domain == "sensor" and entity.unique_id.endswith(disabled):
+            registry.async_remove(entity.entity_id)
+
+
 class BraiinsSensor(CoordinatorEntity, SensorEntity):
-    """Base class for a Braiins OS+ sensor."""
+    """Base class for a Braiins OS+ sensor.
+
+    Sensors in a throttle group only write their state when the value or a
+    numeric attribute moved by more than the group's deadband, or another
+    attribute changed, and at most once per its minimum interval; a change held
+    back by the interval is written once the interval is over. Unrecorded
+    attributes, such as sample counts, are only written along with other
+    changes. Availability changes are always written right away.
+    """
+
+    # Key of THROTTLE_GROUPS, or None to write the state on every update
+    _throttle_group: str | None = None
 
     def __init__(self, coordinator, entity_suffix: str) -> None:
         """Initialize the Braiins OS+ sensor."""
@@ -78,26 +214,92 @@ class BraiinsSensor(CoordinatorEntity, SensorEntity):
         self._config_entry = coordinator.config_entry
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{self._config_entry.entry_id}_{entity_suffix}"
+        # The device itself is registered once in __init__.py
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, self._config_entry.entry_id)}
+        )
+        self._written_value = None
+        self._written_attributes = None
+        self._written_available: bool | None = None
+        self._written_at = 0.0
+        self._cancel_deferred_write = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a deferred state write."""
+        await super().async_will_remove_from_hass()
+        if self._cancel_deferred_write is not None:
+            self._cancel_deferred_write()
+            self._cancel_deferred_write = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the change is worth publishing."""
+        if self._throttle_group is None:
+            self.async_write_ha_state()
+            return
+
+        available = self.available
+        value = self.native_value if available else None
+        attributes = self.extra_state_attributes if available else None
+        if available == self._written_available:
+            deadband, min_interval = self._throttle_settings()
+            if not self._changed(value, attributes, deadband):
+                return
+            wait = self._written_at + min_interval - time.monotonic()
+            if wait > 0:
+                if self._cancel_deferred_write is None:
+                    self._cancel_deferred_write = async_call_later(
+                        self.hass, wait, self._async_deferred_write
+                    )
+                return
+
+        self._async_write_throttled(available, value, attributes)
+
+    @callback
+    def _async_deferred_write(self, _now) -> None:
+        """Write a change that was held back by the minimum interval."""
+        self._cancel_deferred_write = None
+        available = self.available
+        value = self.native_value if available else None
+        attributes = self.extra_state_attributes if available else None
+        if available != self._written_available or self._changed(
+            value, attributes, self._throttle_settings()[0]
+        ):
+            self._async_write_throttled(available, value, attributes)
+
+    def _changed(self, value, attributes, deadband: float) -> bool:
+        """Return True if the value or attributes moved from the written ones."""
+        if _moved(value, self._written_value, deadband):
+            return True
+        written = self._written_attributes
+        if attributes is None or written is None:
+            return attributes is not written
+        return any(
+            _moved(attributes.get(key), written.get(key), deadband)
+            for key in (attributes.keys() | written.keys())
+            - self._unrecorded_attributes
+        )
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for this miner."""
-
-        data = self.coordinator.data.get("details", {})
-        ident = data.get("miner_identity", {})
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._config_entry.entry_id)},
-            name=data.get("hostname")
-            or f"Braiins OS+ Miner ({self._config_entry.data['miner_ip']})",
-            manufacturer="Braiins",
-            model=ident.get("miner_model") or "Miner with Braiins OS+",
-            sw_version=data.get("bos_version", {}).get("current"),
-            hw_version=data.get("psu_info", {}).get("model_name"),
-            configuration_url=f"http://{self._config_entry.data['miner_ip']}",
-            connections={("mac", data.get("mac_address"))}
-            if data.get("mac_address")
-            else None,
+    @callback
+    def _async_write_throttled(self, available: bool, value, attributes) -> None:
+        """Write the state and remember what was written."""
+        if self._cancel_deferred_write is not None:
+            self._cancel_deferred_write()
+            self._cancel_deferred_write = None
+        self._written_available = available
+        self._written_value = value
+        self._written_attributes = attributes
+        self._written_at = time.monotonic()
+        self.async_write_ha_state()
+
+    def _throttle_settings(self) -> tuple[float, float]:
+        """Return the deadband and minimum interval set for the sensor's group."""
+        group = self._throttle_group
+        default_deadband, default_interval = THROTTLE_GROUPS[group]
+        options = self._config_entry.options
+        return (
+            options.get(f"{group}_deadband", default_deadband),
+            options.get(f"{group}_min_interval", default_interval),
         )
 
     @property
@@ -105,6 +307,18 @@ class BraiinsSensor(CoordinatorEntity, SensorEntity):
         """Return True if the coordinator has data."""
         return super().available and self.coordinator.data is not None
 
+    @property
+    def snapshot(self) -> MinerSnapshot:
+        """Return the parsed telemetry of the latest update."""
+        return self.coordinator.data["snapshot"]
+
+
+def _moved(value, written, deadband: float) -> bool:
+    """Return True if a value changed, by at least the deadband if numeric."""
+    if isinstance(value, int | float) and isinstance(written, int | float):
+        return value != written and abs(value - written) >= deadband
+    return value != written
+
 
 # --- Aggregate and Stats Sensors ---
 
@@ -112,6 +326,8 @@ class BraiinsSensor(CoordinatorEntity, SensorEntity):
 class MinerConsumptionSensor(BraiinsSensor):
     """Sensor for the miner's power consumption."""
 
+    _throttle_group = "power"
+
     def __init__(self, coordinator) -> None:
         """Initialize the miner consumption sensor."""
         super().__init__(coordinator, "miner_consumption")
@@ -123,16 +339,14 @@ class MinerConsumptionSensor(BraiinsSensor):
     @property
     def native_value(self) -> int | None:
         """Return the power consumption in Watts."""
-        stats = self.coordinator.data.get("stats", {})
-        power_stats = stats.get("power_stats", {})
-        if consumption := power_stats.get("approximated_consumption"):
-            return consumption.get("watt", 0)
-        return 0
+        return self.snapshot.consumption_w
 
 
 class MinerEfficiencySensor(BraiinsSensor):
     """Sensor for the miner's efficiency."""
 
+    _throttle_group = "efficiency"
+
     def __init__(self, coordinator) -> None:
         """Initialize the miner efficiency sensor."""
         super().__init__(coordinator, "miner_efficiency")
@@ -144,21 +358,14 @@ class MinerEfficiencySensor(BraiinsSensor):
     @property
     def native_value(self) -> float | None:
         """Return the efficiency in J/TH."""
-        stats = self.coordinator.data.get("stats", {})
-        power_stats = stats.get("power_stats", {})
-
-        efficiency_data = power_stats.get("efficiency")
-        if efficiency_data:
-            val = efficiency_data.get("joule_per_terahash")
-            if val is not None:
-                return round(float(val), 2)
-
-        return 0.0
+        return round(self.snapshot.efficiency_jth, 2)
 
 
 class TotalHashrateSensor(BraiinsSensor):
     """Sensor for the total real hashrate of all boards."""
 
+    _throttle_group = "hashrate"
+
     def __init__(self, coordinator) -> None:
         """Initialize the total hashrate sensor."""
         super().__init__(coordinator, "total_hashrate")
@@ -170,23 +377,36 @@ class TotalHashrateSensor(BraiinsSensor):
     @property
     def native_value(self) -> float | None:
         """Return the total hashrate in TH/s."""
-        if self.coordinator.data and (
-            hashboards := self.coordinator.data.get("hashboards")
-        ):
-            total_ghs = sum(
-                board.get("stats", {})
-                .get("real_hashrate", {})
-                .get("last_5s", {})
-                .get("gigahash_per_second", 0)
-                for board in hashboards
-            )
-            return round(total_ghs / 1000, 2)
-        return None
+        total = self.snapshot.total_hashrate_ths
+        return round(total, 2) if total is not None else None
+
+
+class TotalHashrateWindowSensor(BraiinsSensor):
+    """Sensor for the miner's own hashrate average over a window."""
+
+    _throttle_group = "hashrate"
+
+    def __init__(self, coordinator, window: str) -> None:
+        """Initialize the total hashrate window sensor."""
+        super().__init__(coordinator, f"total_hashrate_{window}")
+        self.window = window
+        self._attr_name = f"Total Hashrate {window}"
+        self._attr_native_unit_of_measurement = TERAHASH_PER_SECOND
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_icon = "mdi:speedometer"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the hashrate average reported by the miner in TH/s."""
+        value = self.snapshot.hashrate_windows_ths.get(self.window)
+        return round(value, 2) if value is not None else None
 
 
 class HighestChipTempSensor(BraiinsSensor):
     """Sensor for the highest chip temperature across all boards."""
 
+    _throttle_group = "temperature"
+
     def __init__(self, coordinator) -> None:
         """Initialize the highest chip temperature sensor."""
         super().__init__(coordinator, "highest_chip_temp")
@@ -198,17 +418,14 @@ class HighestChipTempSensor(BraiinsSensor):
     @property
     def native_value(self) -> float | None:
         """Return the highest chip temperature across all boards."""
-        cooling = self.coordinator.data.get("cooling", {})
-        return (
-            cooling.get("highest_temperature", {})
-            .get("temperature", {})
-            .get("degree_c")
-        )
+        return self.snapshot.highest_chip_temp_c
 
 
 class HighestBoardTempSensor(BraiinsSensor):
     """Sensor for the highest board temperature across all boards."""
 
+    _throttle_group = "temperature"
+
     def __init__(self, coordinator) -> None:
         """Initialize the highest board temperature sensor."""
         super().__init__(coordinator, "highest_board_temp")
@@ -220,22 +437,7 @@ class HighestBoardTempSensor(BraiinsSensor):
     @property
     def native_value(self) -> float | None:
         """Return the highest board temperature across all boards."""
-        if not self.coordinator.data:
-            return None
-
-        hashboards = self.coordinator.data.get("hashboards")
-        if not hashboards:
-            return None
-
-        temps = []
-        for board in hashboards:
-            # Defensive check: ensure board is not None and board_temp is not None
-            if board and (bt := board.get("board_temp")):
-                val = bt.get("degree_c")
-                if val is not None:
-                    temps.append(float(val))
-
-        return max(temps) if temps else None
+        return self.snapshot.highest_board_temp_c
 
 
 # --- Per-Hashboard Sensors ---
@@ -250,14 +452,10 @@ class HashboardSensor(BraiinsSensor):
         self.board_id = board_id
 
     @property
-    def board_data(self) -> dict[str, Any] | None:
+    def board_data(self) -> HashboardSnapshot | None:
         """Return the data for this specific hashboard."""
-        if self.coordinator.data and (
-            hashboards := self.coordinator.data.get("hashboards")
-        ):
-            for board in hashboards:
-                if board.get("id") == self.board_id:
-                    return board
+        if self.coordinator.data:
+            return self.snapshot.hashboards.get(self.board_id)
         return None
 
     @property
@@ -269,6 +467,8 @@ class HashboardSensor(BraiinsSensor):
 class HashboardChipTempSensor(HashboardSensor):
     """Sensor for a single hashboard's highest chip temperature."""
 
+    _throttle_group = "temperature"
+
     def __init__(self, coordinator, board_id: str) -> None:
         """Initialize the hashboard chip temperature sensor."""
         super().__init__(coordinator, board_id, "chip_temp")
@@ -280,15 +480,16 @@ class HashboardChipTempSensor(HashboardSensor):
     @property
     def native_value(self) -> float | None:
         """Return the highest chip temperature for this hashboard."""
-        if self.board_data and (chip_temp := self.board_data.get("highest_chip_temp")):
-            if temp := chip_temp.get("temperature"):
-                return temp.get("degree_c")
+        if board := self.board_data:
+            return board.chip_temp_c
         return None
 
 
 class HashboardBoardTempSensor(HashboardSensor):
     """Sensor for a single hashboard's board temperature."""
 
+    _throttle_group = "temperature"
+
     def __init__(self, coordinator, board_id: str) -> None:
         """Initialize the hashboard board temperature sensor."""
         super().__init__(coordinator, board_id, "board_temp")
@@ -300,14 +501,16 @@ class HashboardBoardTempSensor(HashboardSensor):
     @property
     def native_value(self) -> float | None:
         """Return the board temperature for this hashboard."""
-        if self.board_data and (board_temp := self.board_data.get("board_temp")):
-            return board_temp.get("degree_c")
+        if board := self.board_data:
+            return board.board_temp_c
         return None
 
 
 class HashboardHashrateSensor(HashboardSensor):
     """Sensor for a single hashboard's hashrate."""
 
+    _throttle_group = "hashrate"
+
     def __init__(self, coordinator, board_id: str) -> None:
         """Initialize the hashboard hashrate sensor."""
         super().__init__(coordinator, board_id, "hashrate")
@@ -319,21 +522,58 @@ class HashboardHashrateSensor(HashboardSensor):
     @property
     def native_value(self) -> float | None:
         """Return the hashrate in TH/s."""
-        if self.board_data and (stats := self.board_data.get("stats")):
-            if real_hash := stats.get("real_hashrate"):
-                if last_5s := real_hash.get("last_5s"):
-                    if (hashrate_ghs := last_5s.get("gigahash_per_second")) is not None:
-                        return round(hashrate_ghs / 1000, 2)
+        if (board := self.board_data) and board.hashrate_ths is not None:
+            return round(board.hashrate_ths, 2)
+        return None
+
+
+class HashboardHashrateWindowSensor(HashboardSensor):
+    """Sensor for a single hashboard's own hashrate average over a window."""
+
+    _throttle_group = "hashrate"
+
+    def __init__(self, coordinator, board_id: str, window: str) -> None:
+        """Initialize the hashboard hashrate window sensor."""
+        super().__init__(coordinator, board_id, f"hashrate_{window}")
+        self.window = window
+        self._attr_name = f"Hashboard {board_id} Hashrate {window}"
+        self._attr_native_unit_of_measurement = TERAHASH_PER_SECOND
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_icon = "mdi:speedometer"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the hashrate average reported by the board in TH/s."""
+        if board := self.board_data:
+            value = board.hashrate_windows_ths.get(self.window)
+            return round(value, 2) if value is not None else None
         return None
 
 
-class MinerFanSensor(BraiinsSensor):
+class FanSensor(BraiinsSensor):
+    """Base class for a sensor tied to a specific fan."""
+
+    def __init__(self, coordinator, fan_id: int, entity_suffix: str) -> None:
+        """Initialize a fan-level sensor."""
+        super().__init__(coordinator, entity_suffix)
+        self.fan_id = fan_id
+
+    @property
+    def fan_data(self) -> FanSnapshot | None:
+        """Return the data for this specific fan."""
+        if self.coordinator.data:
+            return self.snapshot.fans.get(self.fan_id)
+        return None
+
+
+class MinerFanSensor(FanSensor):
     """Sensor for an individual miner fan speed."""
 
+    _throttle_group = "fan_speed"
+
     def __init__(self, coordinator, fan_id: int) -> None:
         """Initialize the fan sensor."""
-        super().__init__(coordinator, f"fan_{fan_id}")
-        self.fan_id = fan_id
+        super().__init__(coordinator, fan_id, f"fan_{fan_id}")
         self._attr_name = f"Fan {fan_id} Speed"
         self._attr_native_unit_of_measurement = "RPM"
         self._attr_icon = "mdi:fan"
@@ -342,20 +582,16 @@ class MinerFanSensor(BraiinsSensor):
     @property
     def native_value(self) -> int | None:
         """Return the RPM of the fan."""
-        fans = self.coordinator.data.get("cooling", {}).get("fans", [])
-        for fan in fans:
-            if fan.get("position") == self.fan_id:
-                return fan.get("rpm")
-        return None
+        fan = self.fan_data
+        return fan.rpm if fan else None
 
 
-class MinerFanPercentSensor(BraiinsSensor):
+class MinerFanPercentSensor(FanSensor):
     """Sensor for an individual miner fan speed percentage."""
 
     def __init__(self, coordinator, fan_id: int) -> None:
         """Initialize the fan percentage sensor."""
-        super().__init__(coordinator, f"fan_{fan_id}_percent")
-        self.fan_id = fan_id
+        super().__init__(coordinator, fan_id, f"fan_{fan_id}_percent")
         self._attr_name = f"Fan {fan_id} Target Speed"
         self._attr_native_unit_of_measurement = "%"
         self._attr_icon = "mdi:fan-speed-1"
@@ -364,10 +600,234 @@ class MinerFanPercentSensor(BraiinsSensor):
     @property
     def native_value(self) -> float | None:
         """Return the speed percentage of the fan."""
-        fans = self.coordinator.data.get("cooling", {}).get("fans", [])
-        for fan in fans:
-            if fan.get("position") == self.fan_id:
-                ratio = fan.get("target_speed_ratio")
-                if ratio is not None:
-                    return round(float(ratio) * 100, 1)
+        fan = self.fan_data
+        if fan and fan.target_speed_ratio is not None:
+            return round(fan.target_speed_ratio * 100, 1)
         return None
+
+
+# --- Rolling Statistics Sensors ---
+
+
+class RollingStatSensor(BraiinsSensor):
+    """Rolling average of a metric, kept in memory by the integration.
+
+    The minimum, maximum and standard deviation over the same window are
+    exposed as attributes.
+    """
+
+    _unrecorded_attributes = frozenset({"samples"})
+
+    def __init__(
+        self,
+        coordinator,
+        history: MinerHistory,
+        metric: str,
+        window: int,
+        board_id: str | None = None,
+    ) -> None:
+        """Initialize the rolling statistics sensor."""
+        window_name = f"{window // 3600} h" if window >= 3600 else f"{window // 60} min"
+        prefix = f"board_{board_id}_" if board_id is not None else ""
+        super().__init__(coordinator, f"{prefix}{metric}_{window}s_mean")
+        self._history = history
+        self._metric = metric
+        self._window = window
+        self._board_id = board_id
+
+        name, unit, device_class, icon, group = ROLLING_METRICS[metric]
+        self._throttle_group = group
+        if board_id is not None:
+            name = f"Hashboard {board_id} {name}"
+        self._attr_name = f"{name} {window_name} Average"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = device_class
+        self._attr_icon = icon
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_entity_registry_enabled_default = (
+            board_id is None and window == DEFAULT_ROLLING_WINDOW
+        )
+
+    @property
+    def stats(self) -> WindowStats | None:
+        """Return the statistics over the sensor's window."""
+        return self._history.stats(self._metric, self._window, self._board_id)
+
+    @property
+    def available(self) -> bool:
+        """Return True once the window holds at least one sample."""
+        return super().available and self.stats is not None
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the mean over the window."""
+        stats = self.stats
+        return round(stats.mean, 2) if stats else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, float | int] | None:
+        """Return the minimum, maximum and standard deviation over the window."""
+        if (stats := self.stats) is None:
+            return None
+        return {
+            "min": round(stats.min, 2),
+            "max": round(stats.max, 2),
+            "stddev": round(stats.stddev, 2),
+            "samples": stats.count,
+        }
+
+
+# --- Voltage Domain Sensors ---
+
+
+class HotDomainsSensor(BraiinsSensor):
+    """Number of voltage domains whose chips run above the hot chip threshold.
+
+    The public API reports one voltage domain per hashboard, with the
+    temperature of its hottest chip.
+    """
+
+    def __init__(self, coordinator) -> None:
+        """Initialize the hot domains sensor."""
+        super().__init__(coordinator, "hot_domains")
+        self._attr_name = "Hot Domains"
+        self._attr_icon = "mdi:thermometer-alert"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def available(self) -> bool:
+        """Return True once a domain reported its chip temperature."""
+        return super().available and any(
+            board.chip_temp_c is not None for board in self.snapshot.hashboards.values()
+        )
+
+    @property
+    def native_value(self) -> int:
+        """Return how many domains are above the threshold."""
+        threshold = self._config_entry.options.get(
+            CONF_HOT_CHIP_THRESHOLD, DEFAULT_HOT_CHIP_THRESHOLD
+        )
+        return sum(
+            board.chip_temp_c is not None and board.chip_temp_c > threshold
+            for board in self.snapshot.hashboards.values()
+        )
+
+
+# --- Pipeline Diagnostic Sensors ---
+
+
+class PipelineSensor(BraiinsSensor):
+    """Base class for a disabled-by-default sensor of the polling pipeline."""
+
+    def __init__(
+        self, coordinator, metrics: PipelineMetrics, entity_suffix: str
+    ) -> None:
+        """Initialize the pipeline sensor."""
+        super().__init__(coordinator, entity_suffix)
+        self._metrics = metrics
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_entity_registry_enabled_default = False
+
+    @property
+    def available(self) -> bool:
+        """Return True; the metrics are kept even while the miner is down."""
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Write the state after every update, whether it worked or not."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._metrics.add_listener(self.async_write_ha_state))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Leave the state to the metrics listener, which sees failed updates."""
+
+
+class UpdateDurationSensor(PipelineSensor):
+    """Duration of the latest coordinator update."""
+
+    def __init__(self, coordinator, metrics: PipelineMetrics) -> None:
+        """Initialize the update duration sensor."""
+        super().__init__(coordinator, metrics, "update_duration")
+        self._attr_name = "Update Duration"
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the duration of the latest update."""
+        return self._metrics.last_update_ms
+
+    @property
+    def extra_state_attributes(self) -> dict[str, float | None]:
+        """Return the median and 95th percentile of all updates."""
+        return {
+            "p50": self._metrics.updates.percentile(0.5),
+            "p95": self._metrics.updates.percentile(0.95),
+        }
+
+
+class SlowestEndpointSensor(PipelineSensor):
+    """95th percentile request latency of the miner's slowest endpoint."""
+
+    def __init__(self, coordinator, metrics: PipelineMetrics) -> None:
+        """Initialize the slowest endpoint sensor."""
+        super().__init__(coordinator, metrics, "slowest_endpoint_latency")
+        self._attr_name = "Slowest Endpoint Latency"
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    def _latencies(self) -> dict[str, float]:
+        """Return the 95th percentile latency of every endpoint polled."""
+        return {
+            endpoint: p95
+            for endpoint, metrics in self._metrics.endpoints.items()
+            if (p95 := metrics.latency.percentile(0.95)) is not None
+        }
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the highest 95th percentile latency."""
+        latencies = self._latencies()
+        return max(latencies.values()) if latencies else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, str | dict[str, float] | None]:
+        """Return the slowest endpoint and the latency of each one."""
+        latencies = self._latencies()
+        return {
+            "endpoint": max(latencies, key=latencies.get) if latencies else None,
+            "endpoints": latencies,
+        }
+
+
+class FailedRequestsSensor(PipelineSensor):
+    """Requests that got no successful answer since the miner was set up."""
+
+    def __init__(self, coordinator, metrics: PipelineMetrics) -> None:
+        """Initialize the failed requests sensor."""
+        super().__init__(coordinator, metrics, "failed_requests")
+        self._attr_name = "Failed Requests"
+        self._attr_icon = "mdi:alert-circle-outline"
+        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def native_value(self) -> int:
+        """Return how many requests failed."""
+        return self._metrics.failed_requests
+
+    @property
+    def extra_state_attributes(self) -> dict[str, int]:
+        """Return the failures by outcome and the login counts."""
+        outcomes: dict[str, int] = {}
+        for metrics in self._metrics.endpoints.values():
+            for outcome, count in metrics.outcomes.items():
+                if outcome not in SUCCESS_OUTCOMES:
+                    outcomes[outcome] = outcomes.get(outcome, 0) + count
+        return {
+            **outcomes,
+            "relogins": self._metrics.relogins,
+            "relogin_failures": self._metrics.relogin_failures,
+        }
@@ -0,0 +1,186 @@
+# custom_components/braiins_os_plus/services.py
+"""Braiins OS+ integration services."""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+
+from .allocator import PowerBudgetAllocator, build_power_profiles
+from .commands import BraiinsCommandQueue
+from .const import BULK_COMMAND_CONCURRENCY, DOMAIN
+from .efficiency import EfficiencyCurve
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_SET_FLEET_POWER_TARGET = "set_fleet_power_target"
+SERVICE_GET_EFFICIENCY_CURVE = "get_efficiency_curve"
+
+ATTR_POWER_TARGET = "power_target"
+ATTR_POWER_BUDGET = "power_budget"
+
+SET_FLEET_POWER_TARGET_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Exclusive(ATTR_POWER_TARGET, "target"): vol.All(
+                vol.Coerce(int), vol.Range(min=1)
+            ),
+            vol.Exclusive(ATTR_POWER_BUDGET, "target"): vol.All(
+                vol.Coerce(int), vol.Range(min=1)
+            ),
+            vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_POWER_TARGET, ATTR_POWER_BUDGET),
+)
+
+GET_EFFICIENCY_CURVE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_POWER_TARGET): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def _async_set_fleet_power_target(call: ServiceCall) -> ServiceResponse:
+        """Set the power target of many miners at once."""
+        miners = _async_get_miners(hass, call.data.get(ATTR_DEVICE_ID))
+        if ATTR_POWER_TARGET in call.data:
+            targets = {entry_id: call.data[ATTR_POWER_TARGET] for entry_id in miners}
+        else:
+            profiles = build_power_profiles(
+                {
+                    entry_id: domain_data["coordinator"].data
+                    for entry_id, domain_data in miners.items()
+                },
+                {
+                    entry_id: domain_data["efficiency"]
+                    for entry_id, domain_data in miners.items()
+                },
+            )
+            targets = PowerBudgetAllocator().solve(
+                call.data[ATTR_POWER_BUDGET], profiles
+            )
+
+        semaphore = asyncio.Semaphore(BULK_COMMAND_CONCURRENCY)
+
+        async def _async_apply(entry_id: str) -> dict[str, Any]:
+            async with semaphore:
+                return await _async_set_power_target(
+                    miners[entry_id]["commands"], targets[entry_id]
+                )
+
+        start = time.monotonic()
+        reports = await asyncio.gather(
+            *(_async_apply(entry_id) for entry_id in targets)
+        )
+        results = dict(zip(targets, reports))
+        failed = [
+            entry_id for entry_id, report in results.items() if not report["success"]
+        ]
+        if failed:
+            _LOGGER.warning(
+                "Failed to set the power target of %d of %d miners",
+                len(failed),
+                len(results),
+            )
+
+        return {
+            "duration_ms": round((time.monotonic() - start) * 1000),
+            "succeeded": len(results) - len(failed),
+            "failed": len(failed),
+            "miners": results,
+        }
+
+    async def _async_get_efficiency_curve(call: ServiceCall) -> ServiceResponse:
+        """Return the learned efficiency curve of each miner."""
+        miners = _async_get_miners(hass, call.data.get(ATTR_DEVICE_ID))
+        watt = call.data.get(ATTR_POWER_TARGET)
+        results = {}
+        for entry_id, domain_data in miners.items():
+            curve: EfficiencyCurve = domain_data["efficiency"]
+            result: dict[str, Any] = {"curve": curve.as_list()}
+            if watt is not None:
+                predicted = curve.predict(watt)
+                result["predicted_hashrate_ths"] = (
+                    round(predicted, 2) if predicted is not None else None
+                )
+            results[entry_id] = result
+        return {"miners": results}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_EFFICIENCY_CURVE,
+        _async_get_efficiency_curve,
+        schema=GET_EFFICIENCY_CURVE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_FLEET_POWER_TARGET,
+        _async_set_fleet_power_target,
+        schema=SET_FLEET_POWER_TARGET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+@callback
+def _async_get_miners(
+    hass: HomeAssistant, device_ids: list[str] | None
+) -> dict[str, dict[str, Any]]:
+    """Return the loaded miners for the given devices, or all of them."""
+    loaded: dict[str, dict[str, Any]] = hass.data.get(DOMAIN, {})
+    if device_ids is None:
+        miners = dict(loaded)
+    else:
+        registry = dr.async_get(hass)
+        miners = {}
+        for device_id in device_ids:
+            device = registry.async_get(device_id)
+            entry_id = next(
+                (
+                    ident
+                    for domain, ident in (device.identifiers if device else ())
+                    if domain == DOMAIN
+                ),
+                None,
+            )
+            if entry_id not in loaded:
+                raise ServiceValidationError(
+                    f"Device {device_id} is not a loaded Braiins OS+ miner"
+                )
+            miners[entry_id] = loaded[entry_id]
+
+    if not miners:
+        raise ServiceValidationError("No Braiins OS+ miner is loaded")
+    return miners
+
+
+async def _async_set_power_target(
+    commands: BraiinsCommandQueue, watt: int
+) -> dict[str, Any]:
+    """Set one miner's power target and report how it went."""
+    start = time.monotonic()
+    success = await commands.async_set_power_target(watt)
+    return {
+        "power_target": watt,
+        "success": success,
+        "latency_ms": round((time.monotonic() - start) * 1000),
+    }
@@ -0,0 +1,197 @@
+# custom_components/braiins_os_plus/transport.py
+"""Transports used by the Braiins OS+ API client to talk to a miner."""
+
+import hashlib
+import logging
+import time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.util.json import json_loads
+
+from .const import CONNECT_TIMEOUT, MAX_POLL_INTERVAL, READ_TIMEOUT
+from .metrics import PipelineMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+# Maximum number of endpoints fetched in parallel during one update
+MAX_PARALLEL_FETCHES = 6
+
+# Polls give up on a silent miner quickly; commands and logins, which can take
+# a while to be processed, only have the connection budget
+_POLL_TIMEOUT = aiohttp.ClientTimeout(
+    total=None, sock_connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT
+)
+_SESSION_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=CONNECT_TIMEOUT)
+
+# Returned by async_get when the endpoint's payload has not changed since the
+# previous successful call
+UNCHANGED: Any = object()
+
+
+class BraiinsTransportError(Exception):
+    """Base error raised by a transport."""
+
+
+class BraiinsAuthError(BraiinsTransportError):
+    """The miner rejected the token."""
+
+
+class BraiinsConnectionError(BraiinsTransportError):
+    """The miner could not be reached."""
+
+
+class BraiinsBusyError(BraiinsTransportError):
+    """The miner cannot answer right now, usually because it is reconfiguring."""
+
+
+class BraiinsCommandError(BraiinsTransportError):
+    """The miner refused to process a command."""
+
+
+class BraiinsTransport:
+    """Base class for a way of reaching the Braiins OS+ public API.
+
+    A transport only moves requests and responses; token handling, retries and
+    merging the responses into the coordinator data stay in BraiinsAPI, so every
+    transport produces the same data shape for the platforms.
+    """
+
+    name: str
+
+    # Set by the API client to collect status codes, body sizes and decode time
+    metrics: PipelineMetrics | None = None
+
+    async def async_login(self, username: str, password: str) -> dict[str, Any]:
+        """Log in and return the payload holding ``token`` and ``timeout_s``."""
+        raise NotImplementedError
+
+    async def async_get(self, endpoint: str, token: str) -> dict[str, Any]:
+        """Fetch an endpoint and return its decoded payload, or UNCHANGED."""
+        raise NotImplementedError
+
+    async def async_send(
+        self, method: str, endpoint: str, token: str, data: dict | None = None
+    ) -> None:
+        """Send a command to an endpoint."""
+        raise NotImplementedError
+
+    async def async_close(self) -> None:
+        """Release the resources held by the transport."""
+
+
+def create_miner_session() -> aiohttp.ClientSession:
+    """Create a client session with a connector tuned for polling one miner.
+
+    Connections are capped at one per parallel endpoint fetch and kept alive
+    for two of the slowest adaptive poll intervals. Every tick then reuses them
+    instead of doing a fresh TCP handshake, including the extra connection
+    only needed when a tiered endpoint such as the performance mode is due.
+    Miners are addressed by IP, so DNS caching is off. An unreachable miner
+    fails after CONNECT_TIMEOUT instead of the default.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=MAX_PARALLEL_FETCHES,
+        limit_per_host=MAX_PARALLEL_FETCHES,
+        keepalive_timeout=MAX_POLL_INTERVAL * 2,
+        use_dns_cache=False,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=_SESSION_TIMEOUT)
+
+
+class RestTransport(BraiinsTransport):
+    """Transport for the JSON REST gateway under ``/api/v1``."""
+
+    name = "rest"
+
+    def __init__(self, host: str, session: aiohttp.ClientSession) -> None:
+        """Initialize the REST transport."""
+        self._session = session
+        self._base_url = f"http://{host}/api/v1"
+        self._etags: dict[str, str] = {}
+        self._digests: dict[str, bytes] = {}
+
+    async def async_login(self, username: str, password: str) -> dict[str, Any]:
+        """Log in and return the payload holding ``token`` and ``timeout_s``."""
+        url = f"{self._base_url}/auth/login"
+        payload = {"username": username, "password": password}
+        async with self._session.post(url, json=payload) as response:
+            if response.status == 401:
+                raise BraiinsAuthError(url)
+            response.raise_for_status()
+            return await response.json()
+
+    async def async_get(self, endpoint: str, token: str) -> dict[str, Any]:
+        """Fetch an endpoint and return its decoded payload, or UNCHANGED.
+
+        The ETag is sent back as If-None-Match when the miner provides one.
+        Otherwise the raw body is hashed, and an identical body is reported as
+        UNCHANGED without being decoded again.
+        """
+        url = f"{self._base_url}/{endpoint}"
+        headers = {"Authorization": token}
+        if etag := self._etags.get(endpoint):
+            headers["If-None-Match"] = etag
+
+        _LOGGER.debug("Sending GET request to %s", url)
+        async with self._session.get(
+            url, headers=headers, timeout=_POLL_TIMEOUT
+        ) as response:
+            if self.metrics is not None:
+                self.metrics.record_outcome(endpoint, response.status)
+            if response.status == 304:
+                return UNCHANGED
+            if response.status == 401:
+                raise BraiinsAuthError(url)
+            if response.status == 500:
+                raise BraiinsBusyError(url)
+            response.raise_for_status()
+            body = await response.read()
+            if etag := response.headers.get("ETag"):
+                self._etags[endpoint] = etag
+
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if self.metrics is not None:
+            self.metrics.record_body(endpoint, len(body))
+        if self._digests.get(endpoint) == digest:
+            return UNCHANGED
+        start = time.perf_counter()
+        payload = json_loads(body)
+        if self.metrics is not None:
+            self.metrics.record_decode(endpoint, time.perf_counter() - start)
+        self._digests[endpoint] = digest
+        return payload
+
+    async def async_send(
+        self, method: str, endpoint: str, token: str, data: dict | None = None
+    ) -> None:
+        """Send a command to an endpoint."""
+        url = f"{self._base_url}/{endpoint}"
+        _LOGGER.debug(
+            "Sending %s request to %s with data: %s", method.upper(), url, data
+        )
+        async with self._session.request(
+            method, url, headers={"Authorization": token}, json=data
+        ) as response:
+            if response.status == 401:
+                raise BraiinsAuthError(url)
+            if response.status == 422:
+                raise BraiinsCommandError(await response.text())
+            response.raise_for_status()
+
+    async def async_close(self) -> None:
+        """Close the HTTP session."""
+        await self._session.close()
+
+
+def create_transport(kind: str, host: str) -> BraiinsTransport:
+    """Create the transport selected for a config entry."""
+    if kind == RestTransport.name:
+        return RestTransport(host, create_miner_session())
+    if kind == "grpc":
+        # Only load gRPC and protobuf for miners that use them
+        from .grpc_transport import GrpcTransport
+
+        return GrpcTransport(host)
+    raise ValueError(f"Unknown Braiins OS+ transport: {kind}")
@@ -0,0 +1 @@
+"""Tests for the Braiins OS+ integration."""
@@ -0,0 +1,55 @@
+"""Tests for the Braiins OS+ power budget allocator."""
+
+from custom_components.braiins_os_plus.allocator import (
+    MinerPowerProfile,
+    PowerBudgetAllocator,
+)
+
+
+def _profile(
+    miner_id: str, efficiency: float, min_w: float = 1000, max_w: float = 4000
+) -> MinerPowerProfile:
+    """Return a miner whose hashrate rises slower than its power."""
+    return MinerPowerProfile(
+        miner_id=miner_id,
+        min_w=min_w,
+        max_w=max_w,
+        efficiency_jth=efficiency,
+        curve=tuple(
+            (watt, 3000 / efficiency * (watt / 3000) ** 0.8)
+            for watt in range(1000, 4001, 500)
+        ),
+    )
+
+
+def _hashrate(targets: dict[str, int], profiles: list[MinerPowerProfile]) -> float:
+    return sum(profile.hashrate_at(targets[profile.miner_id]) for profile in profiles)
+
+
+def test_resolve_after_efficiency_change_matches_fresh_solve() -> None:
+    """Test a re-solve with new efficiencies keeps the allocation optimal."""
+    allocator = PowerBudgetAllocator()
+    before = [_profile("a", 20), _profile("b", 25), _profile("c", 30)]
+    allocator.solve(7500, before)
+
+    after = [_profile("a", 30), _profile("b", 25), _profile("c", 20)]
+    targets = allocator.solve(7500, after)
+    fresh = PowerBudgetAllocator().solve(7500, after)
+
+    assert sum(targets.values()) == 7500
+    assert _hashrate(targets, after) >= _hashrate(fresh, after) - 1e-6
+    assert targets["c"] > targets["a"]
+
+
+def test_new_limits_are_respected() -> None:
+    """Test miners are kept within limits that changed since the last solve."""
+    allocator = PowerBudgetAllocator()
+    allocator.solve(7000, [_profile("a", 20), _profile("b", 25)])
+
+    targets = allocator.solve(
+        7000, [_profile("a", 20, max_w=2500), _profile("b", 25), _profile("c", 30)]
+    )
+
+    assert targets["a"] <= 2500
+    assert all(watt >= 1000 for watt in targets.values())
+    assert sum(targets.values()) == 7000
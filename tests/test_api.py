@@ -0,0 +1,217 @@
+"""Tests for the Braiins OS+ API client."""
+
+import asyncio
+from collections.abc import AsyncIterator
+import contextlib
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.braiins_os_plus.api import BraiinsAPI
+from custom_components.braiins_os_plus.const import (
+    CIRCUIT_BREAKER_THRESHOLD,
+    DEFAULT_TOKEN_LIFETIME,
+    DOMAIN,
+    TOKEN_REFRESH_JITTER,
+)
+from custom_components.braiins_os_plus.transport import (
+    BraiinsAuthError,
+    BraiinsBusyError,
+    BraiinsTransport,
+)
+
+PAYLOADS = {
+    "miner/details": {"uid": "fake", "hostname": "fake"},
+    "configuration/constraints": {"tuner_constraints": {}},
+    "performance/mode": {"tunermode": {"target": {}}},
+    "miner/hw/hashboards": {"hashboards": [{"id": "1"}]},
+    "miner/stats": {"power_stats": {}},
+    "cooling/state": {"fans": []},
+}
+
+
+class FakeTransport(BraiinsTransport):
+    """Transport whose logins wait until the test lets them finish.
+
+    Requests raise ``error`` instead of answering while it is set.
+    """
+
+    name = "fake"
+
+    def __init__(self) -> None:
+        """Initialize the transport."""
+        self.logins = 0
+        self.login_gate = asyncio.Event()
+        self.login_gate.set()
+        self.token: str | None = None
+        self.error: Exception | None = None
+
+    async def async_login(self, username: str, password: str) -> dict[str, Any]:
+        """Hand out a new token once the gate is open."""
+        self.logins += 1
+        await self.login_gate.wait()
+        self.token = f"token{self.logins}"
+        return {"token": self.token, "timeout_s": 3600}
+
+    async def async_get(self, endpoint: str, token: str) -> dict[str, Any]:
+        """Return the endpoint's payload, or reject an outdated token."""
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        if token != self.token:
+            raise BraiinsAuthError(endpoint)
+        return PAYLOADS[endpoint]
+
+
+def _create_api(hass: HomeAssistant, expires_at: float) -> BraiinsAPI:
+    """Return an API client holding a token the miner no longer accepts."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "miner_ip": "127.0.0.1",
+            "username": "root",
+            "password": "",
+            "token": "revoked",
+            "expires_at": expires_at,
+        },
+    )
+    entry.add_to_hass(hass)
+    return BraiinsAPI(hass, entry, FakeTransport())
+
+
+@pytest.fixture
+async def api(hass: HomeAssistant) -> AsyncIterator[BraiinsAPI]:
+    """Return an API client whose token has not expired by its clock."""
+    api = _create_api(hass, 4102444800)
+    yield api
+    await api.async_close()
+
+
+async def test_concurrent_renewals_share_one_login(api: BraiinsAPI) -> None:
+    """Test callers renewing at the same time wait for the same login."""
+    transport: FakeTransport = api._transport
+    transport.login_gate.clear()
+
+    callers = [asyncio.create_task(api.async_renew_token()) for _ in range(5)]
+    await asyncio.sleep(0)
+    transport.login_gate.set()
+
+    assert await asyncio.gather(*callers) == [True] * 5
+    assert transport.logins == 1
+
+
+async def test_cancelled_caller_does_not_abort_renewal(api: BraiinsAPI) -> None:
+    """Test the shared login survives one of its callers being cancelled."""
+    transport: FakeTransport = api._transport
+    transport.login_gate.clear()
+
+    cancelled = asyncio.create_task(api.async_renew_token())
+    waiting = asyncio.create_task(api.async_renew_token())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    transport.login_gate.set()
+
+    assert await waiting
+    assert cancelled.cancelled()
+    assert transport.logins == 1
+
+
+async def test_stale_rejection_uses_the_new_token(api: BraiinsAPI) -> None:
+    """Test a 401 for a token that was already replaced does not log in again."""
+    transport: FakeTransport = api._transport
+    assert await api.async_renew_token("revoked")
+    assert transport.logins == 1
+
+    assert await api.async_renew_token("revoked")
+    assert transport.logins == 1
+
+
+async def test_update_after_revocation_logs_in_once(api: BraiinsAPI) -> None:
+    """Test every endpoint rejected at once retries after a single login."""
+    transport: FakeTransport = api._transport
+
+    data = await api.async_update_data()
+
+    assert transport.logins == 1
+    assert data["details"] == PAYLOADS["miner/details"]
+    assert data["hashboards"] == [{"id": "1"}]
+    assert api.metrics.relogins == 1
+
+
+async def test_stale_tokens_are_renewed_spread_out(hass: HomeAssistant) -> None:
+    """Test miners whose tokens went stale do not all log in at once."""
+    delays = []
+    for _ in range(20):
+        api = _create_api(hass, 0)
+        api.async_start_token_refresh()
+        delays.append(api._refresh_timer.when() - hass.loop.time())
+        assert api._transport.logins == 0
+        await api.async_close()
+
+    assert all(
+        0 <= delay <= TOKEN_REFRESH_JITTER * DEFAULT_TOKEN_LIFETIME for delay in delays
+    )
+    assert len({round(delay) for delay in delays}) > 1
+
+
+async def test_failed_update_notifies_metrics_listeners(api: BraiinsAPI) -> None:
+    """Test the pipeline metrics listeners hear about failed updates too."""
+    transport: FakeTransport = api._transport
+    transport.error = TimeoutError()
+    updates = []
+    api.metrics.add_listener(lambda: updates.append(api.metrics.last_update_ms))
+
+    with pytest.raises(UpdateFailed):
+        await api.async_update_data()
+
+    assert len(updates) == 1
+    assert updates[0] is not None
+
+
+async def test_unreachable_miner_opens_the_circuit(api: BraiinsAPI) -> None:
+    """Test the cached data is kept until the circuit opens on timeouts."""
+    transport: FakeTransport = api._transport
+    data = await api.async_update_data()
+    transport.error = TimeoutError()
+
+    for _ in range(CIRCUIT_BREAKER_THRESHOLD - 1):
+        assert await api.async_update_data() is data
+    with pytest.raises(UpdateFailed):
+        await api.async_update_data()
+
+    assert api.poll_policy.circuit_open
+
+
+async def test_reconfiguring_miner_does_not_open_the_circuit(api: BraiinsAPI) -> None:
+    """Test 500s keep the cached data without counting as failed polls."""
+    transport: FakeTransport = api._transport
+    data = await api.async_update_data()
+    transport.error = BraiinsBusyError("miner/stats")
+
+    for _ in range(CIRCUIT_BREAKER_THRESHOLD + 1):
+        assert await api.async_update_data() is data
+
+    assert not api.poll_policy.circuit_open
+
+
+async def test_busy_probe_closes_the_circuit(api: BraiinsAPI) -> None:
+    """Test a miner answering the probe with 500 is polled again."""
+    transport: FakeTransport = api._transport
+    data = await api.async_update_data()
+    transport.error = TimeoutError()
+    for _ in range(CIRCUIT_BREAKER_THRESHOLD):
+        with contextlib.suppress(UpdateFailed):
+            await api.async_update_data()
+    assert api.poll_policy.circuit_open
+
+    transport.error = BraiinsBusyError("miner/details")
+    assert await api.async_update_data() is data
+    assert not api.poll_policy.circuit_open
+
+    transport.error = None
+    assert (await api.async_update_data())["details"] == PAYLOADS["miner/details"]
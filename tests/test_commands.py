@@ -0,0 +1,174 @@
+"""Tests for the Braiins OS+ command queue."""
+
+from collections.abc import AsyncIterator
+import logging
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from custom_components.braiins_os_plus.api import BraiinsAPI
+from custom_components.braiins_os_plus.commands import BraiinsCommandQueue
+from custom_components.braiins_os_plus.const import DOMAIN
+from custom_components.braiins_os_plus.transport import (
+    BraiinsCommandError,
+    BraiinsTransport,
+)
+
+DATA = {
+    "performance_mode": "Power Target",
+    "power_target": 3000,
+    "constraints": {
+        "tuner_constraints": {
+            "power_target": {"min": {"watt": 1000}, "max": {"watt": 3200}},
+        }
+    },
+}
+
+
+class FakeTransport(BraiinsTransport):
+    """Transport that records the commands it is sent.
+
+    Commands raise ``error`` instead of succeeding while it is set.
+    """
+
+    name = "fake"
+
+    def __init__(self) -> None:
+        """Initialize the transport."""
+        self.sent: list[tuple[str, dict | None]] = []
+        self.error: Exception | None = None
+
+    async def async_send(
+        self, method: str, endpoint: str, token: str, data: dict | None = None
+    ) -> None:
+        """Record the command, or refuse it."""
+        if self.error is not None:
+            raise self.error
+        self.sent.append((endpoint, data))
+
+
+@pytest.fixture
+async def transport() -> FakeTransport:
+    """Return the transport the queue sends through."""
+    return FakeTransport()
+
+
+@pytest.fixture
+async def api(
+    hass: HomeAssistant, transport: FakeTransport
+) -> AsyncIterator[BraiinsAPI]:
+    """Return an API client holding a valid token."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "miner_ip": "127.0.0.1",
+            "username": "root",
+            "password": "",
+            "token": "token",
+            "expires_at": 4102444800,
+        },
+    )
+    entry.add_to_hass(hass)
+    api = BraiinsAPI(hass, entry, transport)
+    yield api
+    await api.async_close()
+
+
+@pytest.fixture
+async def coordinator(hass: HomeAssistant) -> DataUpdateCoordinator:
+    """Return a coordinator for a miner in Power Target mode at 3000 W."""
+    coordinator = DataUpdateCoordinator(
+        hass, logging.getLogger(__name__), name="test", config_entry=None
+    )
+    coordinator.async_set_updated_data(dict(DATA))
+    return coordinator
+
+
+@pytest.fixture
+async def queue(
+    hass: HomeAssistant, api: BraiinsAPI, coordinator: DataUpdateCoordinator
+) -> BraiinsCommandQueue:
+    """Return the miner's command queue, following its polls."""
+    queue = BraiinsCommandQueue(hass, api, coordinator)
+    coordinator.async_add_listener(queue.async_handle_coordinator_update)
+    return queue
+
+
+def _power_targets(transport: FakeTransport) -> list[Any]:
+    """Return the absolute power targets sent, in order."""
+    return [
+        data["watt"]
+        for endpoint, data in transport.sent
+        if endpoint == "performance/power-target"
+    ]
+
+
+async def test_presses_in_the_window_are_merged(
+    queue: BraiinsCommandQueue, transport: FakeTransport
+) -> None:
+    """Test quick presses are shown at once and sent as one net target."""
+    queue.async_adjust("power_target", 100)
+    queue.async_adjust("power_target", 100)
+    queue.async_adjust("power_target", -50)
+    assert queue.value("power_target") == 3150
+    assert transport.sent == []
+
+    await queue.async_flush()
+    assert _power_targets(transport) == [3150]
+
+
+async def test_absolute_target_replaces_pending_adjustment(
+    queue: BraiinsCommandQueue, transport: FakeTransport
+) -> None:
+    """Test an absolute target cancels the adjustment it makes obsolete."""
+    queue.async_adjust("power_target", 100)
+    assert await queue.async_set_power_target(2500)
+    await queue.async_flush()
+
+    assert _power_targets(transport) == [2500]
+    assert queue.value("power_target") == 2500
+
+
+async def test_adjustments_are_clamped_to_the_constraints(
+    queue: BraiinsCommandQueue, transport: FakeTransport
+) -> None:
+    """Test presses past the miner's limits stop at the limit."""
+    for _ in range(5):
+        queue.async_adjust("power_target", 100)
+    assert queue.value("power_target") == 3200
+
+    await queue.async_flush()
+    assert _power_targets(transport) == [3200]
+
+
+async def test_refused_command_reverts_the_shown_value(
+    queue: BraiinsCommandQueue, transport: FakeTransport
+) -> None:
+    """Test the miner's own value is shown again when a command is refused."""
+    transport.error = BraiinsCommandError("refused")
+    queue.async_adjust("power_target", 100)
+    assert queue.value("power_target") == 3100
+
+    await queue.async_flush()
+    assert queue.value("power_target") == 3000
+
+
+async def test_shown_values_stay_out_of_the_coordinator_data(
+    queue: BraiinsCommandQueue, coordinator: DataUpdateCoordinator
+) -> None:
+    """Test issued values are shown until a poll reports on them."""
+    assert await queue.async_set_power_target(2500)
+    assert coordinator.data["power_target"] == 3000
+
+    # A poll that started before the command still reports the old target
+    coordinator.async_set_updated_data({**DATA, "hashrate": 1})
+    assert queue.value("power_target") == 2500
+
+    coordinator.async_set_updated_data({**DATA, "power_target": 2500})
+    assert queue.value("power_target") == 2500
+    coordinator.async_set_updated_data({**DATA, "power_target": 2400})
+    assert queue.value("power_target") == 2400
@@ -0,0 +1,58 @@
+"""Tests for the Braiins OS+ sensors."""
+
+import logging
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from custom_components.braiins_os_plus.const import DOMAIN
+from custom_components.braiins_os_plus.history import WindowStats
+from custom_components.braiins_os_plus.sensor import RollingStatSensor
+
+
+class FakeHistory:
+    """History whose statistics the test sets."""
+
+    def __init__(self) -> None:
+        """Initialize the history."""
+        self.window_stats: WindowStats | None = None
+
+    def stats(
+        self, metric: str, window: int, board_id: str | None = None
+    ) -> WindowStats | None:
+        """Return the statistics set by the test."""
+        return self.window_stats
+
+
+async def test_rolling_sensor_with_steady_mean_does_not_write(
+    hass: HomeAssistant,
+) -> None:
+    """Test sample counts and small spread changes don't write the state."""
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    coordinator = DataUpdateCoordinator(
+        hass, logging.getLogger(__name__), name="test", config_entry=entry
+    )
+    coordinator.async_set_updated_data({})
+    history = FakeHistory()
+    sensor = RollingStatSensor(coordinator, history, "hashrate", 900)
+    sensor.hass = hass
+    writes = []
+    sensor.async_write_ha_state = lambda: writes.append(sensor.extra_state_attributes)
+
+    history.window_stats = WindowStats(100.0, 99.0, 101.0, 0.5, 10)
+    sensor._handle_coordinator_update()
+    assert len(writes) == 1
+
+    # Hashrate deadband is 0.5 TH/s
+    for count in range(11, 20):
+        history.window_stats = WindowStats(100.1, 99.0, 101.2, 0.51, count)
+        sensor._handle_coordinator_update()
+    assert len(writes) == 1
+
+    history.window_stats = WindowStats(100.2, 98.4, 101.2, 0.6, 20)
+    sensor._handle_coordinator_update()
+    assert len(writes) == 2
+    assert writes[-1]["min"] == 98.4
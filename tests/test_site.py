@@ -0,0 +1,57 @@
+"""Tests for the Braiins OS+ site power budget entry."""
+
+from homeassistant import config_entries
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.braiins_os_plus.const import (
+    CONF_ENTRY_TYPE,
+    CONF_POWER_BUDGET_ENTITY,
+    DATA_SITE_CONTROLLER,
+    DOMAIN,
+    ENTRY_TYPE_SITE,
+)
+
+BUDGET_ENTITY = "input_number.mining_power_budget"
+
+
+async def _async_add_site(hass: HomeAssistant) -> dict:
+    """Run the config flow's site step and return its result."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    assert result["type"] is FlowResultType.MENU
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "site"}
+    )
+    if result["type"] is not FlowResultType.FORM:
+        return result
+    return await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_POWER_BUDGET_ENTITY: BUDGET_ENTITY}
+    )
+
+
+async def test_site_entry_runs_the_controller(hass: HomeAssistant) -> None:
+    """Test the controller follows the site entry's lifecycle."""
+    result = await _async_add_site(hass)
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"] == {CONF_ENTRY_TYPE: ENTRY_TYPE_SITE}
+    entry = result["result"]
+    assert entry.state is ConfigEntryState.LOADED
+    assert hass.data[DATA_SITE_CONTROLLER]._entity_id == BUDGET_ENTITY
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert DATA_SITE_CONTROLLER not in hass.data
+
+
+async def test_site_entry_is_set_up_once(hass: HomeAssistant) -> None:
+    """Test a second site entry is refused."""
+    await _async_add_site(hass)
+    await hass.async_block_till_done()
+
+    result = await _async_add_site(hass)
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "site_already_configured"